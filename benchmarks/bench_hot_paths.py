@@ -0,0 +1,186 @@
+"""
+Season-scale benchmarks for the hot paths
+
+- Generates (or reuses) synthetic nflverse-shaped data so no download is needed
+- Times load_games_index, compute_box_score, the mapper (dict rows vs typed rows) and run_batch (mock LLM)
+- Records wall time, throughput and tracemalloc peak per benchmark as JSON
+
+Usage:
+    python benchmarks/bench_hot_paths.py --games 272 --plays 170
+    python benchmarks/bench_hot_paths.py --compare benchmarks/results/<previous>.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def measure(name: str, fn: Callable[[], int], repeat: int) -> dict[str, Any]:
+    """
+    Run fn `repeat` times; fn returns the number of items processed (rows/games/plays).
+    Wall time is the best of `repeat`; memory is the tracemalloc peak of one extra traced run.
+    """
+    times = []
+    items = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        items = fn()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(times)
+    result = {
+        "name": name,
+        "items": items,
+        "best_seconds": best,
+        "mean_seconds": sum(times) / len(times),
+        "items_per_second": items / best if best > 0 else 0.0,
+        "peak_mib": peak / (1024 * 1024),
+    }
+    print(
+        f"{name:<24} {best * 1000:10.1f} ms  {result['items_per_second']:12.0f} items/s  "
+        f"{result['peak_mib']:8.1f} MiB peak"
+    )
+    return result
+
+
+def build_benchmarks(raw_path: Path, work_dir: Path, batch_rows: int) -> dict[str, Callable[[], int]]:
+    import pandas as pd
+
+    from playcall_intel.batch_normalize import run_batch
+    from playcall_intel.columns import read_pbp
+    from playcall_intel.game_index import GameIndexConfig, load_games_index
+    from playcall_intel.game_report import compute_box_score
+    from playcall_intel.loader import iter_pbp_rows_gz, iter_typed_rows_gz
+    from playcall_intel.mapper import is_scrimmage_play, row_to_play_first_pass
+
+    first_game = next(iter_pbp_rows_gz(raw_path))["game_id"]
+
+    def bench_read_csv() -> int:
+        return len(pd.read_csv(raw_path, compression="gzip", low_memory=False))
+
+    def bench_read_projected() -> int:
+        return len(read_pbp(raw_path, "report"))
+
+    def bench_games_index() -> int:
+        # use_cache=False: measure the parse, not the sidecar hit
+        return len(load_games_index(GameIndexConfig(raw_path=raw_path, use_cache=False)))
+
+    def bench_box_score() -> int:
+        compute_box_score(first_game, raw_path)
+        return 1
+
+    def bench_mapper() -> int:
+        n = 0
+        for row in iter_pbp_rows_gz(raw_path):
+            if is_scrimmage_play(row):
+                row_to_play_first_pass(row)
+            n += 1
+        return n
+
+    def bench_typed_stream() -> int:
+        # Same scrimmage test as mapper_stream, on typed tuples instead of DictReader dicts
+        spec = {"posteam": "str", "down": "int", "ydstogo": "int", "yards_gained": "int", "pass": "flag"}
+        n = 0
+        for posteam, down, ydstogo, _, _ in iter_typed_rows_gz(raw_path, spec):
+            if posteam and down is not None and ydstogo is not None:
+                pass
+            n += 1
+        return n
+
+    def bench_run_batch() -> int:
+        m = run_batch(sample_size=batch_rows, raw_path=raw_path, out_path=work_dir / "normalized_bench.csv")
+        return m.counters.get("rows_seen", 0)
+
+    return {
+        "read_csv": bench_read_csv,
+        "read_pbp_report_cols": bench_read_projected,
+        "load_games_index": bench_games_index,
+        "compute_box_score": bench_box_score,
+        "mapper_stream": bench_mapper,
+        "typed_stream": bench_typed_stream,
+        "run_batch_mock": bench_run_batch,
+    }
+
+
+def compare(current: list[dict[str, Any]], baseline_path: Path) -> None:
+    baseline = {b["name"]: b for b in json.loads(baseline_path.read_text())["results"]}
+    print(f"\nvs {baseline_path}")
+    for r in current:
+        b = baseline.get(r["name"])
+        if not b:
+            continue
+        dt = r["best_seconds"] / b["best_seconds"] - 1 if b["best_seconds"] else 0.0
+        dm = r["peak_mib"] - b["peak_mib"]
+        print(f"{r['name']:<24} time {dt:+7.1%}   peak {dm:+8.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Playcall-Intel hot paths on synthetic data")
+    parser.add_argument("--games", type=int, default=272)
+    parser.add_argument("--plays", type=int, default=170)
+    parser.add_argument("--variant", action="append", default=[], help="Synthetic schema variant (repeatable)")
+    parser.add_argument("--batch-rows", type=int, default=2000, help="Rows fed to run_batch")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="Run only these benchmarks")
+    parser.add_argument("--work-dir", type=Path, default=Path("data/bench"))
+    parser.add_argument("--compare", type=Path, help="Previous results JSON to diff against")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LLM_PROVIDER", "mock")
+
+    cfg = SyntheticConfig(
+        games_per_season=args.games,
+        plays_per_game=args.plays,
+        variants=frozenset(args.variant),
+    )
+    variant_tag = "-".join(sorted(cfg.variants)) or "base"
+    raw_path = args.work_dir / f"play_by_play_{cfg.seasons[0]}_{args.games}g_{args.plays}p_{variant_tag}.csv.gz"
+    if not raw_path.exists():
+        print(f"Generating {raw_path} ...")
+        write_synthetic_season(raw_path, cfg.seasons[0], cfg)
+
+    benches = build_benchmarks(raw_path, args.work_dir, args.batch_rows)
+    selected = args.only or list(benches)
+
+    results = [measure(name, benches[name], args.repeat) for name in selected]
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    out = RESULTS_DIR / f"hot_paths-{stamp}.json"
+    out.write_text(
+        json.dumps(
+            {
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "config": {"games": args.games, "plays": args.plays, "variants": sorted(cfg.variants)},
+                "results": results,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"\nWrote {out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
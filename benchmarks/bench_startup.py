@@ -0,0 +1,83 @@
+"""
+CLI startup-time benchmark
+
+- Times fresh `python -m playcall_intel ...` processes (what a user actually waits for)
+- Reports which heavy modules each command imported (pandas, pydantic, dotenv, ...)
+- `--max-ms` turns it into a regression guard (non-zero exit when the median is slower)
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --max-ms 150
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ["pandas", "numpy", "pydantic", "dotenv", "streamlit", "playcall_intel.game_report"]
+
+COMMANDS = {
+    "help": ["--help"],
+    "report_help": ["report", "--help"],
+    "games_help": ["games", "--help"],
+}
+
+_PROBE = """
+import sys
+sys.argv = ["playcall_intel", *{argv!r}]
+from playcall_intel.__main__ import main
+try:
+    main()
+except SystemExit:
+    pass
+print("\\n__HEAVY__", ",".join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)
+"""
+
+
+def time_command(argv: list[str], runs: int) -> tuple[float, list[str]]:
+    samples = []
+    heavy: list[str] = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(argv=argv, heavy=HEAVY_MODULES)],
+            capture_output=True,
+            text=True,
+        )
+        samples.append((time.perf_counter() - t0) * 1000)
+        marker = [l for l in proc.stderr.splitlines() if l.startswith("__HEAVY__")]
+        heavy = marker[-1].split(" ", 1)[1].split(",") if marker and " " in marker[-1] else []
+    return statistics.median(samples), [h for h in heavy if h]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if any command's median exceeds this")
+    args = parser.parse_args()
+
+    time_command(["--help"], 1)  # warm the filesystem / bytecode caches
+
+    t0 = time.perf_counter()
+    for _ in range(args.runs):
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+    print(f"{'interpreter':<14} {(time.perf_counter() - t0) * 1000 / args.runs:8.1f} ms   (bare python startup)")
+
+    failed = False
+    for name, argv in COMMANDS.items():
+        median_ms, heavy = time_command(argv, args.runs)
+        flag = ""
+        if args.max_ms is not None and median_ms > args.max_ms:
+            flag = "  << over budget"
+            failed = True
+        print(f"{name:<14} {median_ms:8.1f} ms   heavy imports: {', '.join(heavy) or '-'}{flag}")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,310 @@
 from __future__ import annotations
 import argparse
-import os
+from pathlib import Path
 
-from playcall_intel.game_report import write_game_report
+# Keep this module import-light: pandas / pydantic / the LLM stack are imported inside the
+# command handlers, so `--help`, cached index listings and report cache hits stay fast.
 
+DEFAULT_RAW_PATH = Path("data/raw/play_by_play_2025.csv.gz")
+DEFAULT_REPORT_DIR = Path("reports/games")
 
-def main():
-    parser = argparse.ArgumentParser(description="Playcall-Intel CLI")
-    parser.add_argument("--game-id", help="Generate a game report for this game_id")
 
-    args = parser.parse_args()
+def _report_is_current(report_path: Path, raw_path: Path) -> bool:
+    return (
+        report_path.exists()
+        and raw_path.exists()
+        and report_path.stat().st_mtime_ns >= raw_path.stat().st_mtime_ns
+    )
 
-    if args.game_id:
-        path = write_game_report(args.game_id)
-        print(f"Wrote {path}")
+
+def _selected_seasons(args: argparse.Namespace):
+    if getattr(args, "all_seasons", False):
+        return "all"
+    return tuple(args.season) if getattr(args, "season", None) else None
+
+
+def _season_raw_paths(args: argparse.Namespace) -> list[Path]:
+    from playcall_intel.dataset import discover_seasons
+
+    seasons = _selected_seasons(args)
+    if seasons is None:
+        return [args.raw]
+    found = discover_seasons(args.raw.parent)
+    wanted = found if seasons == "all" else {s: found[s] for s in seasons if s in found}
+    return list(wanted.values())
+
+
+def cmd_report(args: argparse.Namespace) -> None:
+    from playcall_intel.dataset import season_path_for_game
+
+    out_path = args.out_dir / f"{args.game_id}.md"
+    raw_path = season_path_for_game(args.game_id, args.raw)
+    wants_instrumentation = args.metrics or args.prom is not None or args.profile
+    if not args.force and not wants_instrumentation and _report_is_current(out_path, raw_path):
+        print(f"Up to date {out_path}")
+        return
+
+    from playcall_intel.game_report import write_game_report
+    from playcall_intel.metrics import RunMetrics
+    from playcall_intel.profiling import maybe_profile
+
+    metrics = RunMetrics("game_report")
+    with maybe_profile(args.profile) as profiler:
+        metrics.profiler = profiler
+        with metrics.stage("run"):
+            path = write_game_report(args.game_id, metrics=metrics, raw_path=args.raw, out_dir=args.out_dir)
+        metrics.profiler = None
+    print(f"Wrote {path}")
+
+    if profiler is not None:
+        print(f"Wrote {profiler.write(path.with_suffix('.profile'))}")
+    if args.metrics:
+        summary_path = metrics.write_json(path.with_suffix(".metrics.json"))
+        print(f"Wrote {summary_path}")
+    if args.prom is not None:
+        metrics.write_prometheus(args.prom)
+        print(f"Wrote {args.prom}")
+
+
+def cmd_games(args: argparse.Namespace) -> None:
+    from playcall_intel.artifact_cache import is_fresh, read_csv_rows, sidecar_path
+
+    rows: list[dict[str, str]] = []
+    for raw_path in _season_raw_paths(args):
+        cache_path = sidecar_path(raw_path, "games_index")
+        if is_fresh(cache_path, raw_path):
+            # Fast path: stdlib CSV over the cached index, no pandas import
+            rows.extend(read_csv_rows(cache_path))
+        else:
+            from playcall_intel.game_index import GameIndexConfig, load_games_index
+
+            rows.extend(load_games_index(GameIndexConfig(raw_path=raw_path)).astype(str).to_dict("records"))
+
+    if args.team:
+        rows = [r for r in rows if args.team in (r["home_team"], r["away_team"])]
+    rows.sort(key=lambda r: (r["date_label"], r["game_id"]))
+
+    for r in rows:
+        print(f"{r['game_id']}\t{r['match_label']}")
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    from playcall_intel.batch_normalize import run_batch
+
+    run_batch(
+        sample_size=args.sample_size,
+        prom_path=args.prom,
+        raw_path=args.raw,
+        profile=args.profile,
+        seasons=_selected_seasons(args),
+        workers=args.workers,
+        use_async=args.use_async,
+    )
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    from playcall_intel.serve import serve
+
+    serve(raw_path=args.raw, host=args.host, port=args.port, out_dir=args.out_dir, verbose=args.verbose)
+
+
+def cmd_ingest(args: argparse.Namespace) -> None:
+    from playcall_intel.ingest import PlayStore, default_store_dir, ingest, rebuild_store
+
+    store_dir = args.store or default_store_dir(args.raw)
+    if args.rebuild:
+        result = rebuild_store(args.raw, store_dir)
     else:
+        result = ingest(args.raw, PlayStore(store_dir))
+    print(f"Ingested {args.raw} → {store_dir}: {result.summary()}")
+    for label, ids in [("added", result.added), ("changed", result.changed), ("removed", result.removed)]:
+        for gid in ids:
+            print(f"  {label:<8} {gid}")
+
+    from playcall_intel.drives import refresh_drive_table
+    from playcall_intel.players import refresh_player_table
+    from playcall_intel.scouting import refresh_game_rollups
+    from playcall_intel.search_index import refresh_search_index
+    from playcall_intel.standings import refresh_team_tables
+
+    store = PlayStore(store_dir)
+    print(f"Search index: {refresh_search_index(args.raw, store)} games (re)indexed")
+    print(f"Drive table: {refresh_drive_table(args.raw, store)} games (re)segmented")
+    print(f"Player table: {refresh_player_table(args.raw, store)} games (re)aggregated")
+    print(f"Team rollups: {refresh_game_rollups(args.raw, store)} games (re)rolled up")
+    print(f"Team tables: {refresh_team_tables(args.raw, store)} games (re)aggregated")
+
+
+def cmd_seek_index(args: argparse.Namespace) -> None:
+    import time
+
+    from playcall_intel.seek_index import SeekIndex, blocked_path, build_seek_index
+
+    if not args.rebuild and SeekIndex.open(args.raw) is not None:
+        print(f"Seek index for {args.raw} is up to date")
+        return
+    t0 = time.perf_counter()
+    index = build_seek_index(args.raw)
+    print(f"Indexed {len(index.game_ids())} games → {blocked_path(args.raw)} in {time.perf_counter() - t0:.1f}s")
+
+
+def cmd_tendencies(args: argparse.Namespace) -> None:
+    from playcall_intel.tendencies import format_query, load_tendency_cube
+
+    cube = load_tendency_cube(args.normalized)
+    result = cube.query(
+        team=args.team,
+        down=args.down,
+        distance=args.distance,
+        yardline_100=args.yardline,
+        quarter=args.quarter,
+    )
+    print(format_query(result))
+
+
+def cmd_search(args: argparse.Namespace) -> None:
+    from playcall_intel.search_index import format_hits, load_search_index
+
+    index = load_search_index(args.raw)
+    print(format_hits(index.search(" ".join(args.query), limit=args.limit, game_id=args.game_id)))
+
+
+def cmd_scout(args: argparse.Namespace) -> None:
+    from playcall_intel.scouting import write_scouting_report
+
+    print(f"Wrote {write_scouting_report(args.team, last_n=args.last, raw_path=args.raw, out_dir=args.out_dir)}")
+
+
+def cmd_standings(args: argparse.Namespace) -> None:
+    from playcall_intel.standings import format_standings, load_team_tables
+
+    table = load_team_tables(_season_raw_paths(args), "team_season")
+    if args.team and not table.empty:
+        table = table[table["team"] == args.team]
+    print(format_standings(table))
+
+
+def cmd_watch(args: argparse.Namespace) -> None:
+    from playcall_intel.watch import watch
+
+    watch(
+        raw_dir=args.raw_dir,
+        out_dir=args.out_dir,
+        interval_s=args.interval,
+        workers=args.workers,
+        include_new=args.include_new,
+        once=args.once,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="playcall_intel", description="Playcall-Intel CLI")
+    # Legacy form: python -m playcall_intel --game-id <id>
+    parser.add_argument("--game-id", help="Generate a game report for this game_id (same as `report <id>`)")
+
+    sub = parser.add_subparsers(dest="command")
+
+    p = sub.add_parser("report", help="Generate a markdown game report")
+    p.add_argument("game_id")
+    p.add_argument("--force", action="store_true", help="Regenerate even if the report is newer than the raw data")
+    p.add_argument("--metrics", action="store_true", help="Write a JSON run summary next to the report")
+    p.add_argument("--prom", type=Path, default=None, help="Also write metrics in Prometheus text format")
+    p.add_argument("--profile", action="store_true", help="Capture cProfile + tracemalloc per stage next to the report")
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.add_argument("--out-dir", type=Path, default=DEFAULT_REPORT_DIR)
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("games", help="List games from the (cached) game index")
+    p.add_argument("--team", help="Only games involving this team")
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.add_argument("--season", type=int, action="append", help="Season file(s) next to --raw (repeatable)")
+    p.add_argument("--all-seasons", action="store_true", help="Every play_by_play_<season>.csv.gz next to --raw")
+    p.set_defaults(func=cmd_games)
+
+    p = sub.add_parser("batch", help="Batch-normalize raw plays (LLM_PROVIDER selects the model)")
+    p.add_argument("--sample-size", type=int, default=25)
+    p.add_argument("--prom", type=Path, default=None, help="Also write metrics in Prometheus text format")
+    p.add_argument("--profile", action="store_true", help="Capture cProfile + tracemalloc per stage")
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.add_argument("--season", type=int, action="append", help="Season file(s) next to --raw (repeatable)")
+    p.add_argument("--all-seasons", action="store_true", help="Every play_by_play_<season>.csv.gz next to --raw")
+    p.add_argument("--workers", type=int, default=None, help="Concurrent LLM callers (default: adaptive ceiling or 1)")
+    p.add_argument("--async", dest="use_async", action="store_true", help="One event loop instead of worker threads")
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser("ingest", help="Incrementally sync the per-game store with the raw file")
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.add_argument("--store", type=Path, default=None, help="Store directory (default: data/processed/store/<raw name>)")
+    p.add_argument("--rebuild", action="store_true", help="Drop the store and ingest from scratch")
+    p.set_defaults(func=cmd_ingest)
+
+    p = sub.add_parser("seek-index", help="Build the per-game seek index (gzip block per game) for the raw file")
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.add_argument("--rebuild", action="store_true", help="Rebuild even if the index matches the raw file")
+    p.set_defaults(func=cmd_seek_index)
+
+    p = sub.add_parser("tendencies", help="Play-type mix for a situation from the normalized-play cube")
+    p.add_argument("--team", help="Offense team")
+    p.add_argument("--down", type=int)
+    p.add_argument("--distance", type=int, help="Yards to go (bucketed: 1-3, 4-6, 7-10, 11+)")
+    p.add_argument("--yardline", type=int, help="yardline_100, yards from the opponent end zone")
+    p.add_argument("--quarter", type=int)
+    p.add_argument("--normalized", type=Path, default=Path("data/processed/normalized_sample.csv"))
+    p.set_defaults(func=cmd_tendencies)
+
+    p = sub.add_parser("search", help="Full-text search over play descriptions (ranked)")
+    p.add_argument("query", nargs="+", help='e.g. "fake punt", K.Murray touchdown, "sacked 10+ yards"')
+    p.add_argument("--limit", type=int, default=25)
+    p.add_argument("--game-id", default=None, help="Only plays from this game")
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser("scout", help="Scouting report for a team over its last N games (from cached rollups)")
+    p.add_argument("team")
+    p.add_argument("--last", type=int, default=4, help="Number of most recent games")
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.add_argument("--out-dir", type=Path, default=Path("reports/scouting"))
+    p.set_defaults(func=cmd_scout)
+
+    p = sub.add_parser("standings", help="Team-season table (record, yards/play, turnover margin, sack rate)")
+    p.add_argument("--team", help="Only this team")
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.add_argument("--season", type=int, action="append", help="Season file(s) next to --raw (repeatable)")
+    p.add_argument("--all-seasons", action="store_true", help="Every play_by_play_<season>.csv.gz next to --raw")
+    p.set_defaults(func=cmd_standings)
+
+    p = sub.add_parser("watch", help="Regenerate only the reports whose games changed in the raw data")
+    p.add_argument("--raw-dir", type=Path, default=DEFAULT_RAW_PATH.parent)
+    p.add_argument("--out-dir", type=Path, default=DEFAULT_REPORT_DIR)
+    p.add_argument("--interval", type=float, default=5.0, help="Polling interval in seconds")
+    p.add_argument("--workers", type=int, default=4, help="Report worker threads")
+    p.add_argument("--include-new", action="store_true", help="Also generate reports for newly added games")
+    p.add_argument("--once", action="store_true", help="Process current files once and exit")
+    p.set_defaults(func=cmd_watch)
+
+    p = sub.add_parser("serve", help="Hold the season in memory and serve reports over local HTTP")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--raw", type=Path, default=DEFAULT_RAW_PATH)
+    p.add_argument("--out-dir", type=Path, default=DEFAULT_REPORT_DIR)
+    p.add_argument("--verbose", action="store_true", help="Log every request")
+    p.set_defaults(func=cmd_serve)
+
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command is None and args.game_id:
+        args = parser.parse_args(["report", args.game_id])
+
+    if args.command is None:
         parser.print_help()
+        return
+
+    args.func(args)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future
 from pathlib import Path
 
 import streamlit as st
 
+from playcall_intel.bitmap_index import load_bitmap_index
+from playcall_intel.dataset import discover_seasons
 from playcall_intel.game_index import (
     GameIndexConfig,
     list_matchup_games,
@@ -11,7 +15,169 @@ from playcall_intel.game_index import (
     list_teams,
     load_games_index,
 )
-from playcall_intel.game_report import write_game_report
+from playcall_intel.game_report import render_report_md
+from playcall_intel.highlights import load_highlight_index
+from playcall_intel.players import format_player_stats, load_player_stats
+from playcall_intel.scouting import format_scouting_report, load_game_rollups, scouting_report
+from playcall_intel.report_jobs import ReportJobs
+from playcall_intel.search_index import load_search_index
+from playcall_intel.shared_frame import publish_frame
+from playcall_intel.standings import load_team_table
+from playcall_intel.serve import ServiceClient
+from playcall_intel.tendencies import DISTANCE_LABELS, FIELD_LABELS, NORMALIZED_PATH, load_tendency_cube
+from playcall_intel.wp_timeline import load_wp_timelines
+
+
+def _service_client() -> ServiceClient | None:
+    """
+    Use the long-running report service when PLAYCALL_SERVICE_URL points at one
+    (python -m playcall_intel serve); otherwise generate in-process.
+    """
+    url = os.getenv("PLAYCALL_SERVICE_URL")
+    if not url:
+        return None
+    client = ServiceClient(url)
+    return client if client.is_up() else None
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _report_jobs(raw_path: str, mtime_ns: int) -> ReportJobs:
+    # One worker pool per process, shared by every session (jobs are keyed by game_id); the season
+    # frame is memory-mapped, so sessions and processes on this file version share one copy
+    try:
+        frame = publish_frame(Path(raw_path), "report")
+    except OSError:
+        frame = None  # read-only data dir → per-game loads from the store / seek index
+    return ReportJobs(raw_path=Path(raw_path), frame=frame)
+
+
+@st.cache_resource(show_spinner=False)
+def _normalized_plays(path: str, mtime_ns: int):
+    # Keyed by mtime so a new batch run is picked up; the bitmap index is cached on disk
+    import pandas as pd
+
+    plays = pd.read_csv(path)
+    return plays, load_bitmap_index(Path(path), plays=plays)
+
+
+@st.cache_resource(show_spinner=False)
+def _search_index(raw_path: str, mtime_ns: int):
+    # One load per raw file version; queries after that are in-memory
+    return load_search_index(Path(raw_path))
+
+
+def _search_panel(raw_path: Path) -> None:
+    query = st.text_input("Search plays", placeholder='e.g. fake punt · K.Murray touchdown · sacked 10+ yards')
+    if not query.strip():
+        return
+    index = _search_index(str(raw_path), raw_path.stat().st_mtime_ns)
+    hits = index.search(query, limit=25)
+    if not hits:
+        st.info("No matching plays.")
+        return
+    st.dataframe(
+        [{"game": h.game_id, "matchup": h.match, "Q": h.qtr, "offense": h.posteam, "play": h.desc} for h in hits],
+        hide_index=True,
+        use_container_width=True,
+    )
+
+
+def _play_filter_panel() -> None:
+    """
+    Ad-hoc filters over normalized plays, answered by bitmap AND/OR instead of frame masks.
+    """
+    if not NORMALIZED_PATH.exists():
+        return
+    with st.expander("Filter normalized plays", expanded=False):
+        plays, index = _normalized_plays(str(NORMALIZED_PATH), NORMALIZED_PATH.stat().st_mtime_ns)
+        fields = [f for f in ["posteam", "down", "play_type", "result", "field_bucket"] if f in index.fields()]
+        cols = st.columns(len(fields) or 1)
+        chosen = {f: c.multiselect(f, index.values(f), key=f"bm_{f}") for f, c in zip(fields, cols)}
+        hits = index.where(**chosen)
+        st.caption(f"{hits.count()} of {index.n} plays")
+        st.dataframe(plays.iloc[hits.rows()[:200]], hide_index=True, use_container_width=True)
+
+
+def _tendency_panel(team: str) -> None:
+    """
+    Situational play-type mix for the selected team, answered from the precomputed cube.
+    """
+    if not NORMALIZED_PATH.exists():
+        return
+    with st.expander(f"{team} tendencies (normalized plays)", expanded=False):
+        cube = load_tendency_cube(NORMALIZED_PATH)
+        if not cube.games:
+            st.caption("Normalized plays predate game_id / quarter columns: re-run the batch for quarter splits.")
+        c1, c2, c3, c4 = st.columns(4)
+        down = c1.selectbox("Down", ["Any", 1, 2, 3, 4], key="tend_down")
+        distance = c2.selectbox("Distance", ["Any"] + DISTANCE_LABELS, key="tend_dist")
+        field = c3.selectbox("Field position", ["Any"] + FIELD_LABELS, key="tend_field")
+        quarter = c4.selectbox("Quarter", ["Any", 1, 2, 3, 4, 5], key="tend_qtr")
+
+        def pick(v):
+            return None if v == "Any" else v
+
+        result = cube.query(
+            team=team,
+            down=pick(down),
+            distance=pick(distance),
+            yardline_100=pick(field),
+            quarter=pick(quarter),
+        )
+        if result.empty:
+            st.info("No normalized plays in this situation.")
+        else:
+            st.dataframe(result, hide_index=True, use_container_width=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _game_rollups(raw_path: str, mtime_ns: int):
+    # Per-game rollups are merged per request; only a new raw file version re-reads them
+    return load_game_rollups(Path(raw_path))
+
+
+def _scouting_tab(raw_path: Path, team: str, highlights) -> None:
+    """
+    Multi-game scouting report for the selected opponent, merged from cached per-game rollups.
+    """
+    last_n = st.number_input("Last N games", min_value=1, max_value=20, value=4, step=1, key="scout_n")
+    rollups = _game_rollups(str(raw_path), raw_path.stat().st_mtime_ns)
+    report = scouting_report(team, rollups, last_n=int(last_n), highlights=highlights)
+    st.markdown(format_scouting_report(report))
+
+
+@st.cache_resource(show_spinner=False)
+def _team_tables(raw_path: str, mtime_ns: int):
+    # Materialized by ingest/watch; the app only reads them (rebuilt here only when stale)
+    return load_team_table(Path(raw_path), "team_season"), load_team_table(Path(raw_path), "team_week")
+
+
+def _standings_tab(raw_path: Path, team: str) -> None:
+    """
+    Season table for every team plus the selected team's week-by-week line, from the rollup tables.
+    """
+    season, week = _team_tables(str(raw_path), raw_path.stat().st_mtime_ns)
+    cols = [
+        "season", "team", "wins", "losses", "ties", "points_for", "points_against", "yards_per_play",
+        "yards_per_play_allowed", "turnover_margin", "sack_rate",
+    ]
+    st.dataframe(season[[c for c in cols if c in season.columns]], hide_index=True, use_container_width=True)
+    st.caption(f"{team} by week")
+    weekly = week[week["team"] == team]
+    st.dataframe(
+        weekly[["week"] + [c for c in cols[2:] if c in weekly.columns]],
+        hide_index=True,
+        use_container_width=True,
+    )
+
+
+@st.fragment(run_every=1.0)
+def _await_recap(job: Future) -> None:
+    # Polls instead of job.result(): the script thread stays free, and the full rerun on
+    # completion renders the finished report (or the error) through main()
+    if job.done():
+        st.rerun()
+    st.caption("Recap in progress…")
 
 
 def main() -> None:
@@ -23,6 +189,13 @@ def main() -> None:
     )
 
     cfg = GameIndexConfig()
+
+    # Multiple play_by_play_<season>.csv.gz files → pick a season; only that file is read
+    seasons = discover_seasons(cfg.raw_path.parent)
+    if len(seasons) > 1:
+        season = st.selectbox("Season", list(seasons)[::-1], index=0)
+        cfg = GameIndexConfig(raw_path=seasons[season])
+
     if not cfg.raw_path.exists():
         st.error(
             "Raw data file not found.\n\n"
@@ -33,6 +206,11 @@ def main() -> None:
 
     with st.spinner("Loading game index..."):
         games = load_games_index(cfg)
+        highlights = load_highlight_index(cfg.raw_path)
+        timelines = load_wp_timelines(cfg.raw_path)
+        players = load_player_stats(cfg.raw_path)
+
+    _search_panel(cfg.raw_path)
 
     teams = list_teams(games)
     if not teams:
@@ -71,27 +249,79 @@ def main() -> None:
             use_container_width=True,
         )
 
-    st.divider()
+    game_tab, scout_tab, standings_tab = st.tabs(["Game report", f"Scout {opponent}", "Standings"])
 
-    if do_generate:
-        with st.spinner("Generating report..."):
-            out_path = write_game_report(game_id)
+    with scout_tab:
+        _scouting_tab(cfg.raw_path, opponent, highlights)
 
-        if out_path is None:
-            st.error("Report generation returned no path. Check `write_game_report()` return value.")
-            st.stop()
+    with standings_tab:
+        _standings_tab(cfg.raw_path, team)
 
-        out_path = Path(out_path)
-        if not out_path.exists():
-            st.error(f"Expected report file not found: {out_path}")
-            st.stop()
+    with game_tab:
+        # Game flow from the precomputed (downsampled) win-probability series
+        series = timelines.get(game_id)
+        if series is not None and len(series.home_wp):
+            home = str(selected["home_team"])
+            flow = series.to_frame().rename(columns={"home_wp": f"{home} win probability"})
+            st.caption(f"Win probability — {selected['away_team']} @ {home}")
+            st.line_chart(flow, x="minute", y=f"{home} win probability", height=220)
+
+        # Precomputed top-WPA plays: an O(k) lookup, available before any report is generated
+        hl = highlights.get(game_id)
+        if hl is not None and hl.by_team:
+            with st.expander("Top WPA plays", expanded=False):
+                for side in [str(selected["away_team"]), str(selected["home_team"])]:
+                    st.markdown(f"**{side}**")
+                    for wpa, desc in hl.team_top(side):
+                        st.markdown(f"- **{wpa:+.3f} WPA** — {desc}")
+
+        # Player lines are a slice of the season table (no raw re-scan per game)
+        game_players = players.game(game_id)
+        if not game_players.empty:
+            with st.expander("Player stats", expanded=False):
+                st.markdown(format_player_stats(game_players, [str(selected["away_team"]), str(selected["home_team"])]))
+
+        _tendency_panel(team)
+        _play_filter_panel()
+
+        st.divider()
+
+        if do_generate:
+            st.session_state["report_game_id"] = game_id
+
+        service = _service_client() if do_generate else None
+        if service is not None:
+            with st.spinner("Generating report..."):
+                out_path = Path(service.report(game_id)["path"])
+            st.success(f"Generated: {out_path}")
+            st.markdown(out_path.read_text(encoding="utf-8"))
 
-        md = out_path.read_text(encoding="utf-8")
-        st.success(f"Generated: {out_path}")
-        st.markdown(md)
+        elif st.session_state.get("report_game_id") == game_id:
+            jobs = _report_jobs(str(cfg.raw_path), cfg.raw_path.stat().st_mtime_ns)
+            others = [str(g) for g in match_df["game_id"] if str(g) != game_id]
+            if jobs.is_current(game_id):
+                out_path = jobs.report_path(game_id)
+                st.success(f"Generated: {out_path}")
+                st.markdown(out_path.read_text(encoding="utf-8"))
+                jobs.prefetch(others)
+            else:
+                # Stats first (cached tables, no LLM), recap filled in when the background job lands
+                parts = jobs.stats(game_id)
+                job = jobs.job(game_id)
+                failed = job is not None and job.done() and not job.cancelled() and job.exception() is not None
+                if failed and not do_generate:
+                    # Shown once; the button resubmits instead of retrying on every rerun
+                    st.markdown(render_report_md(parts, "_Recap unavailable._"))
+                    err = job.exception()
+                    st.error(f"Recap failed: {type(err).__name__}: {err}")
+                else:
+                    job = jobs.finish(game_id, parts)
+                    jobs.prefetch(others)
+                    st.markdown(render_report_md(parts, "_Writing recap in the background…_"))
+                    _await_recap(job)
 
-    else:
-        st.info("Pick a matchup and click **Generate game report**.")
+        else:
+            st.info("Pick a matchup and click **Generate game report**.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+
+def raw_fingerprint(raw_path: str | Path) -> dict[str, int]:
+    """
+    Cheap identity for a raw file: size + mtime (no hashing of multi-GB data)
+    """
+    st = Path(raw_path).stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def sidecar_path(raw_path: str | Path, kind: str, ext: str = "csv") -> Path:
+    """
+    Derived artifacts live next to the raw file they came from
+
+    - data/raw/play_by_play_2025.csv.gz → data/raw/play_by_play_2025.csv.gz.<kind>.<ext>
+    - Keeps each artifact tied to exactly one source file (works for any season / synthetic data)
+    """
+    p = Path(raw_path)
+    return p.with_name(f"{p.name}.{kind}.{ext}")
+
+
+def _meta_path(artifact_path: Path) -> Path:
+    return artifact_path.with_name(artifact_path.name + ".meta.json")
+
+
+def is_fresh(artifact_path: str | Path, raw_path: str | Path) -> bool:
+    """
+    True when the artifact exists and was built from the raw file as it is now.
+    """
+    a = Path(artifact_path)
+    meta = _meta_path(a)
+    if not a.exists() or not meta.exists() or not Path(raw_path).exists():
+        return False
+    try:
+        recorded = json.loads(meta.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return recorded.get("source") == raw_fingerprint(raw_path)
+
+
+def mark_fresh(artifact_path: str | Path, raw_path: str | Path, **extra: Any) -> None:
+    meta = {"source": raw_fingerprint(raw_path), **extra}
+    _meta_path(Path(artifact_path)).write_text(json.dumps(meta), encoding="utf-8")
+
+
+def read_meta(artifact_path: str | Path) -> Optional[dict[str, Any]]:
+    """
+    The metadata recorded by mark_fresh (incl. extras), or None when missing/unreadable.
+    """
+    try:
+        return json.loads(_meta_path(Path(artifact_path)).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def read_csv_rows(path: str | Path) -> list[dict[str, str]]:
+    """
+    Stdlib CSV read for small cached artifacts (keeps pandas off the fast paths)
+    """
+    with Path(path).open(encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
@@ -1,75 +1,283 @@
 import pandas as pd
+import argparse
+import asyncio
 import json
 import traceback
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
 
 from playcall_intel.mapper import row_to_play_first_pass, is_scrimmage_play
 from playcall_intel.client_factory import get_llm_client
-from playcall_intel.llm_normalize import normalize_with_llm_v1, apply_llm_enrichment
+from playcall_intel.columns import read_pbp
+from playcall_intel.dataset import Dataset
+from playcall_intel.llm_normalize import normalize_with_llm_v1, normalize_with_llm_v1_async, apply_llm_enrichment
+from playcall_intel.llm_scheduler import get_scheduler
+from playcall_intel.metrics import RunMetrics
+from playcall_intel.profiling import maybe_profile
 
 
 RAW_PATH = Path("data/raw/play_by_play_2025.csv.gz")
 OUT_PATH = Path("data/processed/normalized_sample.csv")
+WINDOW_PER_CALLER = 4  # plays in flight per concurrent LLM caller; bounds memory on whole seasons
 
 
-def run_batch(sample_size: int = 25) -> None:
-    df = pd.read_csv(RAW_PATH, compression="gzip", low_memory=False)
+def run_batch(
+    sample_size: Optional[int] = 25,
+    prom_path: Optional[Path] = None,
+    raw_path: Path = RAW_PATH,
+    out_path: Path = OUT_PATH,
+    profile: bool = False,
+    seasons: Union[None, str, tuple[int, ...]] = None,
+    workers: Optional[int] = None,
+    use_async: bool = False,
+) -> RunMetrics:
+    """
+    Normalize raw plays (rules baseline + LLM enrichment) into normalized/rejects CSVs.
 
-    df = df.head(sample_size)
+    seasons: None → just raw_path; "all" or (2023, 2024, ...) → season files next to raw_path,
+    processed one season frame at a time (sample_size caps the total across seasons).
+    workers: threads issuing LLM calls (the scheduler decides how many actually run at once);
+    None → the scheduler's ceiling with LLM_ADAPTIVE_LIMIT=1, else 1 (sequential).
+    use_async: one coroutine per play on a single event loop instead of worker threads.
+    At most WINDOW_PER_CALLER × callers plays (workers, or the scheduler's ceiling with use_async)
+    are in flight; the rest of the frame waits until the oldest result is written out.
+    """
+    metrics = RunMetrics("batch_normalize")
+    scheduler = get_scheduler()
+    if use_async:
+        workers = 1
+    elif workers is None:
+        workers = scheduler.max_in_flight if scheduler.limit is not None else 1
+    if profile and workers > 1:
+        raise ValueError("--profile needs a sequential run (workers=1)")
+    window = WINDOW_PER_CALLER * (scheduler.max_in_flight if use_async else workers)
 
+    with maybe_profile(profile) as profiler:
+        metrics.profiler = profiler
+        with metrics.stage("run"):
+            _normalize_to_files(
+                metrics, sample_size, _iter_frames(raw_path, seasons), out_path, workers, use_async, window
+            )
+        metrics.profiler = None
+
+    metrics.set_gauge("repair_rate", metrics.rate("llm_repaired", "llm_outputs"))
+    metrics.set_gauge("reject_rate", metrics.rate("rows_rejected", "rows_seen"))
+    metrics.set_gauge("llm_workers", workers)
+    metrics.set_gauge("llm_async", int(use_async))
+    metrics.set_gauge("llm_window", window)
+    if scheduler.limit is not None:
+        metrics.set_gauge("llm_concurrency_limit", scheduler.capacity())
+        metrics.set_gauge("llm_concurrency_limit_changes", len(scheduler.limit.history) - 1)
+
+    summary_path = metrics.write_json(out_path.parent / "run_metrics_sample.json")
+    print(f"Wrote run metrics → {summary_path}")
+    if prom_path is not None:
+        metrics.write_prometheus(prom_path)
+        print(f"Wrote Prometheus metrics → {prom_path}")
+    if profiler is not None:
+        profile_dir = profiler.write(out_path.parent / f"profile_{out_path.stem}")
+        print(f"Wrote profile → {profile_dir}")
+
+    return metrics
+
+
+def _iter_frames(raw_path: Path, seasons: Union[None, str, tuple[int, ...]]) -> Iterator[pd.DataFrame]:
+    if seasons is None:
+        yield read_pbp(raw_path, "normalize")
+        return
+    dataset = Dataset(Path(raw_path).parent)
+    for _, df in dataset.iter_season_frames(None if seasons == "all" else seasons, consumer="normalize"):
+        yield df
+
+
+def _normalize_to_files(
+    metrics: RunMetrics,
+    sample_size: Optional[int],
+    frames: Iterator[pd.DataFrame],
+    out_path: Path,
+    workers: int = 1,
+    use_async: bool = False,
+    window: int = WINDOW_PER_CALLER,
+) -> None:
     client = get_llm_client()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="normalize") if workers > 1 else None
 
     rows = []
     rejects = []
+    remaining = sample_size
+
+    while remaining is None or remaining > 0:
+        with metrics.stage("csv_load"):
+            df = next(frames, None)
+        if df is None:
+            break
+        if remaining is not None:
+            df = df.head(remaining)
+            remaining -= len(df)
+        _normalize_frame(metrics, client, df, rows, rejects, pool, use_async, window)
+
+    if pool is not None:
+        pool.shutdown()
+    out_df = pd.DataFrame(rows)
+    reject_path = out_path.parent / "rejects_sample.csv"
+
+    with metrics.stage("write"):
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_df.to_csv(out_path, index=False)
+        pd.DataFrame(rejects).to_csv(reject_path, index=False)
+
+    print(f"Wrote {len(out_df)} rows → {out_path}")
+    print(f"Wrote {len(rejects)} rejects → {reject_path}")
 
-    for _, row in df.iterrows():
 
-        try:
+def _run_now(fn: Callable[..., object], *args: object) -> Future:
+    # Sequential mode: same Future interface as the pool, computed inline
+    fut: Future = Future()
+    try:
+        fut.set_result(fn(*args))
+    except Exception as e:
+        fut.set_exception(e)
+    return fut
+
+
+def _map_row(metrics: RunMetrics, row: pd.Series) -> tuple[bool, object, Optional[Future]]:
+    """
+    Rules pass for one row → (keep, base_play, failed); failed carries a mapping error to report in order.
+    """
+    metrics.incr("rows_seen")
+    try:
+        with metrics.stage("map"):
             if not is_scrimmage_play(row):
-                continue
-
-            base_play = row_to_play_first_pass(row)
-            llm_out = normalize_with_llm_v1(base_play, client)
-            enriched = apply_llm_enrichment(base_play, llm_out)
-
-            rows.append({
-                "posteam": enriched.offense_team,
-                "defteam": enriched.defense_team,
-                "down": enriched.down,
-                "distance": enriched.distance,
-                "yardline_100": enriched.yardline_100,
-                "play_type": enriched.play_type,
-                "result": enriched.result,
-                "yards_gained": enriched.yards_gained,
-                "play_text": enriched.play_text,
-            })
-
-        except Exception as e:
-            # Keep the batch moving. Capture enough context to debug later.
-            rejects.append({
-                "error_type": type(e).__name__,
-                "error": str(e),
-                "play_text": getattr(base_play, "play_text", None),
-                "baseline_play_type": getattr(base_play, "play_type", None),
-                "baseline_result": getattr(base_play, "result", None),
-                "baseline_yards_gained": getattr(base_play, "yards_gained", None),
-                "traceback": traceback.format_exc(),
-            })
+                metrics.incr("rows_skipped")
+                return False, None, None
+            return True, row_to_play_first_pass(row), None
+    except Exception as e:
+        failed: Future = Future()
+        failed.set_exception(e)
+        return True, None, failed
 
 
-    out_df = pd.DataFrame(rows)
+def _collect(metrics: RunMetrics, row: pd.Series, base_play, fut, rows: list, rejects: list) -> None:
+    # fut is a finished concurrent Future or asyncio Task; both re-raise the play's error from result()
+    try:
+        enriched = fut.result()
 
-    OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    out_df.to_csv(OUT_PATH, index=False)
+        rows.append({
+            "game_id": row.get("game_id"),
+            "season": row.get("season"),
+            "posteam": enriched.offense_team,
+            "defteam": enriched.defense_team,
+            "quarter": enriched.quarter,
+            "down": enriched.down,
+            "distance": enriched.distance,
+            "yardline_100": enriched.yardline_100,
+            "play_type": enriched.play_type,
+            "result": enriched.result,
+            "yards_gained": enriched.yards_gained,
+            "play_text": enriched.play_text,
+        })
+        metrics.incr("rows_normalized")
 
-    print(f"Wrote {len(out_df)} rows → {OUT_PATH}")
-    reject_path = OUT_PATH.parent / "rejects_sample.csv"
-    pd.DataFrame(rejects).to_csv(reject_path, index=False)
+    except Exception as e:
+        # Keep the batch moving. Capture enough context to debug later.
+        metrics.incr("rows_rejected")
+        rejects.append({
+            "error_type": type(e).__name__,
+            "error": str(e),
+            "play_text": getattr(base_play, "play_text", None),
+            "baseline_play_type": getattr(base_play, "play_type", None),
+            "baseline_result": getattr(base_play, "result", None),
+            "baseline_yards_gained": getattr(base_play, "yards_gained", None),
+            "traceback": "".join(traceback.format_exception(e)),
+        })
 
-    print(f"Wrote {len(rejects)} rejects → {reject_path}")
 
+def _normalize_frame(
+    metrics: RunMetrics,
+    client,
+    df: pd.DataFrame,
+    rows: list,
+    rejects: list,
+    pool: Optional[ThreadPoolExecutor] = None,
+    use_async: bool = False,
+    window: int = WINDOW_PER_CALLER,
+) -> None:
+    """
+    Map rows and send the scrimmage plays to the LLM (through the pool or the event loop when
+    asked), keeping at most `window` plays in flight; results are collected oldest first, so
+    outputs are in row order and memory doesn't grow with the season.
+    """
+    if use_async:
+        asyncio.run(_normalize_frame_async(metrics, client, df, rows, rejects, window))
+        return
+
+    def enrich(base_play):
+        llm_out = normalize_with_llm_v1(base_play, client, metrics=metrics)
+        return apply_llm_enrichment(base_play, llm_out)
+
+    submit = pool.submit if pool is not None else _run_now
+    inflight: deque = deque()
+    for _, row in df.iterrows():
+        keep, base_play, failed = _map_row(metrics, row)
+        if not keep:
+            continue
+        inflight.append((row, base_play, failed if failed is not None else submit(enrich, base_play)))
+        while len(inflight) >= window:
+            _collect(metrics, *inflight.popleft(), rows, rejects)  # blocks on the oldest only
+    while inflight:
+        _collect(metrics, *inflight.popleft(), rows, rejects)
+
+
+async def _normalize_frame_async(
+    metrics: RunMetrics,
+    client,
+    df: pd.DataFrame,
+    rows: list,
+    rejects: list,
+    window: int,
+) -> None:
+    async def enrich(base_play):
+        llm_out = await normalize_with_llm_v1_async(base_play, client, metrics=metrics)
+        return apply_llm_enrichment(base_play, llm_out)
+
+    async def drain_oldest() -> None:
+        row, base_play, fut = inflight.popleft()
+        if isinstance(fut, asyncio.Task):
+            await asyncio.wait([fut])
+        _collect(metrics, row, base_play, fut, rows, rejects)
+
+    inflight: deque = deque()
+    for _, row in df.iterrows():
+        keep, base_play, failed = _map_row(metrics, row)
+        if not keep:
+            continue
+        inflight.append((row, base_play, failed if failed is not None else asyncio.create_task(enrich(base_play))))
+        while len(inflight) >= window:
+            await drain_oldest()
+    while inflight:
+        await drain_oldest()
 
 
 if __name__ == "__main__":
-    run_batch()
+    parser = argparse.ArgumentParser(description="Batch-normalize a sample of raw plays")
+    parser.add_argument("--sample-size", type=int, default=25)
+    parser.add_argument("--prom", type=Path, default=None, help="Also write metrics in Prometheus text format")
+    parser.add_argument("--profile", action="store_true", help="Capture cProfile + tracemalloc per stage")
+    parser.add_argument("--season", type=int, action="append", help="Season(s) to process (default: 2025 file)")
+    parser.add_argument("--all-seasons", action="store_true", help="Every play_by_play_<season>.csv.gz in data/raw")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent LLM callers (default: see run_batch)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="One event loop instead of worker threads")
+    args = parser.parse_args()
+
+    seasons = "all" if args.all_seasons else (tuple(args.season) if args.season else None)
+    run_batch(
+        sample_size=args.sample_size,
+        prom_path=args.prom,
+        profile=args.profile,
+        seasons=seasons,
+        workers=args.workers,
+        use_async=args.use_async,
+    )
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from playcall_intel.artifact_cache import is_fresh, mark_fresh, sidecar_path
+from playcall_intel.tendencies import NORMALIZED_PATH, distance_buckets, field_buckets
+
+
+# Categorical Play fields that get one bitmap per distinct value
+INDEXED_FIELDS = [
+    "season", "posteam", "defteam", "quarter", "down", "distance_bucket", "field_bucket", "play_type", "result",
+]
+
+
+@dataclass(frozen=True)
+class Bitmap:
+    """
+    Row set over n rows as a Python int (bit i ↔ row i); &, |, ~ and - work like set ops
+    """
+
+    bits: int
+    n: int
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap(self.bits & other.bits, self.n)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap(self.bits | other.bits, self.n)
+
+    def __sub__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap(self.bits & ~other.bits, self.n)
+
+    def __invert__(self) -> "Bitmap":
+        return Bitmap(~self.bits & ((1 << self.n) - 1), self.n)
+
+    def count(self) -> int:
+        return self.bits.bit_count()
+
+    def rows(self) -> np.ndarray:
+        if not self.bits:
+            return np.empty(0, dtype=np.int64)
+        raw = np.frombuffer(self.bits.to_bytes((self.n + 7) // 8, "little"), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(raw, bitorder="little")[: self.n])
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "Bitmap":
+        packed = np.packbits(mask.astype(bool), bitorder="little")
+        return cls(int.from_bytes(packed.tobytes(), "little"), len(mask))
+
+
+def _key(value: Any) -> str:
+    # Normalized CSVs round-trip ints as floats ("3.0"); keep one spelling per value
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _indexed_columns(plays: pd.DataFrame) -> dict[str, pd.Series]:
+    cols: dict[str, pd.Series] = {}
+    for f in INDEXED_FIELDS:
+        if f == "distance_bucket" and "distance" in plays.columns:
+            s = distance_buckets(plays["distance"])
+        elif f == "field_bucket" and "yardline_100" in plays.columns:
+            s = field_buckets(plays["yardline_100"])
+        elif f in plays.columns:
+            s = plays[f]
+        else:
+            continue
+        cols[f] = s.astype(object)
+    return cols
+
+
+class BitmapIndex:
+    """
+    One bitmap per (field, value) over the rows of a normalized plays table
+
+    - Filters become int AND/OR/NOT instead of boolean masks over the whole frame
+    - Persisted zlib-compressed (sparse bitmaps shrink to almost nothing)
+    """
+
+    def __init__(self, n: int, bitmaps: dict[str, dict[str, int]]) -> None:
+        self.n = n
+        self._bitmaps = bitmaps
+
+    @classmethod
+    def build(cls, plays: pd.DataFrame) -> "BitmapIndex":
+        bitmaps: dict[str, dict[str, int]] = {}
+        for field, series in _indexed_columns(plays).items():
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            bitmaps[field] = {
+                _key(value): Bitmap.from_mask(codes == k).bits for k, value in enumerate(uniques)
+            }
+        return cls(len(plays), bitmaps)
+
+    def fields(self) -> list[str]:
+        return list(self._bitmaps)
+
+    def values(self, field: str) -> list[str]:
+        return sorted(self._bitmaps.get(field, {}))
+
+    def all(self) -> Bitmap:
+        return ~Bitmap(0, self.n)
+
+    def eq(self, field: str, value: Any) -> Bitmap:
+        if field not in self._bitmaps:
+            raise ValueError(f"field not indexed: {field} (have {self.fields()})")
+        return Bitmap(self._bitmaps[field].get(_key(value), 0), self.n)
+
+    def isin(self, field: str, values: Iterable[Any]) -> Bitmap:
+        out = Bitmap(0, self.n)
+        for v in values:
+            out = out | self.eq(field, v)
+        return out
+
+    def where(self, **filters: Union[Any, list[Any], None]) -> Bitmap:
+        """
+        AND across fields, OR within a list of values; None / [] means "any".
+
+        where(posteam="ARI", down=3, play_type=["pass", "sack"])
+        """
+        out = self.all()
+        for field, v in filters.items():
+            if v is None or (isinstance(v, (list, tuple, set)) and not v):
+                continue
+            out = out & (self.isin(field, v) if isinstance(v, (list, tuple, set)) else self.eq(field, v))
+        return out
+
+    # -- persistence --------------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """
+        Layout: u32 header length, JSON header {n, fields: {field: {value: [offset, length]}}}, zlib blobs.
+        """
+        nbytes = (self.n + 7) // 8
+        header: dict[str, Any] = {"n": self.n, "fields": {}}
+        blobs: list[bytes] = []
+        offset = 0
+        for field, values in self._bitmaps.items():
+            header["fields"][field] = {}
+            for value, bits in values.items():
+                blob = zlib.compress(bits.to_bytes(nbytes, "little"), 6)
+                header["fields"][field][value] = [offset, len(blob)]
+                blobs.append(blob)
+                offset += len(blob)
+
+        head = json.dumps(header).encode("utf-8")
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(struct.pack("<I", len(head)))
+            f.write(head)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BitmapIndex":
+        data = path.read_bytes()
+        (hlen,) = struct.unpack_from("<I", data, 0)
+        header = json.loads(data[4 : 4 + hlen].decode("utf-8"))
+        base = 4 + hlen
+        bitmaps = {
+            field: {
+                value: int.from_bytes(zlib.decompress(data[base + off : base + off + length]), "little")
+                for value, (off, length) in values.items()
+            }
+            for field, values in header["fields"].items()
+        }
+        return cls(header["n"], bitmaps)
+
+
+def bitmap_index_path(normalized_path: Path) -> Path:
+    return sidecar_path(normalized_path, "bitmaps", "bin")
+
+
+def load_bitmap_index(
+    normalized_path: Path = NORMALIZED_PATH,
+    plays: Optional[pd.DataFrame] = None,
+) -> BitmapIndex:
+    """
+    Index over a normalized plays CSV, cached next to it until the CSV changes.
+
+    Pass the already-loaded plays to skip re-reading the CSV on a rebuild.
+    """
+    normalized_path = Path(normalized_path)
+    path = bitmap_index_path(normalized_path)
+    if is_fresh(path, normalized_path):
+        return BitmapIndex.load(path)
+
+    index = BitmapIndex.build(plays if plays is not None else pd.read_csv(normalized_path))
+    try:
+        index.save(path)
+        mark_fresh(path, normalized_path)
+    except OSError:
+        pass  # read-only data dir
+    return index
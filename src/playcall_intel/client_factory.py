@@ -7,7 +7,7 @@ def get_llm_client() -> LLMClient:
     """
     Select the active LLM implementation from Settings.
 
-    - mock → deterministic tests / zero cost
+    - mock → deterministic tests / zero cost (MOCK_LLM_LATENCY_S simulates a slow model)
     - ollama → local llama3.1:8b
     """
     s = get_settings()
@@ -22,4 +22,5 @@ def get_llm_client() -> LLMClient:
         fixed_play_type="other",
         fixed_result="other",
         fixed_yards_gained=None,
+        latency_s=s.mock_latency_s,
     )
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from playcall_intel.artifact_cache import raw_fingerprint
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """
+    One logical column a consumer needs
+
+    - candidates: physical nflverse names in preference order (schema variants); first present wins
+    - dtype: pandas dtype hint applied at parse time (category for teams, float32 for flags/counts)
+    """
+
+    name: str
+    candidates: tuple[str, ...] = ()
+    dtype: Optional[str] = None
+    required: bool = False
+
+    @property
+    def physical(self) -> tuple[str, ...]:
+        return self.candidates or (self.name,)
+
+
+TEAM = "category"
+FLAG = "float32"   # 0/1 flags with NaN; float parses "1", "1.0" and blanks alike
+NUM = "float32"
+PROB = "float64"   # keep wp/wpa exact so highlight ordering matches the full-precision data
+
+
+def _specs(*items: tuple) -> tuple[ColumnSpec, ...]:
+    return tuple(ColumnSpec(*i) for i in items)
+
+
+_DATE = ColumnSpec("date", ("game_date", "game_start_time", "game_datetime", "start_time"))
+
+# Shared building blocks
+_GAME_KEYS = _specs(
+    ("game_id", (), None, True),
+    ("home_team", (), TEAM, True),
+    ("away_team", (), TEAM, True),
+)
+_PLAY_ORDER = _specs(("play_id", (), NUM))
+_TEAM_STATS = _specs(
+    ("posteam", (), TEAM, True),
+    ("home_score_final", ("total_home_score", "home_score"), NUM),
+    ("away_score_final", ("total_away_score", "away_score"), NUM),
+    ("pass", (), FLAG),
+    ("rush", (), FLAG),
+    ("interception", (), FLAG),
+    ("fumble_lost", (), FLAG),
+    ("sack", (), FLAG),
+    ("yards_gained", (), NUM),
+)
+_HIGHLIGHTS = _specs(("wpa", (), PROB), ("desc", ()))
+_DRIVES = _specs(
+    ("fixed_drive", (), NUM),
+    ("drive", (), NUM),
+    ("fixed_drive_result", ()),
+    ("qtr", (), NUM),
+    ("down", (), NUM),
+    ("game_seconds_remaining", (), NUM),
+    ("yardline_100", (), NUM),
+    ("touchdown", (), FLAG),
+    ("field_goal_attempt", (), FLAG),
+    ("field_goal_result", ()),
+    ("punt_attempt", (), FLAG),
+    ("safety", (), FLAG),
+)
+_PLAYERS = _specs(
+    ("defteam", (), TEAM),
+    ("no_play", (), FLAG),
+    ("complete_pass", (), FLAG),
+    ("touchdown", (), FLAG),
+    ("passing_yards", (), NUM),
+    ("rushing_yards", (), NUM),
+    ("receiving_yards", (), NUM),
+    *[(f"{role}_player_{k}", ()) for role in [
+        "passer", "rusher", "receiver", "solo_tackle_1", "sack", "interception",
+    ] for k in ["id", "name"]],
+)
+_MAPPER = _specs(
+    ("defteam", (), TEAM),
+    ("qtr", (), NUM),
+    ("down", (), NUM),
+    ("ydstogo", (), NUM),
+    ("yardline_100", (), NUM),
+    ("desc", ()),
+    ("yards_gained", (), NUM),
+    *[(f, (), FLAG) for f in [
+        "no_play", "penalty", "qb_kneel", "qb_spike", "kickoff_attempt", "punt_attempt",
+        "field_goal_attempt", "extra_point_attempt", "two_point_attempt", "rush", "pass",
+        "touchdown", "interception", "fumble_lost", "sack", "incomplete_pass", "complete_pass",
+        "out_of_bounds",
+    ]],
+)
+
+# Per-consumer manifests: each read parses only these columns
+CONSUMERS: dict[str, tuple[ColumnSpec, ...]] = {
+    "games_index": _GAME_KEYS + _specs(("season", (), None), ("week", (), None), ("season_type", (), None)) + (_DATE,),
+    "box_score": _GAME_KEYS + _PLAY_ORDER + _TEAM_STATS,
+    "team_games": _GAME_KEYS + _PLAY_ORDER + _TEAM_STATS + _specs(("season", (), None), ("week", (), None)),
+    "report": _GAME_KEYS + _PLAY_ORDER + _TEAM_STATS + _HIGHLIGHTS + _DRIVES + _PLAYERS,
+    "drives": _GAME_KEYS + _PLAY_ORDER + _TEAM_STATS + _DRIVES,
+    "players": _GAME_KEYS + _PLAY_ORDER + _TEAM_STATS + _PLAYERS,
+    "rollups": _GAME_KEYS + _PLAY_ORDER + _TEAM_STATS + _specs(
+        ("defteam", (), TEAM),
+        ("no_play", (), FLAG),
+        ("down", (), NUM),
+        ("ydstogo", (), NUM),
+        ("game_seconds_remaining", (), NUM),
+    ),
+    "highlights": _specs(("game_id", (), None, True), ("posteam", (), TEAM)) + _PLAY_ORDER + _HIGHLIGHTS,
+    "wp_timeline": _GAME_KEYS + _PLAY_ORDER + _specs(
+        ("posteam", (), TEAM),
+        ("qtr", (), NUM),
+        ("game_seconds_remaining", (), NUM),
+        ("wp", (), PROB),
+        ("home_wp", (), PROB),
+    ),
+    "search": _GAME_KEYS + _PLAY_ORDER + _specs(("posteam", (), TEAM), ("qtr", (), NUM), ("desc", ())),
+    "normalize": _specs(("game_id", (), None, True), ("season", (), None), ("posteam", (), TEAM)) + _MAPPER,
+}
+# The report service holds one frame that answers listings, box scores and reports
+CONSUMERS["serve"] = CONSUMERS["report"] + CONSUMERS["games_index"][3:]
+
+
+@dataclass(frozen=True)
+class ResolvedColumns:
+    consumer: str
+    physical: dict[str, str]  # logical name → physical column in this file
+    dtypes: dict[str, str]    # physical column → dtype hint
+
+    @property
+    def usecols(self) -> list[str]:
+        # de-duplicated, file order independent
+        return list(dict.fromkeys(self.physical.values()))
+
+    def col(self, logical: str) -> Optional[str]:
+        return self.physical.get(logical)
+
+
+_HEADER_CACHE: dict[tuple[str, int, int], list[str]] = {}
+_RESOLVED_CACHE: dict[tuple[str, int, int, str], ResolvedColumns] = {}
+_LOCK = threading.Lock()
+
+
+def _file_key(path: Path) -> tuple[str, int, int]:
+    fp = raw_fingerprint(path)
+    return str(path.resolve()), fp["size"], fp["mtime_ns"]
+
+
+def read_header(path: str | Path) -> list[str]:
+    """
+    Column names of a (gzipped) pbp CSV; only the first line is decompressed, cached per file version.
+    """
+    p = Path(path)
+    key = _file_key(p)
+    with _LOCK:
+        if key in _HEADER_CACHE:
+            return _HEADER_CACHE[key]
+    opener = gzip.open if p.suffix == ".gz" else open
+    with opener(p, mode="rt", encoding="utf-8", newline="") as f:
+        header = next(csv.reader(f))
+    with _LOCK:
+        _HEADER_CACHE[key] = header
+    return header
+
+
+def resolve_columns(consumer: str, header: list[str]) -> ResolvedColumns:
+    specs = CONSUMERS[consumer]
+    present = set(header)
+    physical: dict[str, str] = {}
+    dtypes: dict[str, str] = {}
+    missing = []
+
+    for spec in specs:
+        hit = next((c for c in spec.physical if c in present), None)
+        if hit is None:
+            if spec.required:
+                missing.append(spec.name)
+            continue
+        physical[spec.name] = hit
+        if spec.dtype:
+            dtypes[hit] = spec.dtype
+
+    if missing:
+        raise ValueError(f"Missing required columns in pbp file: {sorted(missing)}")
+    return ResolvedColumns(consumer=consumer, physical=physical, dtypes=dtypes)
+
+
+def resolve_for_file(consumer: str, path: str | Path) -> ResolvedColumns:
+    """
+    Resolve a consumer's manifest against one file's header (once per file version).
+    """
+    p = Path(path)
+    key = (*_file_key(p), consumer)
+    with _LOCK:
+        if key in _RESOLVED_CACHE:
+            return _RESOLVED_CACHE[key]
+    resolved = resolve_columns(consumer, read_header(p))
+    with _LOCK:
+        _RESOLVED_CACHE[key] = resolved
+    return resolved
+
+
+def read_pbp(path: str | Path, consumer: Optional[str] = None) -> "pd.DataFrame":
+    """
+    The one place pbp CSVs are parsed
+
+    - consumer=None parses every column (debugging / ad-hoc exploration)
+    - otherwise only the consumer's manifest columns are converted, with dtype hints
+    """
+    import pandas as pd
+
+    p = Path(path)
+    compression = "gzip" if p.suffix == ".gz" else None
+    if consumer is None:
+        return pd.read_csv(p, compression=compression, low_memory=False)
+
+    resolved = resolve_for_file(consumer, p)
+    return pd.read_csv(
+        p,
+        compression=compression,
+        usecols=resolved.usecols,
+        dtype=resolved.dtypes,
+        low_memory=False,
+    )
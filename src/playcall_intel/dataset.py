@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+SEASON_FILE_RE = re.compile(r"^play_by_play_(\d{4})\.csv\.gz$")
+GAME_ID_SEASON_RE = re.compile(r"^(\d{4})_")
+
+
+def discover_seasons(raw_dir: str | Path) -> dict[int, Path]:
+    """
+    Map season → file for every play_by_play_<season>.csv.gz in raw_dir (sorted by season).
+    """
+    d = Path(raw_dir)
+    if not d.is_dir():
+        return {}
+    found = {}
+    for p in d.iterdir():
+        m = SEASON_FILE_RE.match(p.name)
+        if m:
+            found[int(m.group(1))] = p
+    return dict(sorted(found.items()))
+
+
+def season_of_game(game_id: str) -> Optional[int]:
+    """
+    nflverse game ids start with the season: 2025_01_ARI_NO → 2025
+    """
+    m = GAME_ID_SEASON_RE.match(str(game_id))
+    return int(m.group(1)) if m else None
+
+
+def season_path_for_game(game_id: str, raw_path: str | Path) -> Path:
+    """
+    Route a game to its season file living next to raw_path (falls back to raw_path itself).
+    """
+    raw = Path(raw_path)
+    season = season_of_game(game_id)
+    if season is None:
+        return raw
+    candidate = raw.with_name(f"play_by_play_{season}.csv.gz")
+    return candidate if candidate.exists() else raw
+
+
+class Dataset:
+    """
+    Multi-season view over data/raw/play_by_play_<season>.csv.gz files
+
+    - Discovers seasons up front, parses a season only on first access
+    - Keeps at most `max_cached_seasons` parsed frames (LRU) so 10 seasons never sit in memory at once
+    - Frames are keyed by (season, column consumer) so projected reads stay small
+    - Game lookups go through the per-season file (and its ingest store when current)
+    """
+
+    def __init__(self, raw_dir: Optional[str | Path] = None, max_cached_seasons: int = 2) -> None:
+        if raw_dir is None:
+            from playcall_intel.settings import get_settings
+
+            raw_dir = get_settings().raw_data_dir
+        self.raw_dir = Path(raw_dir)
+        self.paths = discover_seasons(self.raw_dir)
+        self.max_cached_seasons = max(1, max_cached_seasons)
+        self._frames: OrderedDict[tuple[int, Optional[str]], "pd.DataFrame"] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def seasons(self) -> list[int]:
+        return list(self.paths)
+
+    def path(self, season: int) -> Path:
+        if season not in self.paths:
+            raise ValueError(f"season not found in {self.raw_dir}: {season} (have {self.seasons()})")
+        return self.paths[season]
+
+    def _select(self, seasons: Optional[Iterable[int]]) -> list[int]:
+        if seasons is None:
+            return self.seasons()
+        seasons = list(seasons)
+        for s in seasons:
+            self.path(s)  # validate: unknown seasons raise instead of being skipped
+        return seasons
+
+    def load_season(self, season: int, consumer: Optional[str] = None) -> "pd.DataFrame":
+        from playcall_intel.columns import read_pbp
+
+        key = (season, consumer)
+        with self._lock:
+            if key in self._frames:
+                self._frames.move_to_end(key)
+                return self._frames[key]
+
+        df = read_pbp(self.path(season), consumer)
+
+        with self._lock:
+            self._frames[key] = df
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_cached_seasons:
+                self._frames.popitem(last=False)
+        return df
+
+    def evict(self, season: Optional[int] = None) -> None:
+        with self._lock:
+            for key in [k for k in self._frames if season is None or k[0] == season]:
+                del self._frames[key]
+
+    def iter_season_frames(
+        self,
+        seasons: Optional[Iterable[int]] = None,
+        consumer: Optional[str] = None,
+    ) -> Iterator[tuple[int, "pd.DataFrame"]]:
+        """
+        One season at a time, not retained in the cache (batch jobs stream through history).
+        """
+        from playcall_intel.columns import read_pbp
+
+        for s in self._select(seasons):
+            with self._lock:
+                cached = self._frames.get((s, consumer))
+            yield s, cached if cached is not None else read_pbp(self.path(s), consumer)
+
+    def games_index(self, seasons: Optional[Iterable[int]] = None) -> "pd.DataFrame":
+        """
+        Concatenated one-row-per-game index; each season uses its own cached sidecar index.
+        """
+        import pandas as pd
+
+        from playcall_intel.game_index import GameIndexConfig, load_games_index
+
+        parts = [load_games_index(GameIndexConfig(raw_path=self.path(s))) for s in self._select(seasons)]
+        if not parts:
+            raise ValueError(f"No play_by_play_<season>.csv.gz files found in {self.raw_dir}")
+        games = pd.concat(parts, ignore_index=True)
+        return games.sort_values(["date_label", "game_id"]).reset_index(drop=True)
+
+    def load_game_df(self, game_id: str) -> "pd.DataFrame":
+        from playcall_intel.game_report import load_game_df
+
+        season = season_of_game(game_id)
+        if season is None or season not in self.paths:
+            raise ValueError(f"game_id not found: {game_id}")
+        with self._lock:
+            cached = self._frames.get((season, "report"))
+            if cached is None:
+                cached = self._frames.get((season, None))
+        return load_game_df(game_id, raw_path=self.path(season), season_df=cached)
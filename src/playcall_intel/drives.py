@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from playcall_intel.ingest import PlayStore
+from playcall_intel.tables import StoreTable, numeric
+
+
+DRIVE_COLUMNS = [
+    "game_id", "drive", "posteam", "start_qtr", "start_seconds_remaining", "start_yardline_100",
+    "end_yardline_100", "plays", "yards", "duration_s", "result",
+]
+
+def _drive_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Per-game drive number: fixed_drive (nflverse's corrected numbering), else drive,
+    else a new drive whenever posteam changes within the game.
+    """
+    for col in ["fixed_drive", "drive"]:
+        if col in df.columns and df[col].notna().any():
+            return pd.to_numeric(df[col], errors="coerce").ffill().fillna(0).astype("int64")
+    team = df["posteam"].astype(object)
+    new = (df["game_id"] != df["game_id"].shift()) | (team != team.shift())
+    return new.astype("int64").groupby(df["game_id"], sort=False).cumsum()
+
+
+def _flag(df: pd.DataFrame, col: str) -> np.ndarray:
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return numeric(df, col).to_numpy() > 0
+
+
+def _results_from_last_play(last: pd.DataFrame) -> np.ndarray:
+    # Same labels as nflverse fixed_drive_result
+    made_fg = (
+        last["field_goal_result"].astype(object).eq("made").to_numpy()
+        if "field_goal_result" in last.columns
+        else _flag(last, "field_goal_attempt")
+    )
+    down4 = numeric(last, "down").eq(4).to_numpy()
+    return np.select(
+        [
+            _flag(last, "touchdown") & ~_flag(last, "interception") & ~_flag(last, "fumble_lost"),
+            _flag(last, "interception") | _flag(last, "fumble_lost"),
+            _flag(last, "field_goal_attempt") & made_fg,
+            _flag(last, "field_goal_attempt"),
+            _flag(last, "punt_attempt"),
+            _flag(last, "safety"),
+            down4,
+        ],
+        ["Touchdown", "Turnover", "Field goal", "Missed field goal", "Punt", "Safety", "Turnover on downs"],
+        default="End of half",
+    )
+
+
+def drives_from_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drive table for every game in df in one vectorized pass (no per-game / per-row loops)
+
+    - Plays without a posteam (kickoffs, timeouts, end of quarter) don't belong to a drive
+    - result: fixed_drive_result when present, else derived from the drive's last play flags
+    """
+    if df.empty or "posteam" not in df.columns:
+        return pd.DataFrame(columns=DRIVE_COLUMNS)
+    order = ["game_id", "play_id"] if "play_id" in df.columns else ["game_id"]
+    plays = df[df["posteam"].notna()].sort_values(order, kind="stable").reset_index(drop=True)
+    if plays.empty:
+        return pd.DataFrame(columns=DRIVE_COLUMNS)
+
+    plays = plays.assign(_drive=_drive_keys(plays).to_numpy(), _yards=numeric(plays, "yards_gained"))
+    keys = ["game_id", "_drive"]
+    grouped = plays.groupby(keys, sort=False)
+    first, last = grouped.head(1).set_index(keys), grouped.tail(1).set_index(keys)
+
+    out = pd.DataFrame(index=first.index)
+    out["posteam"] = first["posteam"].astype(str)
+    out["start_qtr"] = numeric(first, "qtr", fill=np.nan)
+    out["start_seconds_remaining"] = numeric(first, "game_seconds_remaining", fill=np.nan)
+    out["start_yardline_100"] = numeric(first, "yardline_100", fill=np.nan)
+    out["end_yardline_100"] = numeric(last, "yardline_100", fill=np.nan)
+    out["plays"] = grouped.size()
+    out["yards"] = grouped["_yards"].sum()
+    out["duration_s"] = (out["start_seconds_remaining"] - numeric(last, "game_seconds_remaining", fill=np.nan)).clip(lower=0)
+    if "fixed_drive_result" in first.columns and first["fixed_drive_result"].notna().any():
+        derived = pd.Series(_results_from_last_play(last), index=last.index)
+        out["result"] = first["fixed_drive_result"].astype(object).fillna(derived)
+    else:
+        out["result"] = _results_from_last_play(last)
+
+    out = out.reset_index().rename(columns={"_drive": "drive"})
+    # Renumber 1..n per game so fallback / fixed_drive numbering look the same downstream
+    out["drive"] = out.groupby("game_id", sort=False).cumcount() + 1
+    return out[DRIVE_COLUMNS]
+
+
+DRIVE_TABLE = StoreTable(
+    "drives", "drives.csv", drives_from_df, sort_by=("game_id", "drive"),
+    dtype={"game_id": str, "posteam": str, "result": str},
+)
+
+
+def load_drive_table(raw_path: Path, use_cache: bool = True, store_dir: Optional[Path] = None) -> pd.DataFrame:
+    return DRIVE_TABLE.load(raw_path, use_cache, store_dir)
+
+
+def cached_game_drives(game_id: str, raw_path: Path, store_dir: Optional[Path] = None) -> Optional[pd.DataFrame]:
+    return DRIVE_TABLE.cached_game(game_id, raw_path, store_dir)
+
+
+def refresh_drive_table(raw_path: Path, store: PlayStore) -> int:
+    return DRIVE_TABLE.refresh(raw_path, store)
+
+
+def _field_position(yardline_100: float) -> str:
+    if pd.isna(yardline_100):
+        return "?"
+    yl = int(yardline_100)
+    if yl == 50:
+        return "50"
+    return f"own {100 - yl}" if yl > 50 else f"opp {yl}"
+
+
+def _clock(seconds: float) -> str:
+    if pd.isna(seconds):
+        return "?"
+    s = int(seconds)
+    return f"{s // 60}:{s % 60:02d}"
+
+
+def format_drive_chart(drives: pd.DataFrame) -> str:
+    if drives.empty:
+        return "_No drive data available._"
+    lines = [
+        "| # | Team | Q | Start | Plays | Yards | Time | Result |",
+        "|---:|---|---:|---|---:|---:|---:|---|",
+    ]
+    for r in drives.itertuples(index=False):
+        qtr = "?" if pd.isna(r.start_qtr) else int(r.start_qtr)
+        lines.append(
+            f"| {r.drive} | {r.posteam} | {qtr} | {_field_position(r.start_yardline_100)} | {int(r.plays)} | "
+            f"{int(r.yards)} | {_clock(r.duration_s)} | {r.result} |"
+        )
+    return "\n".join(lines)
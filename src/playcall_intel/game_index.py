@@ -2,15 +2,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import pandas as pd
 
+from playcall_intel.artifact_cache import is_fresh, mark_fresh, sidecar_path
+from playcall_intel.columns import read_pbp
+
 
 @dataclass(frozen=True)
 class GameIndexConfig:
     raw_path: Path = Path("data/raw/play_by_play_2025.csv.gz")
     max_games: Optional[int] = None  # leave None for full season
+    use_cache: bool = True  # reuse the sidecar index CSV while the raw file is unchanged
+    # None → just raw_path; "all" or (2023, 2024, ...) → play_by_play_<season>.csv.gz files next to raw_path
+    seasons: Union[None, str, tuple[int, ...]] = None
+
+
+def index_cache_path(raw_path: Path) -> Path:
+    return sidecar_path(raw_path, "games_index")
 
 
 def pick_date_col(cols: list[str]) -> Optional[str]:
@@ -35,9 +45,47 @@ def load_games_index(cfg: GameIndexConfig = GameIndexConfig()) -> pd.DataFrame:
       - game_id, home_team, away_team
       - date_label (best available)
       - match_label (for UI display: "<date> — AWAY @ HOME")
+
+    The index is cached next to the raw file; the full pbp parse only happens when it changed.
+    With cfg.seasons set, the per-season indexes are concatenated (one season parsed at a time).
     """
-    df = pd.read_csv(cfg.raw_path, compression="gzip", low_memory=False)
+    if cfg.seasons is not None:
+        from playcall_intel.dataset import Dataset
+
+        seasons = None if cfg.seasons == "all" else cfg.seasons
+        games = Dataset(cfg.raw_path.parent).games_index(seasons)
+        return games.head(cfg.max_games) if cfg.max_games is not None else games
+
+    cache_path = index_cache_path(cfg.raw_path)
+    if cfg.use_cache and is_fresh(cache_path, cfg.raw_path):
+        games = pd.read_csv(cache_path, dtype={"game_id": str, "date_label": str, "match_label": str})
+    else:
+        games = _build_games_index(cfg.raw_path)
+        if cfg.use_cache:
+            try:
+                games.to_csv(cache_path, index=False)
+                mark_fresh(cache_path, cfg.raw_path)
+            except OSError:
+                pass  # read-only data dir: still serve the freshly built index
+
+    # Optional: limit (useful if performance ever annoys you)
+    if cfg.max_games is not None:
+        games = games.head(cfg.max_games)
+
+    # Sort for stable UI ordering
+    games = games.sort_values(["date_label", "game_id"]).reset_index(drop=True)
+    return games
+
 
+def _build_games_index(raw_path: Path) -> pd.DataFrame:
+    df = read_pbp(raw_path, "games_index")
+    return games_index_from_df(df)
+
+
+def games_index_from_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One-row-per-game index from an already-loaded pbp frame (first-appearance order, unsorted).
+    """
     required = {"game_id", "home_team", "away_team"}
     missing = required - set(df.columns)
     if missing:
@@ -71,14 +119,30 @@ def load_games_index(cfg: GameIndexConfig = GameIndexConfig()) -> pd.DataFrame:
         lambda r: f"{r['date_label']} — {r['away_team']} @ {r['home_team']}",
         axis=1,
     )
+    return games.reset_index(drop=True)
 
-    # Optional: limit (useful if performance ever annoys you)
-    if cfg.max_games is not None:
-        games = games.head(cfg.max_games)
 
-    # Sort for stable UI ordering
-    games = games.sort_values(["date_label", "game_id"]).reset_index(drop=True)
-    return games
+def update_games_index(raw_path: Path, game_frames: dict[str, Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """
+    Patch the cached index in place for a handful of games (watch / ingest path)
+
+    - game_frames maps game_id → that game's plays, or None when the game was removed
+    - Falls back to a full rebuild when there is no cache to patch
+    """
+    cache_path = index_cache_path(raw_path)
+    if not cache_path.exists():
+        return load_games_index(GameIndexConfig(raw_path=raw_path, use_cache=True))
+
+    games = pd.read_csv(cache_path, dtype={"game_id": str, "date_label": str, "match_label": str})
+    games = games[~games["game_id"].isin(list(game_frames))]
+
+    frames = [f for f in game_frames.values() if f is not None and not f.empty]
+    if frames:
+        games = pd.concat([games, games_index_from_df(pd.concat(frames, ignore_index=True))], ignore_index=True)
+
+    games.to_csv(cache_path, index=False)
+    mark_fresh(cache_path, raw_path)
+    return games.sort_values(["date_label", "game_id"]).reset_index(drop=True)
 
 
 def list_teams(games: pd.DataFrame) -> list[str]:
@@ -2,8 +2,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
-from playcall_intel.client_factory import get_llm_client
-from playcall_intel.recap_generate import generate_game_recap_v1
+from playcall_intel.columns import read_pbp
+from playcall_intel.dataset import season_path_for_game
+from playcall_intel.drives import cached_game_drives, drives_from_df, format_drive_chart
+from playcall_intel.highlights import GameHighlights, cached_game_highlights, highlights_from_df
+from playcall_intel.ingest import PlayStore, default_store_dir
+from playcall_intel.llm_scheduler import INTERACTIVE
+from playcall_intel.players import cached_game_players, format_player_stats, player_stats_from_df
+from playcall_intel.seek_index import SeekIndex
+from playcall_intel.metrics import RunMetrics
 import pandas as pd
 
 
@@ -52,8 +59,32 @@ def _safe_int(x) -> int:
         return 0
 
 
-def load_game_df(game_id: str) -> pd.DataFrame:
-    df = pd.read_csv(RAW_PATH, compression="gzip", low_memory=False)
+def load_game_df(
+    game_id: str,
+    raw_path: Path = RAW_PATH,
+    season_df: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    All plays for one game in chronological order.
+
+    Pass an already-loaded season frame (e.g. from the report service) to skip the CSV parse.
+    When an up-to-date ingest store exists, only that game's partition is read.
+    Otherwise a fresh seek index (seek_index.py) decompresses just that game's gzip block.
+    Games from other seasons are routed to play_by_play_<season>.csv.gz next to raw_path.
+    """
+    if season_df is not None:
+        df = season_df
+    else:
+        raw_path = season_path_for_game(game_id, raw_path)
+        store = PlayStore(default_store_dir(raw_path))
+        if store.is_current(raw_path):
+            df = store.load_game(game_id, consumer="report")
+        else:
+            index = SeekIndex.open(raw_path)
+            if index is not None and game_id in index:
+                df = index.load_game_df(game_id, consumer="report")
+            else:
+                df = read_pbp(raw_path, "report")
     g = df[df["game_id"] == game_id].copy()
     if g.empty:
         raise ValueError(f"game_id not found: {game_id}")
@@ -63,8 +94,9 @@ def load_game_df(game_id: str) -> pd.DataFrame:
     return g
 
 
-def compute_box_score(game_id: str) -> BoxScore:
-    g = load_game_df(game_id)
+def compute_box_score(game_id: str, raw_path: Path = RAW_PATH, g: Optional[pd.DataFrame] = None) -> BoxScore:
+    if g is None:
+        g = load_game_df(game_id, raw_path)
 
     # Teams
     home_team = str(g["home_team"].dropna().iloc[0])
@@ -193,7 +225,7 @@ def top_wpa_plays_by_team(g: pd.DataFrame, team: str, n: int = 3) -> list[tuple[
     if t.empty:
         return []
 
-    top = t.sort_values("wpa", ascending=False).head(n)
+    top = t.nlargest(n, "wpa")
     return [(float(r["wpa"]), str(r["desc"])) for _, r in top.iterrows()]
 
 def _fmt_wpa_list(items: list[tuple[float, str]]) -> str:
@@ -202,47 +234,106 @@ def _fmt_wpa_list(items: list[tuple[float, str]]) -> str:
     return "\n".join([f"- **{wpa:+.3f} WPA** — {desc}" for wpa, desc in items])
 
 
-def write_game_report(game_id: str) -> Path:
+@dataclass(frozen=True)
+class ReportParts:
+    """
+    Everything in a game report except the recap (all deterministic and cheap to compute)
+    """
+
+    game_id: str
+    bs: BoxScore
+    highlights: list[str]  # top |WPA| swings handed to the recap
+    away_wpa_md: str
+    home_wpa_md: str
+    players_md: str
+    drive_md: str
+
+
+def assemble_report_parts(
+    game_id: str,
+    metrics: Optional[RunMetrics] = None,
+    raw_path: Path = RAW_PATH,
+    g: Optional[pd.DataFrame] = None,
+    hl: Optional[GameHighlights] = None,
+    drives: Optional[pd.DataFrame] = None,
+    players: Optional[pd.DataFrame] = None,
+) -> ReportParts:
+    """
+    Box score + highlights + player lines + drive chart for one game (no LLM call)
+
+    - Highlights come from the precomputed season index when it's fresh (O(k) lookup),
+      otherwise from the same grouped top-k pass over just this game
+    - Drives likewise come from the persisted season drive table, else are segmented from g
+    - Player lines come from the season player table, else are aggregated from g
+    """
+    m = metrics if metrics is not None else RunMetrics("game_report")
+
     # Load the full game play stream (for highlights) and compute the box score (source of truth)
-    g = load_game_df(game_id)
-    bs = compute_box_score(game_id)
-
-    # Top WPA plays per team (offense)
-    away_top_wpa = top_wpa_plays_by_team(g, bs.away_team, n=3)
-    home_top_wpa = top_wpa_plays_by_team(g, bs.home_team, n=3)
-
-    away_wpa_md = _fmt_wpa_list(away_top_wpa)
-    home_wpa_md = _fmt_wpa_list(home_top_wpa)
-
-    # High-signal highlights for the LLM recap (top |WPA| swings)
-    highlights: list[str] = []
-    if {"wpa", "desc"}.issubset(g.columns):
-        highlights = (
-            g.dropna(subset=["wpa", "desc"])
-            .assign(abs_wpa=lambda x: x["wpa"].abs())
-            .sort_values("abs_wpa", ascending=False)
-            .head(10)["desc"]
-            .astype(str)
-            .tolist()
-        )
+    if g is None:
+        with m.stage("csv_load"):
+            g = load_game_df(game_id, raw_path)
+    with m.stage("box_score"):
+        bs = compute_box_score(game_id, raw_path, g=g)
+
+    with m.stage("highlights"):
+        if hl is None:
+            hl = cached_game_highlights(game_id, season_path_for_game(game_id, raw_path))
+        if hl is None:
+            hl = highlights_from_df(g).get(game_id, GameHighlights(game_id=game_id))
+
+    with m.stage("drives"):
+        if drives is None:
+            drives = cached_game_drives(game_id, season_path_for_game(game_id, raw_path))
+        if drives is None or drives.empty:
+            drives = drives_from_df(g)
+
+    with m.stage("players"):
+        if players is None:
+            players = cached_game_players(game_id, season_path_for_game(game_id, raw_path))
+        if players is None or players.empty:
+            players = player_stats_from_df(g)
+
+    return ReportParts(
+        game_id=game_id,
+        bs=bs,
+        # High-signal highlights for the LLM recap (top |WPA| swings)
+        highlights=hl.swings[:10],
+        # Top WPA plays per team (offense)
+        away_wpa_md=_fmt_wpa_list(hl.team_top(bs.away_team, n=3)),
+        home_wpa_md=_fmt_wpa_list(hl.team_top(bs.home_team, n=3)),
+        players_md=format_player_stats(players, [bs.away_team, bs.home_team]),
+        drive_md=format_drive_chart(drives),
+    )
 
-    # Default recap (rules-only) in case the LLM call fails
-    recap_text = make_brief_summary(bs)
 
-    # Try LLM recap (2 paragraphs) using ONLY stats + highlights
+def generate_recap_text(
+    parts: ReportParts,
+    metrics: Optional[RunMetrics] = None,
+    priority: str = INTERACTIVE,
+) -> str:
+    """
+    Two-paragraph LLM recap from ONLY stats + highlights; the rules summary if the LLM fails.
+    """
+    m = metrics if metrics is not None else RunMetrics("game_report")
     try:
+        # Deferred: the LLM stack (pydantic, dotenv, HTTP client) is only needed for the recap
+        from playcall_intel.client_factory import get_llm_client
+        from playcall_intel.recap_generate import generate_game_recap_v1
+
         client = get_llm_client()
-        recap = generate_game_recap_v1(bs, highlights, client)
-        recap_text = f"{recap.paragraph_1}\n\n{recap.paragraph_2}"
+        recap = generate_game_recap_v1(parts.bs, parts.highlights, client, metrics=m, priority=priority)
+        m.incr("recap_llm")
+        return f"{recap.paragraph_1}\n\n{recap.paragraph_2}"
     except Exception as e:
         # Keep the report reliable — never fail the whole report for narrative generation
+        m.incr("recap_fallback")
         print(f"[recap] LLM unavailable → using rules summary: {type(e).__name__}: {e}")
-        pass
+        return make_brief_summary(parts.bs)
 
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
-    out_path = OUT_DIR / f"{game_id}.md"
 
-    md = f"""# Game Report: {bs.away_team} @ {bs.home_team}
+def render_report_md(parts: ReportParts, recap_text: str) -> str:
+    bs = parts.bs
+    return f"""# Game Report: {bs.away_team} @ {bs.home_team}
 
 ## Final
 **{bs.away_team} {bs.away_score} — {bs.home_team} {bs.home_score}**
@@ -259,15 +350,60 @@ def write_game_report(game_id: str) -> Path:
 ## Top WPA plays (offense)
 
 ### {bs.away_team} — top 3
-{away_wpa_md}
+{parts.away_wpa_md}
 
 ### {bs.home_team} — top 3
-{home_wpa_md}
+{parts.home_wpa_md}
+
+## Player stats
+{parts.players_md}
+
+## Drive chart
+{parts.drive_md}
 """
-    out_path.write_text(md, encoding="utf-8")
+
+
+def finish_game_report(
+    parts: ReportParts,
+    out_dir: Path = OUT_DIR,
+    metrics: Optional[RunMetrics] = None,
+    priority: str = INTERACTIVE,
+) -> Path:
+    """
+    Recap + write for already-assembled parts (the slow half of write_game_report).
+    """
+    m = metrics if metrics is not None else RunMetrics("game_report")
+    md = render_report_md(parts, generate_recap_text(parts, metrics=m, priority=priority))
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / f"{parts.game_id}.md"
+    with m.stage("write"):
+        out_path.write_text(md, encoding="utf-8")
     return out_path
 
 
+def write_game_report(
+    game_id: str,
+    metrics: Optional[RunMetrics] = None,
+    raw_path: Path = RAW_PATH,
+    out_dir: Path = OUT_DIR,
+    g: Optional[pd.DataFrame] = None,
+    hl: Optional[GameHighlights] = None,
+    drives: Optional[pd.DataFrame] = None,
+    players: Optional[pd.DataFrame] = None,
+) -> Path:
+    """
+    Box score + highlights + recap → reports/games/<game_id>.md
+
+    - assemble_report_parts (stats, cached tables) then finish_game_report (LLM recap, write)
+    """
+    m = metrics if metrics is not None else RunMetrics("game_report")
+    parts = assemble_report_parts(game_id, metrics=m, raw_path=raw_path, g=g, hl=hl, drives=drives, players=players)
+    return finish_game_report(parts, out_dir=out_dir, metrics=m)
+
+
+
 if __name__ == "__main__":
     # Convenient default for quick manual runs:
     # python -m playcall_intel.game_report  (after setting GAME_ID env var)
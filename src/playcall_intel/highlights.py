@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from playcall_intel.artifact_cache import is_fresh, mark_fresh, sidecar_path
+from playcall_intel.columns import read_pbp
+
+
+TEAM_TOP_K = 3     # "Top WPA plays (offense)" per team in the report
+SWING_TOP_K = 10   # top |WPA| plays handed to the LLM recap
+
+
+@dataclass
+class GameHighlights:
+    game_id: str
+    by_team: dict[str, list[tuple[float, str]]] = field(default_factory=dict)  # posteam → [(wpa, desc)] desc
+    swings: list[str] = field(default_factory=list)                             # descs by |wpa| desc
+
+    def team_top(self, team: str, n: int = TEAM_TOP_K) -> list[tuple[float, str]]:
+        return self.by_team.get(team, [])[:n]
+
+
+def highlight_index_path(raw_path: Path) -> Path:
+    return sidecar_path(raw_path, "highlights", "json")
+
+
+def highlights_from_df(
+    df: pd.DataFrame,
+    team_k: int = TEAM_TOP_K,
+    swing_k: int = SWING_TOP_K,
+) -> dict[str, GameHighlights]:
+    """
+    Top-k WPA plays per (game, posteam) and top-|WPA| swings per game for every game in df
+
+    - One grouped pass each, using nlargest (partial selection) instead of sorting whole games
+    - Same rows as the per-request sort + head(k) it replaces (ties keep file order)
+    """
+    out = {str(gid): GameHighlights(game_id=str(gid)) for gid in df["game_id"].unique()}
+    if not {"wpa", "desc"}.issubset(df.columns):
+        return out
+
+    cols = [c for c in ["game_id", "posteam", "wpa", "desc"] if c in df.columns]
+    plays = df.loc[df["wpa"].notna() & df["desc"].notna(), cols]
+    if plays.empty:
+        return out
+
+    if "posteam" in plays.columns:
+        offense = plays[plays["posteam"].notna()]
+        top = offense.groupby(["game_id", "posteam"], sort=False, observed=True)["wpa"].nlargest(team_k)
+        for (gid, team, idx), wpa in top.items():
+            out[str(gid)].by_team.setdefault(str(team), []).append((float(wpa), str(plays.at[idx, "desc"])))
+
+    swings = plays["wpa"].abs().groupby(plays["game_id"], sort=False).nlargest(swing_k)
+    for (gid, idx), _ in swings.items():
+        out[str(gid)].swings.append(str(plays.at[idx, "desc"]))
+    return out
+
+
+def _to_json(index: dict[str, GameHighlights]) -> str:
+    return json.dumps({gid: {"by_team": h.by_team, "swings": h.swings} for gid, h in index.items()})
+
+
+def _from_json(text: str) -> dict[str, GameHighlights]:
+    return {
+        gid: GameHighlights(
+            game_id=gid,
+            by_team={t: [(float(w), str(d)) for w, d in items] for t, items in v["by_team"].items()},
+            swings=list(v["swings"]),
+        )
+        for gid, v in json.loads(text).items()
+    }
+
+
+# Parsed sidecars per (path, size, mtime) so repeated lookups don't re-read the JSON
+_PARSED: dict[tuple[str, int, int], dict[str, GameHighlights]] = {}
+_LOCK = threading.Lock()
+
+
+def _read_index(path: Path) -> dict[str, GameHighlights]:
+    st = path.stat()
+    key = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+    with _LOCK:
+        if key in _PARSED:
+            return _PARSED[key]
+    index = _from_json(path.read_text(encoding="utf-8"))
+    with _LOCK:
+        _PARSED.clear()  # one season's index at a time is plenty
+        _PARSED[key] = index
+    return index
+
+
+def _write_index(raw_path: Path, index: dict[str, GameHighlights]) -> None:
+    path = highlight_index_path(raw_path)
+    path.write_text(_to_json(index), encoding="utf-8")
+    mark_fresh(path, raw_path)
+
+
+def load_highlight_index(raw_path: Path, use_cache: bool = True) -> dict[str, GameHighlights]:
+    """
+    Season-wide highlight index, cached next to the raw file like the game index
+
+    - Built from the "highlights" column manifest only when the raw file changed
+    """
+    raw_path = Path(raw_path)
+    path = highlight_index_path(raw_path)
+    if use_cache and is_fresh(path, raw_path):
+        return _read_index(path)
+
+    index = highlights_from_df(read_pbp(raw_path, "highlights"))
+    if use_cache:
+        try:
+            _write_index(raw_path, index)
+        except OSError:
+            pass  # read-only data dir
+    return index
+
+
+def cached_game_highlights(game_id: str, raw_path: Path) -> Optional[GameHighlights]:
+    """
+    One game's highlights from a fresh sidecar index, or None (never triggers a season parse).
+    """
+    path = highlight_index_path(raw_path)
+    if not is_fresh(path, raw_path):
+        return None
+    return _read_index(path).get(game_id)
+
+
+def update_highlight_index(raw_path: Path, game_frames: dict[str, Optional[pd.DataFrame]]) -> None:
+    """
+    Patch the cached index for a handful of games (watch path); no-op when nothing is cached yet.
+    """
+    path = highlight_index_path(raw_path)
+    if not path.exists():
+        return
+    index = dict(_read_index(path))
+    for gid, frame in game_frames.items():
+        index.pop(gid, None)
+        if frame is not None and not frame.empty:
+            index.update(highlights_from_df(frame))
+    _write_index(raw_path, index)
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from playcall_intel.artifact_cache import raw_fingerprint
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Everything derived from game-level plays; ingest marks the affected games dirty in each
+DERIVED_ARTIFACTS = (
+    "game_index", "box_scores", "reports", "normalized_plays", "search", "drives", "players", "rollups", "team_games",
+)
+
+MANIFEST_VERSION = 1
+
+
+def default_store_dir(raw_path: str | Path) -> Path:
+    """
+    data/raw/play_by_play_2025.csv.gz → <processed_data_dir>/store/play_by_play_2025
+    """
+    from playcall_intel.settings import get_settings
+
+    name = Path(raw_path).name.removesuffix(".gz").removesuffix(".csv")
+    return Path(get_settings().processed_data_dir) / "store" / name
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class PlayStore:
+    """
+    Game-partitioned copy of a raw pbp file plus a manifest of what's in it
+
+    - One gzipped CSV per game_id, so a weekly refresh rewrites only the games that changed
+    - Manifest keeps row counts + content hashes per game (the change-detection baseline)
+    - Manifest also tracks which derived artifacts are dirty for which games
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.games_dir = self.root / "games"
+        self.manifest_path = self.root / "manifest.json"
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        if self.manifest_path.exists():
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        return {
+            "version": MANIFEST_VERSION,
+            "source": None,
+            "header": None,
+            "games": {},
+            "dirty": {a: [] for a in DERIVED_ARTIFACTS},
+        }
+
+    def save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_text_atomic(self.manifest_path, json.dumps(self.manifest, indent=1, sort_keys=True))
+
+    def game_path(self, game_id: str) -> Path:
+        return self.games_dir / f"{game_id}.csv.gz"
+
+    def game_ids(self) -> list[str]:
+        return sorted(self.manifest["games"])
+
+    def has_game(self, game_id: str) -> bool:
+        return game_id in self.manifest["games"] and self.game_path(game_id).exists()
+
+    def is_current(self, raw_path: str | Path) -> bool:
+        """
+        True when the store reflects the raw file as it is on disk right now.
+        """
+        p = Path(raw_path)
+        return p.exists() and self.manifest.get("source") == raw_fingerprint(p)
+
+    def load_game(self, game_id: str, consumer: Optional[str] = None) -> "pd.DataFrame":
+        from playcall_intel.columns import read_pbp
+
+        if not self.has_game(game_id):
+            raise ValueError(f"game_id not found: {game_id}")
+        return read_pbp(self.game_path(game_id), consumer)
+
+    # -- derived-artifact bookkeeping -------------------------------------------------------
+
+    def dirty(self, artifact: str) -> set[str]:
+        return set(self.manifest["dirty"].get(artifact, []))
+
+    def mark_dirty(self, game_ids: Iterable[str], artifacts: Iterable[str] = DERIVED_ARTIFACTS) -> None:
+        ids = set(game_ids)
+        for a in artifacts:
+            self.manifest["dirty"][a] = sorted(set(self.manifest["dirty"].get(a, [])) | ids)
+
+    def mark_clean(self, artifact: str, game_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Consumers call this after rebuilding; None clears every dirty game for the artifact.
+        """
+        if game_ids is None:
+            self.manifest["dirty"][artifact] = []
+        else:
+            done = set(game_ids)
+            self.manifest["dirty"][artifact] = sorted(self.dirty(artifact) - done)
+        self.save()
+
+
+@dataclass
+class IngestResult:
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    rows_written: int = 0
+    seconds: float = 0.0
+
+    @property
+    def touched(self) -> list[str]:
+        return sorted(self.added + self.changed + self.removed)
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.added)} added, {len(self.changed)} changed, {len(self.removed)} removed, "
+            f"{len(self.unchanged)} unchanged; wrote {self.rows_written} rows in {self.seconds:.1f}s"
+        )
+
+
+def _write_partition(path: Path, header: list[str], rows: list[list[str]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with gzip.open(tmp, mode="wt", encoding="utf-8", newline="", compresslevel=5) as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
+    os.replace(tmp, path)
+
+
+def ingest(raw_path: str | Path, store: Optional[PlayStore] = None) -> IngestResult:
+    """
+    Bring the store up to date with a (usually superset) raw pbp file
+
+    - Streams the raw file once with the stdlib csv reader, hashing rows per game
+    - Only one game's rows are buffered at a time; unchanged games are never written
+    - Assumes rows are grouped by game_id (nflverse files are); raises if a game reappears
+    - Added/changed/removed games are marked dirty in every derived artifact
+    """
+    t0 = time.perf_counter()
+    raw = Path(raw_path)
+    store = store if store is not None else PlayStore(default_store_dir(raw))
+    known = store.manifest["games"]
+    result = IngestResult()
+
+    with gzip.open(raw, mode="rt", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        if "game_id" not in header:
+            raise ValueError("Missing required column in pbp file: game_id")
+        gid_pos = header.index("game_id")
+        header_bytes = "\x1f".join(header).encode("utf-8")
+
+        seen: set[str] = set()
+        current: Optional[str] = None
+        buf: list[list[str]] = []
+        hasher = hashlib.blake2b(header_bytes, digest_size=16)
+
+        def close_game() -> None:
+            if current is None:
+                return
+            digest = hasher.hexdigest()
+            prev = known.get(current)
+            if prev is not None and prev["hash"] == digest and store.game_path(current).exists():
+                result.unchanged.append(current)
+                return
+            _write_partition(store.game_path(current), header, buf)
+            result.rows_written += len(buf)
+            (result.changed if prev is not None else result.added).append(current)
+            known[current] = {"rows": len(buf), "hash": digest, "ingested_at": time.time()}
+
+        for row in reader:
+            gid = row[gid_pos]
+            if gid != current:
+                close_game()
+                if gid in seen:
+                    raise ValueError(f"Raw file is not grouped by game_id ({gid} appears twice)")
+                seen.add(gid)
+                current, buf = gid, []
+                hasher = hashlib.blake2b(header_bytes, digest_size=16)
+            buf.append(row)
+            hasher.update("\x1f".join(row).encode("utf-8"))
+            hasher.update(b"\x1e")
+        close_game()
+
+    for gid in sorted(set(known) - seen):
+        result.removed.append(gid)
+        del known[gid]
+        store.game_path(gid).unlink(missing_ok=True)
+
+    store.mark_dirty(result.touched)
+    store.manifest["source"] = raw_fingerprint(raw)
+    store.manifest["source_path"] = str(raw)
+    store.manifest["header"] = header
+    store.save()
+
+    result.seconds = time.perf_counter() - t0
+    return result
+
+
+def rebuild_store(raw_path: str | Path, store_dir: Optional[Path] = None) -> IngestResult:
+    """
+    Drop the store and ingest from scratch (schema changes, corrupted partitions).
+    """
+    root = store_dir if store_dir is not None else default_store_dir(raw_path)
+    if Path(root).exists():
+        shutil.rmtree(root)
+    return ingest(raw_path, PlayStore(root))
@@ -1,8 +1,13 @@
+from __future__ import annotations
+
+import asyncio
 import json
+import time
 from dataclasses import dataclass
-from typing import Optional, Protocol
+from typing import TYPE_CHECKING, Optional, Protocol
 
-from playcall_intel.llm_contract import LLMNormalizationV1
+if TYPE_CHECKING:
+    from playcall_intel.llm_contract import LLMNormalizationV1
 
 
 class LLMClient(Protocol):
@@ -17,6 +22,18 @@ class LLMClient(Protocol):
     def complete_json(self, prompt: str) -> str: ...
 
 
+class AsyncLLMClient(Protocol):
+    """
+    The same contract for event-loop callers
+
+    - One coroutine per in-flight request instead of one thread, so a batch can keep thousands
+      of prompts queued on a single loop (the LLM scheduler still decides how many run)
+    - Clients implement both methods; callers pick the one that matches how they run
+    """
+
+    async def acomplete_json(self, prompt: str) -> str: ...
+
+
 @dataclass
 class MockLLMClient:
     """
@@ -25,13 +42,25 @@ class MockLLMClient:
     - Returns valid JSON that matches LLMNormalizationV1
     - Keeps demos/test runs predictable while plumbing evolves
     - Acts as the default until real model integration is added
+    - latency_s simulates a model round trip (sleep / asyncio.sleep) for concurrency tests
     """
 
     fixed_play_type: str = "other"
     fixed_result: str = "other"
     fixed_yards_gained: Optional[int] = None
+    latency_s: float = 0.0
 
     def complete_json(self, prompt: str) -> str:
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+        return self._payload()
+
+    async def acomplete_json(self, prompt: str) -> str:
+        if self.latency_s > 0:
+            await asyncio.sleep(self.latency_s)
+        return self._payload()
+
+    def _payload(self) -> str:
         # Prompt is intentionally unused in mock mode (determinism > realism)
         payload = {
             "play_type": self.fixed_play_type,
@@ -41,6 +70,9 @@ class MockLLMClient:
         return json.dumps(payload)
 
     def complete_and_validate(self, prompt: str) -> LLMNormalizationV1:
+        # Deferred so importing the client protocol doesn't pull in pydantic
+        from playcall_intel.llm_contract import LLMNormalizationV1
+
         raw = self.complete_json(prompt)
         data = json.loads(raw)
         return LLMNormalizationV1(**data)
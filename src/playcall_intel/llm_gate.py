@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from playcall_intel.llm_scheduler import BATCH, INTERACTIVE, PRIORITIES
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock → process-local scheduling only
+    fcntl = None
+
+
+class SlotGate:
+    """
+    Host-wide LLM call slots shared by every process pointed at the same directory
+
+    - The batch CLI, the Streamlit app and the report service are separate processes; each one's
+      LLMScheduler orders its own callers, and this gate bounds what all of them send together
+    - One lock file per slot, held with a non-blocking flock: released on close or when the process
+      dies, so a crashed run never leaks a slot
+    - Slot 0 is reserved for interactive calls (batch gets slots - 1, at least one), and batch
+      callers step back while an interactive caller anywhere is waiting for a slot
+    """
+
+    def __init__(self, root: str | Path, slots: int, poll_s: float = 0.01) -> None:
+        if slots < 1:
+            raise ValueError(f"slots must be >= 1, got {slots}")
+        self.root = Path(root)
+        self.slots = slots
+        self.poll_s = poll_s
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _open(self, name: str) -> int:
+        return os.open(self.root / name, os.O_RDWR | os.O_CREAT, 0o666)
+
+    def _interactive_waiting(self) -> bool:
+        fd = self._open("interactive.lock")
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return False
+        except BlockingIOError:
+            return True
+        finally:
+            os.close(fd)  # also drops the probe lock
+
+    def _announce(self) -> int:
+        # Shared lock held for as long as an interactive caller waits; batch probes for it
+        fd = self._open("interactive.lock")
+        fcntl.flock(fd, fcntl.LOCK_SH)
+        return fd
+
+    def try_acquire(self, priority: str = BATCH) -> Optional[int]:
+        """
+        A held slot's descriptor (close it to release), or None when every usable slot is taken.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"unknown priority class: {priority!r} (expected one of {PRIORITIES})")
+        if priority == BATCH and self._interactive_waiting():
+            return None
+        first = 1 if priority == BATCH and self.slots > 1 else 0
+        for i in range(first, self.slots):
+            fd = self._open(f"slot-{i}.lock")
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except BlockingIOError:
+                os.close(fd)
+        return None
+
+    def acquire(self, priority: str = BATCH) -> int:
+        """
+        Block until a slot is free; returns its descriptor for release().
+        """
+        fd, intent = self.try_acquire(priority), None
+        try:
+            while fd is None:
+                if priority == INTERACTIVE and intent is None:
+                    intent = self._announce()
+                time.sleep(self.poll_s)
+                fd = self.try_acquire(priority)
+        finally:
+            if intent is not None:
+                os.close(intent)
+        return fd
+
+    async def aacquire(self, priority: str = BATCH) -> int:
+        """
+        acquire() for coroutines: polls with asyncio.sleep instead of blocking the loop.
+        """
+        fd, intent = self.try_acquire(priority), None
+        try:
+            while fd is None:
+                if priority == INTERACTIVE and intent is None:
+                    intent = self._announce()
+                await asyncio.sleep(self.poll_s)
+                fd = self.try_acquire(priority)
+        finally:
+            if intent is not None:
+                os.close(intent)
+        return fd
+
+    def release(self, fd: int) -> None:
+        os.close(fd)  # closing the descriptor drops the flock
+
+    def held(self) -> int:
+        """
+        Slots currently held by any process (probed, so only a snapshot).
+        """
+        busy = 0
+        for i in range(self.slots):
+            fd = self._open(f"slot-{i}.lock")
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                busy += 1
+            finally:
+                os.close(fd)
+        return busy
+
+
+def default_gate(slots: int) -> Optional[SlotGate]:
+    """
+    The gate under LLM_GATE_DIR (default <processed_data_dir>/llm_gate); None when disabled or unsupported.
+    """
+    from playcall_intel.settings import get_settings
+
+    root = get_settings().llm_gate_dir
+    if fcntl is None or not root or root.lower() in {"0", "off", "none"}:
+        return None
+    try:
+        return SlotGate(root, slots)
+    except OSError:
+        return None  # unwritable data dir → process-local scheduling only
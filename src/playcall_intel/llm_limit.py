@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+HISTORY_LEN = 500
+
+
+@dataclass
+class AdaptiveLimit:
+    """
+    AIMD concurrency limit for the model server, driven by observed call latency
+
+    - Baseline is what an unloaded call costs: it drops to any faster success at once and drifts up slowly
+    - A call within tolerance × baseline while the limit was saturated → +1/limit (about +1 per round)
+    - A slower call or an error/timeout → limit × backoff, at most once per baseline interval so one
+      burst of slow responses counts as one signal
+    - Every change of the integer limit is kept in history (and printed when log=True)
+    """
+
+    initial: int = 2
+    min_limit: int = 1
+    max_limit: int = 8
+    tolerance: float = 1.5
+    backoff: float = 0.75
+    alpha: float = 0.01
+    log: bool = True
+    history: list[tuple[float, int, str]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.min_limit <= self.initial <= self.max_limit:
+            raise ValueError(
+                f"need 1 <= min_limit <= initial <= max_limit, got {self.min_limit}/{self.initial}/{self.max_limit}"
+            )
+        self._limit = float(self.initial)
+        self._baseline: Optional[float] = None
+        self._last_drop = float("-inf")
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self.history.append((0.0, self.initial, "initial"))
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def baseline_s(self) -> Optional[float]:
+        return self._baseline
+
+    def on_sample(self, latency_s: float, ok: bool, saturated: bool) -> None:
+        """
+        Feed one finished call: its latency, whether it succeeded, and whether the limit was full when it started.
+        """
+        with self._lock:
+            before = self.limit
+            now = time.perf_counter()
+            reason = ""
+            if not ok:
+                reason = self._decrease(now, "error")
+            elif self._baseline is None:
+                self._baseline = latency_s
+            else:
+                slow = latency_s > self.tolerance * self._baseline
+                if slow:
+                    reason = self._decrease(now, f"latency {latency_s:.2f}s > {self.tolerance:g}× {self._baseline:.2f}s")
+                elif saturated:
+                    # Only grow when the limit was actually the constraint
+                    self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+                    reason = f"latency stable at {latency_s:.2f}s"
+                # Faster calls lower the baseline at once; slower ones lift it only slowly, so a
+                # sustained shift (e.g. longer prompts) is absorbed but creeping queueing is not
+                if latency_s < self._baseline:
+                    self._baseline = latency_s
+                else:
+                    self._baseline += self.alpha * (latency_s - self._baseline)
+            if self.limit != before:
+                self._record(now, before, reason)
+
+    def _decrease(self, now: float, reason: str) -> str:
+        if now - self._last_drop < (self._baseline or 0.0):
+            return ""
+        self._last_drop = now
+        self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        return reason
+
+    def _record(self, now: float, before: int, reason: str) -> None:
+        self.history.append((round(now - self._t0, 3), self.limit, reason))
+        if len(self.history) > 2 * HISTORY_LEN:
+            del self.history[:-HISTORY_LEN]
+        if self.log:
+            print(f"[llm-limit] {before} → {self.limit} ({reason})")
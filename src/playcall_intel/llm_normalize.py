@@ -1,10 +1,13 @@
 import json
+import time
 
-from playcall_intel.llm_client import LLMClient
+from playcall_intel.llm_client import AsyncLLMClient, LLMClient
 from playcall_intel.llm_contract import LLMNormalizationV1
+from playcall_intel.llm_scheduler import BATCH, LLMScheduler, get_scheduler
+from playcall_intel.metrics import RunMetrics
 from playcall_intel.prompting import build_prompt_v1
 from playcall_intel.schema import Play
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 VALID_PLAY_TYPES = {
     "run", "pass", "qb_kneel", "qb_spike", "kickoff", "punt",
     "field_goal", "extra_point", "two_point_attempt", "penalty",
@@ -45,20 +48,74 @@ def repair_llm_output(data: Dict[str, Any]) -> Dict[str, Any]:
 
     return data
 
-def normalize_with_llm_v1(play: Play, client: LLMClient) -> LLMNormalizationV1:
+def normalize_with_llm_v1(
+    play: Play,
+    client: LLMClient,
+    metrics: Optional[RunMetrics] = None,
+    priority: str = BATCH,
+    scheduler: Optional[LLMScheduler] = None,
+) -> LLMNormalizationV1:
     """
     LLM-assisted normalization pass (v1)
 
     - Build a deterministic JSON-only prompt from the Play object
     - Validate the model output against a strict contract before using it
     - Keeps AI output as data, not free-form text
+    - Optional metrics record prompt/LLM/validation timings and the repair rate
+    - The model call waits its turn in the shared LLM scheduler (batch class by default,
+      one fair-queue tenant per run)
     """
-    prompt = build_prompt_v1(play)
-    raw_json = client.complete_json(prompt)
+    m = metrics if metrics is not None else RunMetrics("normalize")
 
-    data = json.loads(raw_json)
-    data = repair_llm_output(data)
-    return LLMNormalizationV1(**data)
+    with m.stage("prompt_build"):
+        prompt = build_prompt_v1(play)
+
+    sched = scheduler if scheduler is not None else get_scheduler()
+    with m.stage("llm"):
+        with sched.slot(priority, tenant=m.run_name) as waited:
+            t0 = time.perf_counter()
+            raw_json = client.complete_json(prompt)
+    m.observe("llm_latency_seconds", time.perf_counter() - t0)
+    m.observe("llm_queue_wait_seconds", waited)
+
+    return _validate(raw_json, m)
+
+
+async def normalize_with_llm_v1_async(
+    play: Play,
+    client: AsyncLLMClient,
+    metrics: Optional[RunMetrics] = None,
+    priority: str = BATCH,
+    scheduler: Optional[LLMScheduler] = None,
+) -> LLMNormalizationV1:
+    """
+    normalize_with_llm_v1 for event-loop callers (client.acomplete_json, scheduler.aslot).
+    """
+    m = metrics if metrics is not None else RunMetrics("normalize")
+
+    with m.stage("prompt_build"):
+        prompt = build_prompt_v1(play)
+
+    sched = scheduler if scheduler is not None else get_scheduler()
+    with m.stage("llm"):
+        async with sched.aslot(priority, tenant=m.run_name) as waited:
+            t0 = time.perf_counter()
+            raw_json = await client.acomplete_json(prompt)
+    m.observe("llm_latency_seconds", time.perf_counter() - t0)
+    m.observe("llm_queue_wait_seconds", waited)
+
+    return _validate(raw_json, m)
+
+
+def _validate(raw_json: str, m: RunMetrics) -> LLMNormalizationV1:
+    with m.stage("validation"):
+        data = json.loads(raw_json)
+        before = dict(data)
+        data = repair_llm_output(data)
+        m.incr("llm_outputs")
+        if data != before:
+            m.incr("llm_repaired")
+        return LLMNormalizationV1(**data)
 
 def apply_llm_enrichment(play: Play, llm_out: LLMNormalizationV1) -> Play:
     """
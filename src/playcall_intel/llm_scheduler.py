@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional
+
+from playcall_intel.llm_limit import AdaptiveLimit
+from playcall_intel.metrics import Histogram
+
+if TYPE_CHECKING:
+    from playcall_intel.llm_gate import SlotGate
+
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+PRIORITIES = (INTERACTIVE, BATCH)  # dispatch order
+
+WAIT_WINDOW = 1000  # wait-time samples kept per class (the service runs for days)
+
+
+@dataclass
+class _Ticket:
+    priority: str
+    tenant: str
+    enqueued: float
+    granted: bool = False
+    waker: Optional[asyncio.Future] = None  # set for event-loop waiters (aslot)
+
+
+def _wake(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+def _wake_soon(fut: asyncio.Future) -> bool:
+    # False when the waiter's loop was closed (asyncio.run finished / crashed while it was queued)
+    loop = fut.get_loop()
+    if loop.is_closed():
+        return False
+    try:
+        loop.call_soon_threadsafe(_wake, fut)
+    except RuntimeError:
+        return False  # closed between the check and the call
+    return True
+
+
+class LLMScheduler:
+    """
+    One gate in front of the model server: interactive work first, batches fill the gaps
+
+    - max_in_flight bounds concurrent calls to the backend across every caller in the process
+    - Per-class caps (batch defaults to max_in_flight - 1) keep a slot free for the next recap
+    - Within a class, tenants (a batch run, report prefetch, ...) take turns round-robin, so one
+      big queue can't starve a small one
+    - stats() reports queue depth, in-flight and wait-time percentiles per class
+    - With an AdaptiveLimit, the total allowed in flight follows observed latency (max_in_flight
+      is then the ceiling) and batch work gets the current limit minus one
+    - With a SlotGate, a granted caller also takes a host-wide slot before calling, so batch runs,
+      the app and the service (separate processes) share one limit and recaps still go first
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 2,
+        caps: Optional[dict[str, int]] = None,
+        limit: Optional[AdaptiveLimit] = None,
+        gate: Optional["SlotGate"] = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        self.max_in_flight = max_in_flight
+        self.limit = limit
+        self.gate = gate
+        self.caps = {INTERACTIVE: max_in_flight, BATCH: max(1, max_in_flight - 1)}
+        for priority, cap in (caps or {}).items():
+            if priority not in self.caps:
+                raise ValueError(f"unknown priority class: {priority!r} (expected one of {PRIORITIES})")
+            self.caps[priority] = max(1, min(int(cap), max_in_flight))
+        self._queues: dict[str, OrderedDict[str, deque[_Ticket]]] = {p: OrderedDict() for p in PRIORITIES}
+        self._in_flight = {p: 0 for p in PRIORITIES}
+        self._waits = {p: Histogram() for p in PRIORITIES}
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self, priority: str = BATCH, tenant: str = "default") -> Iterator[float]:
+        """
+        Block until this call may hit the backend; yields the seconds spent queued.
+        """
+        ticket = self._enqueue(priority, tenant)
+        with self._cond:
+            try:
+                while not ticket.granted:
+                    self._cond.wait()
+            except BaseException:
+                self._abandon(ticket)
+                raise
+        held = None
+        if self.gate is not None:
+            # Granted in-process; now the host-wide slot (counted in the queue wait)
+            try:
+                held = self.gate.acquire(priority)
+            except BaseException:
+                with self._cond:
+                    self._abandon(ticket)
+                raise
+        with self._cond:
+            waited, saturated = self._started(ticket)
+        t0 = time.perf_counter()
+        ok = False
+        try:
+            yield waited
+            ok = True
+        finally:
+            if held is not None:
+                self.gate.release(held)
+            self._release(priority, time.perf_counter() - t0, ok, saturated)
+
+    @asynccontextmanager
+    async def aslot(self, priority: str = BATCH, tenant: str = "default") -> AsyncIterator[float]:
+        """
+        slot() for coroutines: waits on the event loop, shares the same queues and limits as threads.
+        """
+        ticket = self._enqueue(priority, tenant, waker=asyncio.get_running_loop().create_future())
+        try:
+            await ticket.waker
+        except BaseException:
+            with self._cond:
+                self._abandon(ticket)
+            raise
+        held = None
+        if self.gate is not None:
+            try:
+                held = await self.gate.aacquire(priority)
+            except BaseException:
+                with self._cond:
+                    self._abandon(ticket)
+                raise
+        with self._cond:
+            waited, saturated = self._started(ticket)
+        t0 = time.perf_counter()
+        ok = False
+        try:
+            yield waited
+            ok = True
+        finally:
+            if held is not None:
+                self.gate.release(held)
+            self._release(priority, time.perf_counter() - t0, ok, saturated)
+
+    def _enqueue(self, priority: str, tenant: str, waker: Optional[asyncio.Future] = None) -> _Ticket:
+        if priority not in self._queues:
+            raise ValueError(f"unknown priority class: {priority!r} (expected one of {PRIORITIES})")
+        ticket = _Ticket(priority, tenant, time.perf_counter(), waker=waker)
+        with self._cond:
+            self._queues[priority].setdefault(tenant, deque()).append(ticket)
+            self._dispatch()
+        return ticket
+
+    def _started(self, ticket: _Ticket) -> tuple[float, bool]:
+        # Caller holds the lock
+        waited = time.perf_counter() - ticket.enqueued
+        self._record_wait(ticket.priority, waited)
+        # Was the limit (total, or this class's share of it) what held callers back?
+        capacity = self.capacity()
+        saturated = (
+            sum(self._in_flight.values()) >= capacity
+            or self._in_flight[ticket.priority] >= self._cap(ticket.priority, capacity)
+        )
+        return waited, saturated
+
+    def _release(self, priority: str, latency_s: float, ok: bool, saturated: bool) -> None:
+        if self.limit is not None:
+            self.limit.on_sample(latency_s, ok, saturated)
+        with self._cond:
+            self._in_flight[priority] -= 1
+            self._dispatch()
+
+    def capacity(self) -> int:
+        if self.limit is None:
+            return self.max_in_flight
+        return max(1, min(self.limit.limit, self.max_in_flight))
+
+    def _cap(self, priority: str, capacity: int) -> int:
+        if self.limit is None or priority == INTERACTIVE:
+            return min(self.caps[priority], capacity)
+        return min(self.caps[priority], max(1, capacity - 1))
+
+    def _dispatch(self) -> None:
+        # Caller holds the lock
+        granted = False
+        capacity = self.capacity()
+        while sum(self._in_flight.values()) < capacity:
+            for priority in PRIORITIES:
+                tenants = self._queues[priority]
+                if tenants and self._in_flight[priority] < self._cap(priority, capacity):
+                    tenant, queue = next(iter(tenants.items()))
+                    ticket = queue.popleft()
+                    del tenants[tenant]
+                    if queue:
+                        tenants[tenant] = queue  # back of the line for its next request
+                    if ticket.waker is not None and not _wake_soon(ticket.waker):
+                        break  # its event loop is gone: ticket dropped, offer the slot again
+                    ticket.granted = True
+                    self._in_flight[priority] += 1
+                    granted = True
+                    break
+            else:
+                break
+        if granted:
+            self._cond.notify_all()
+
+    def _abandon(self, ticket: _Ticket) -> None:
+        # Interrupted while queued (or right after being granted): give the place back
+        if ticket.granted:
+            self._in_flight[ticket.priority] -= 1
+        else:
+            tenants = self._queues[ticket.priority]
+            queue = tenants.get(ticket.tenant)
+            if queue is not None and ticket in queue:
+                queue.remove(ticket)
+                if not queue:
+                    del tenants[ticket.tenant]
+        self._dispatch()
+
+    def _record_wait(self, priority: str, waited: float) -> None:
+        h = self._waits[priority]
+        h.observe(waited)
+        if len(h.samples) > 2 * WAIT_WINDOW:
+            del h.samples[:-WAIT_WINDOW]
+
+    def depth(self, priority: Optional[str] = None) -> int:
+        with self._cond:
+            classes = PRIORITIES if priority is None else (priority,)
+            return sum(len(q) for p in classes for q in self._queues[p].values())
+
+    def stats(self) -> dict[str, dict]:
+        with self._cond:
+            capacity = self.capacity()
+            out = {}
+            for p in PRIORITIES:
+                waits = self._waits[p].summary()
+                out[p] = {
+                    "queued": sum(len(q) for q in self._queues[p].values()),
+                    "tenants": list(self._queues[p]),
+                    "in_flight": self._in_flight[p],
+                    "cap": self._cap(p, capacity),
+                    "wait_count": waits["count"],
+                    "wait_p50_s": waits["p50"],
+                    "wait_p95_s": waits["p95"],
+                    "wait_max_s": waits["max"],
+                }
+            out["limit"] = {
+                "current": capacity,
+                "ceiling": self.max_in_flight,
+                "adaptive": self.limit is not None,
+                "history": [list(h) for h in self.limit.history[-20:]] if self.limit is not None else [],
+            }
+            out["gate"] = {
+                "dir": str(self.gate.root) if self.gate is not None else None,
+                "slots": self.gate.slots if self.gate is not None else None,
+                "held": self.gate.held() if self.gate is not None else None,  # across all processes
+            }
+            return out
+
+
+@lru_cache
+def get_scheduler() -> LLMScheduler:
+    """
+    The process-wide scheduler (LLM_MAX_IN_FLIGHT / LLM_BATCH_MAX_IN_FLIGHT from Settings).
+
+    - LLM_ADAPTIVE_LIMIT=1: start at LLM_MAX_IN_FLIGHT and let latency move it up to LLM_MAX_LIMIT
+    - Every process also takes host-wide slots from the gate under LLM_GATE_DIR (llm_gate.py), so
+      the limits hold across the batch CLI, the app and the service together
+    """
+    # Deferred: settings pulls in dotenv, which callers that never reach the LLM don't need
+    from playcall_intel.llm_gate import default_gate
+    from playcall_intel.settings import get_settings
+
+    s = get_settings()
+    if s.llm_adaptive_limit:
+        ceiling = max(s.llm_max_limit, s.llm_max_in_flight)
+        return LLMScheduler(
+            max_in_flight=ceiling,
+            limit=AdaptiveLimit(initial=s.llm_max_in_flight, max_limit=ceiling),
+            gate=default_gate(ceiling),
+        )
+    return LLMScheduler(
+        max_in_flight=s.llm_max_in_flight,
+        caps={BATCH: s.llm_batch_max_in_flight},
+        gate=default_gate(s.llm_max_in_flight),
+    )
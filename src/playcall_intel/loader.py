@@ -1,7 +1,13 @@
 import csv
 import gzip
+import keyword
+import math
+from array import array
+from collections import namedtuple
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterator, Dict, Any
+from typing import Any, Callable, Dict, Iterator, Mapping, NamedTuple, Optional, Union
 
 
 def iter_pbp_rows_gz(path: str | Path) -> Iterator[Dict[str, Any]]:
@@ -26,3 +32,281 @@ def first_pbp_row_gz(path: str | Path) -> Dict[str, Any]:
     - Avoids false confidence from hand-made samples
     """
     return next(iter_pbp_rows_gz(path))
+
+
+def iter_game_rows_gz(path: str | Path, game_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream just one game's rows
+
+    - Seeks straight to the game when a fresh seek index exists (see seek_index.py)
+    - Otherwise scans from the start and stops once the game's rows are behind us
+    """
+    from playcall_intel.seek_index import SeekIndex
+
+    index = SeekIndex.open(path)
+    if index is not None:
+        if game_id in index:
+            yield from index.iter_game_rows(game_id)
+        return
+
+    seen = False
+    for row in iter_pbp_rows_gz(path):
+        if row.get("game_id") == game_id:
+            seen = True
+            yield row
+        elif seen:
+            return
+
+
+# --- Typed streaming ---------------------------------------------------------------------------
+#
+# Kinds a column can be read as:
+#   str   → the field as is ("" stays "")
+#   int   → Optional[int]; "10", "10.0" and blanks/NA alike (same rules as mapper._to_int)
+#   float → float, NaN for blanks/NA
+#   flag  → bool, True for "1" / "1.0" (nflverse 0/1 indicator columns)
+
+INT_NA = -(2**63)  # int chunk value for a missing field (array('q') can't hold None)
+_TRUE = frozenset({"1", "1.0", "True", "true", "TRUE"})
+
+
+def _as_str(v: str) -> str:
+    return v
+
+
+def _as_int(v: str) -> Optional[int]:
+    try:
+        return int(v)
+    except ValueError:
+        try:
+            f = float(v)
+        except ValueError:
+            return None
+        return int(f) if math.isfinite(f) else None
+
+
+def _as_float(v: str) -> float:
+    try:
+        return float(v)
+    except ValueError:
+        return math.nan
+
+
+def _as_flag(v: str) -> bool:
+    return v in _TRUE
+
+
+_CONVERTERS: dict[str, Callable[[str], Any]] = {"str": _as_str, "int": _as_int, "float": _as_float, "flag": _as_flag}
+_MISSING: dict[str, Any] = {"str": None, "int": None, "float": math.nan, "flag": False}
+_CHUNK_TYPECODES = {"int": "q", "float": "d", "flag": "b"}  # str chunks are lists
+
+TypeSpec = Mapping[str, str]
+
+
+@dataclass(frozen=True)
+class TypedColumns:
+    """
+    A type spec resolved against one file's header: where each requested field sits in a row
+
+    - positions[i] is None when the file lacks the column; its value is then the kind's missing value
+    """
+
+    names: tuple[str, ...]
+    kinds: tuple[str, ...]
+    positions: tuple[Optional[int], ...]
+    width: int
+
+    @property
+    def record_type(self) -> type[NamedTuple]:
+        return _record_type(self.names)
+
+
+def typed_spec(consumer: str, header: Optional[list[str]] = None) -> dict[str, str]:
+    """
+    A type spec from a consumer's column manifest (columns.CONSUMERS)
+
+    - numeric dtype hints → "float", everything else → "str"
+    - with a header, logical names resolve to this file's physical columns (schema variants)
+    """
+    from playcall_intel.columns import CONSUMERS, resolve_columns
+
+    specs = CONSUMERS[consumer]
+    physical = resolve_columns(consumer, header).physical if header is not None else {}
+    out: dict[str, str] = {}
+    for spec in specs:
+        name = physical.get(spec.name, spec.name)
+        out[name] = "float" if spec.dtype in {"float32", "float64"} else "str"
+    return out
+
+
+def _check_kinds(spec: TypeSpec) -> None:
+    unknown = sorted({k for k in spec.values()} - set(_CONVERTERS))
+    if unknown:
+        raise ValueError(f"unknown column kind(s) {unknown} (expected one of {sorted(_CONVERTERS)})")
+
+
+def resolve_typed_columns(header: list[str], spec: TypeSpec) -> TypedColumns:
+    _check_kinds(spec)
+    pos = {name: i for i, name in enumerate(header)}
+    names = tuple(spec)
+    return TypedColumns(
+        names=names,
+        kinds=tuple(spec[n] for n in names),
+        positions=tuple(pos.get(n) for n in names),
+        width=len(header),
+    )
+
+
+_RECORD_TYPES: dict[tuple[str, ...], type] = {}
+
+
+def record_field(name: str) -> str:
+    """
+    Attribute name of a column on typed records: Python keywords get a trailing underscore (pass → pass_)
+
+    - Any other name that still isn't a valid, unique field (e.g. "1st_down") falls back to
+      namedtuple's positional _<index>; use the tuple position or iter_typed_rows_gz for those
+    """
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def _record_type(names: tuple[str, ...]) -> type:
+    rt = _RECORD_TYPES.get(names)
+    if rt is None:
+        rt = _RECORD_TYPES[names] = namedtuple("PbpRecord", [record_field(n) for n in names], rename=True)
+    return rt
+
+
+def _open_text(path: Path):
+    opener = gzip.open if path.suffix == ".gz" else open
+    return opener(path, mode="rt", encoding="utf-8", newline="")
+
+
+def _row_converter(cols: TypedColumns) -> Callable[[list[str]], tuple]:
+    """
+    One function per file: pick the requested fields by position, convert each with its kind.
+    """
+    present = [(i, p) for i, p in enumerate(cols.positions) if p is not None]
+    convs = [_CONVERTERS[cols.kinds[i]] for i, _ in present]
+    defaults = [_MISSING[k] for k in cols.kinds]
+
+    if not present:
+        const = tuple(defaults)
+        return lambda row: const
+
+    pick = itemgetter(*[p for _, p in present])
+    if len(present) == 1:
+        # itemgetter of a single index returns the field itself, not a 1-tuple
+        single = pick
+
+        def pick(row: list[str]) -> tuple:
+            return (single(row),)
+
+    if len(present) == len(cols.names):
+        def convert(row: list[str]) -> tuple:
+            return tuple([c(v) for c, v in zip(convs, pick(row))])
+        return convert
+
+    slots = [i for i, _ in present]
+
+    def convert_with_gaps(row: list[str]) -> tuple:
+        out = defaults.copy()
+        for i, c, v in zip(slots, convs, pick(row)):
+            out[i] = c(v)
+        return tuple(out)
+
+    return convert_with_gaps
+
+
+def _iter_converted(path: str | Path, spec: TypeSpec) -> tuple[TypedColumns, Iterator[tuple]]:
+    p = Path(path).expanduser()
+    _check_kinds(spec)  # before opening: a bad spec never leaves a handle behind
+    f = _open_text(p)
+    try:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"empty pbp file: {p}")
+        cols = resolve_typed_columns(header, spec)
+        convert = _row_converter(cols)
+    except BaseException:
+        f.close()
+        raise
+
+    def rows() -> Iterator[tuple]:
+        with f:
+            for row in reader:
+                try:
+                    yield convert(row)
+                except IndexError:
+                    # Short (ragged) line: pad like DictReader does
+                    yield convert(row + [""] * (cols.width - len(row)))
+
+    return cols, rows()
+
+
+def iter_typed_rows_gz(path: str | Path, spec: TypeSpec) -> Iterator[tuple]:
+    """
+    Stream typed tuples (one per play) with just the spec's columns, in spec order
+
+    - Header positions are resolved once; each row is a positional pick + per-kind conversion
+    - No dict per row and no re-parsing downstream: down/ydstogo arrive as ints, flags as bools
+    - spec: {"game_id": "str", "down": "int", "yards_gained": "int", "pass": "flag", "wp": "float"}
+      or typed_spec(consumer) for a columns.CONSUMERS manifest
+    """
+    _, rows = _iter_converted(path, spec)
+    yield from rows
+
+
+def iter_typed_records_gz(path: str | Path, spec: TypeSpec) -> Iterator[tuple]:
+    """
+    iter_typed_rows_gz with attribute access (namedtuple records, still tuple-sized).
+
+    - Fields are named by record_field(): keyword columns get a trailing underscore (rec.pass_)
+    """
+    cols, rows = _iter_converted(path, spec)
+    make = cols.record_type._make
+    for t in rows:
+        yield make(t)
+
+
+def iter_typed_chunks_gz(
+    path: str | Path,
+    spec: TypeSpec,
+    chunk_rows: int = 65536,
+) -> Iterator[Dict[str, Union[array, list]]]:
+    """
+    Column chunks of up to chunk_rows rows: array('q') for int (INT_NA when missing),
+    array('d') for float, array('b') for flag, list for str.
+
+    - Fixed-width typed buffers instead of per-row objects; hand them to numpy with
+      np.frombuffer(chunk["yards_gained"], dtype=np.int64) if needed
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be >= 1, got {chunk_rows}")
+    cols, rows = _iter_converted(path, spec)
+    names, kinds = cols.names, cols.kinds
+
+    def empty() -> list:
+        return [array(_CHUNK_TYPECODES[k]) if k in _CHUNK_TYPECODES else [] for k in kinds]
+
+    buffers = empty()
+    appends = [b.append for b in buffers]
+    int_cols = [i for i, k in enumerate(kinds) if k == "int"]
+    n = 0
+    for t in rows:
+        if int_cols:
+            t = list(t)
+            for i in int_cols:
+                if t[i] is None:
+                    t[i] = INT_NA
+        for append, v in zip(appends, t):
+            append(v)
+        n += 1
+        if n == chunk_rows:
+            yield dict(zip(names, buffers))
+            buffers = empty()
+            appends = [b.append for b in buffers]
+            n = 0
+    if n:
+        yield dict(zip(names, buffers))
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    from playcall_intel.profiling import StageProfiler
+
+
+@dataclass
+class Histogram:
+    """
+    Raw-sample histogram for latency-style measurements
+
+    - Keeps every observation (runs are hundreds/thousands of samples, not millions)
+    - Percentiles use nearest-rank so p99 is always a value we actually observed
+    """
+
+    samples: list[float] = field(default_factory=list)
+
+    def observe(self, value: float) -> None:
+        self.samples.append(float(value))
+
+    def percentile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+        return ordered[rank - 1]
+
+    def summary(self) -> dict[str, float]:
+        n = len(self.samples)
+        return {
+            "count": n,
+            "sum": sum(self.samples),
+            "min": min(self.samples) if n else 0.0,
+            "max": max(self.samples) if n else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+@dataclass
+class RunMetrics:
+    """
+    Per-run timing + counter instrumentation
+
+    - Stage timers answer "where did the time go" (csv_load, map, prompt_build, llm, validation, write)
+    - Counters/gauges capture row flow and derived rates (e.g. repair_rate)
+    - Exports to a JSON run summary and, optionally, Prometheus text format
+    - An attached StageProfiler (--profile) is entered for every stage as well
+    - Safe to update from worker threads (stage seconds then add up across threads)
+    """
+
+    run_name: str
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    stage_calls: dict[str, int] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    gauges: dict[str, float] = field(default_factory=dict)
+    histograms: dict[str, Histogram] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    profiler: Optional["StageProfiler"] = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        prof = self.profiler.stage(name) if self.profiler is not None else nullcontext()
+        t0 = time.perf_counter()
+        try:
+            with prof:
+                yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            with self._lock:
+                self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + elapsed
+                self.stage_calls[name] = self.stage_calls.get(name, 0) + 1
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self.gauges[name] = float(value)
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            self.histograms.setdefault(name, Histogram()).observe(value)
+
+    def rate(self, numerator: str, denominator: str) -> float:
+        d = self.counters.get(denominator, 0)
+        return self.counters.get(numerator, 0) / d if d else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "run": self.run_name,
+            "started_at": self.started_at,
+            "wall_seconds": time.time() - self.started_at,
+            "stages": {
+                name: {"seconds": secs, "calls": self.stage_calls.get(name, 0)}
+                for name, secs in self.stage_seconds.items()
+            },
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "histograms": {name: h.summary() for name, h in self.histograms.items()},
+        }
+
+    def write_json(self, path: str | Path) -> Path:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        return p
+
+    def to_prometheus(self, prefix: str = "playcall") -> str:
+        run = self.run_name
+        lines: list[str] = []
+
+        lines.append(f"# TYPE {prefix}_stage_seconds_total counter")
+        for name, secs in self.stage_seconds.items():
+            lines.append(f'{prefix}_stage_seconds_total{{run="{run}",stage="{name}"}} {secs:.6f}')
+
+        for name, value in self.counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f'{prefix}_{name}_total{{run="{run}"}} {value}')
+
+        for name, value in self.gauges.items():
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f'{prefix}_{name}{{run="{run}"}} {value:.6f}')
+
+        for name, h in self.histograms.items():
+            s = h.summary()
+            metric = f"{prefix}_{name}"
+            lines.append(f"# TYPE {metric} summary")
+            for q, key in [("0.5", "p50"), ("0.95", "p95"), ("0.99", "p99")]:
+                lines.append(f'{metric}{{run="{run}",quantile="{q}"}} {s[key]:.6f}')
+            lines.append(f'{metric}_sum{{run="{run}"}} {s["sum"]:.6f}')
+            lines.append(f'{metric}_count{{run="{run}"}} {s["count"]}')
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | Path) -> Path:
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(self.to_prometheus(), encoding="utf-8")
+        return p
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import urllib.parse
 import urllib.request
 from dataclasses import dataclass
 
@@ -11,18 +13,21 @@ class OllamaClient(LLMClient):
     base_url: str = "http://localhost:11434"
     timeout_s: int = 120
 
-    def complete_json(self, prompt: str) -> str:
-        url = f"{self.base_url}/api/generate"
+    def _payload(self, prompt: str) -> bytes:
         payload = {
             "model": self.model,
             "prompt": prompt,
             "stream": False,
             "format": "json",
         }
+        return json.dumps(payload).encode("utf-8")
+
+    def complete_json(self, prompt: str) -> str:
+        url = f"{self.base_url}/api/generate"
 
         req = urllib.request.Request(
             url,
-            data=json.dumps(payload).encode("utf-8"),
+            data=self._payload(prompt),
             headers={"Content-Type": "application/json"},
             method="POST",
         )
@@ -31,3 +36,66 @@ class OllamaClient(LLMClient):
             body = json.loads(resp.read().decode("utf-8"))
 
         return body["response"]
+
+    async def acomplete_json(self, prompt: str) -> str:
+        """
+        Same request over asyncio streams (one connection per call, no thread per request).
+        """
+        return await asyncio.wait_for(self._post_generate(self._payload(prompt)), timeout=self.timeout_s)
+
+    async def _post_generate(self, data: bytes) -> str:
+        url = urllib.parse.urlsplit(self.base_url)
+        secure = url.scheme == "https"
+        host = url.hostname or "localhost"
+        port = url.port or (443 if secure else 80)
+        path = url.path.rstrip("/") + "/api/generate"
+
+        reader, writer = await asyncio.open_connection(host, port, ssl=secure or None)
+        try:
+            head = (
+                f"POST {path} HTTP/1.1\r\n"
+                f"Host: {url.netloc}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(head.encode("latin-1") + data)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            parts = status_line.decode("latin-1").split(" ", 2)
+            if len(parts) < 2 or not parts[1].isdigit():
+                raise ConnectionError(f"bad HTTP status line from {self.base_url}: {status_line!r}")
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if headers.get("transfer-encoding", "").lower() == "chunked":
+                body = await _read_chunked(reader)
+            elif "content-length" in headers:
+                body = await reader.readexactly(int(headers["content-length"]))
+            else:
+                body = await reader.read()
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass  # peer already reset the connection; the response (if any) is read
+
+        status = int(parts[1])
+        if status != 200:
+            raise ConnectionError(f"Ollama returned HTTP {status}: {body[:200].decode('utf-8', 'replace')}")
+        return json.loads(body.decode("utf-8"))["response"]
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+        if size == 0:
+            await reader.readline()  # trailing CRLF (no trailers from Ollama)
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
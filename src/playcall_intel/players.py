@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from playcall_intel.ingest import PlayStore
+from playcall_intel.tables import StoreTable, md_table, numeric
+
+
+STAT_COLUMNS = [
+    "pass_att", "pass_cmp", "pass_yds", "pass_td", "pass_int", "sacked",
+    "rush_att", "rush_yds", "rush_td", "fumbles_lost",
+    "targets", "rec", "rec_yds", "rec_td",
+    "tackles", "sacks", "def_int",
+]
+KEY_COLUMNS = ["game_id", "player_id", "player_name", "team"]
+
+
+def _role(df: pd.DataFrame, who: str, team_col: str, stats: dict[str, pd.Series]) -> Optional[pd.DataFrame]:
+    id_col, name_col = f"{who}_player_id", f"{who}_player_name"
+    if id_col not in df.columns:
+        return None
+    mask = df[id_col].notna()
+    if not mask.any():
+        return None
+    part = pd.DataFrame({
+        "game_id": df.loc[mask, "game_id"].astype(str),
+        "player_id": df.loc[mask, id_col].astype(str),
+        "player_name": df.loc[mask, name_col].astype(str) if name_col in df.columns else "",
+        "team": df.loc[mask, team_col].astype(str),
+    })
+    for name, values in stats.items():
+        part[name] = values[mask].to_numpy()
+    return part
+
+
+def player_stats_from_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-game, per-player passing/rushing/receiving/defensive lines for every game in df
+
+    - Each play contributes one long-format row per credited player (passer, rusher, receiver,
+      tackler, sacker, interceptor); a single groupby then sums everything
+    - Nullified plays (no_play) are skipped; *_yards columns are used when present, else yards_gained
+    """
+    if df.empty:
+        return pd.DataFrame(columns=KEY_COLUMNS + STAT_COLUMNS)
+    plays = df[numeric(df, "no_play") == 0]
+    gained = numeric(plays, "yards_gained")
+
+    def yards(col: str) -> pd.Series:
+        return numeric(plays, col) if col in plays.columns else gained
+
+    sack, complete, td = numeric(plays, "sack"), numeric(plays, "complete_pass"), numeric(plays, "touchdown")
+    pick, fumble = numeric(plays, "interception"), numeric(plays, "fumble_lost")
+    offense_td = td * (1 - pick) * (1 - fumble)
+
+    parts = [
+        _role(plays, "passer", "posteam", {
+            "pass_att": 1 - sack,
+            "pass_cmp": complete,
+            "pass_yds": yards("passing_yards") * complete,
+            "pass_td": offense_td * complete,
+            "pass_int": pick,
+            "sacked": sack,
+        }),
+        _role(plays, "rusher", "posteam", {
+            "rush_att": pd.Series(1.0, index=plays.index),
+            "rush_yds": yards("rushing_yards"),
+            "rush_td": offense_td,
+            "fumbles_lost": fumble,
+        }),
+        _role(plays, "receiver", "posteam", {
+            "targets": pd.Series(1.0, index=plays.index),
+            "rec": complete,
+            "rec_yds": yards("receiving_yards") * complete,
+            "rec_td": offense_td * complete,
+        }),
+        _role(plays, "solo_tackle_1", "defteam", {"tackles": pd.Series(1.0, index=plays.index)}),
+        _role(plays, "sack", "defteam", {"sacks": pd.Series(1.0, index=plays.index)}),
+        _role(plays, "interception", "defteam", {"def_int": pd.Series(1.0, index=plays.index)}),
+    ]
+    long = pd.concat([p for p in parts if p is not None], ignore_index=True) if any(
+        p is not None for p in parts
+    ) else pd.DataFrame(columns=KEY_COLUMNS)
+    for c in STAT_COLUMNS:
+        if c not in long.columns:
+            long[c] = 0.0
+
+    table = long.groupby(["game_id", "player_id"], sort=True).agg(
+        player_name=("player_name", "first"),
+        team=("team", "first"),
+        **{c: (c, "sum") for c in STAT_COLUMNS},
+    ).reset_index()
+    table[STAT_COLUMNS] = table[STAT_COLUMNS].fillna(0).astype(np.int32)
+    return table[KEY_COLUMNS + STAT_COLUMNS]
+
+
+class PlayerStats:
+    """
+    Season player table sorted by game, with per-game row ranges for O(1) slices
+    """
+
+    def __init__(self, table: pd.DataFrame) -> None:
+        self.table = table.sort_values(["game_id", "player_id"], kind="stable").reset_index(drop=True)
+        ids = self.table["game_id"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else np.array([], dtype=int)
+        ends = np.r_[starts[1:], len(ids)] if len(ids) else starts
+        self._slices = {str(ids[s]): (int(s), int(e)) for s, e in zip(starts, ends)}
+
+    def game_ids(self) -> list[str]:
+        return list(self._slices)
+
+    def game(self, game_id: str) -> pd.DataFrame:
+        s, e = self._slices.get(game_id, (0, 0))
+        return self.table.iloc[s:e]
+
+    def season_totals(self, team: Optional[str] = None) -> pd.DataFrame:
+        t = self.table if team is None else self.table[self.table["team"] == team]
+        out = t.groupby(["player_id", "player_name", "team"], sort=False)[STAT_COLUMNS].sum()
+        return out.assign(games=t.groupby(["player_id", "player_name", "team"], sort=False).size()).reset_index()
+
+
+PLAYER_TABLE = StoreTable(
+    "players", "players.csv", player_stats_from_df, sort_by=("game_id", "player_id"),
+    dtype={"game_id": str, "player_id": str, "player_name": str, "team": str},
+)
+
+
+def load_player_stats(raw_path: Path, use_cache: bool = True, store_dir: Optional[Path] = None) -> PlayerStats:
+    return PlayerStats(PLAYER_TABLE.load(raw_path, use_cache, store_dir))
+
+
+def cached_game_players(game_id: str, raw_path: Path, store_dir: Optional[Path] = None) -> Optional[pd.DataFrame]:
+    return PLAYER_TABLE.cached_game(game_id, raw_path, store_dir)
+
+
+def refresh_player_table(raw_path: Path, store: PlayStore) -> int:
+    return PLAYER_TABLE.refresh(raw_path, store)
+
+
+def format_player_stats(players: pd.DataFrame, teams: list[str], top: int = 3) -> str:
+    """
+    Markdown passing / rushing / receiving / defense leaders for the given teams (away first).
+    """
+    if players is None or players.empty:
+        return "_No player data available._"
+    p = players[players["team"].isin(teams)].assign(_t=lambda x: x["team"].map({t: i for i, t in enumerate(teams)}))
+
+    def leaders(stat: str, cols: list[str]) -> pd.DataFrame:
+        hit = p[(p[cols] != 0).any(axis=1)].sort_values(["_t", stat], ascending=[True, False])
+        return hit.groupby("team", sort=False).head(top)[["team", "player_name"] + cols]
+
+    sections = [
+        ("Passing", "pass_att", ["pass_cmp", "pass_att", "pass_yds", "pass_td", "pass_int", "sacked"],
+         ["Team", "Player", "Cmp", "Att", "Yds", "TD", "INT", "Sk"]),
+        ("Rushing", "rush_yds", ["rush_att", "rush_yds", "rush_td"], ["Team", "Player", "Car", "Yds", "TD"]),
+        ("Receiving", "rec_yds", ["rec", "targets", "rec_yds", "rec_td"], ["Team", "Player", "Rec", "Tgt", "Yds", "TD"]),
+        ("Defense", "tackles", ["tackles", "sacks", "def_int"], ["Team", "Player", "Tkl", "Sk", "INT"]),
+    ]
+    out = []
+    for title, key, cols, header in sections:
+        t = leaders(key, cols)
+        if not t.empty:
+            out.append(f"### {title}\n" + md_table(header, t.values.tolist()))
+    return "\n\n".join(out) if out else "_No player data available._"
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+]
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+@dataclass
+class _StageProfile:
+    profile: cProfile.Profile = field(default_factory=cProfile.Profile)
+    calls: int = 0
+    peak_bytes: int = 0
+    top_allocations: list[dict[str, Any]] = field(default_factory=list)
+
+
+class StageProfiler:
+    """
+    Opt-in cProfile + tracemalloc capture, split by pipeline stage
+
+    - Each stage gets its own cProfile so hot spots (_to_int, iterrows, CSV parsing) are attributed
+    - Nested stages are exclusive: the outer profile pauses while an inner stage runs
+    - tracemalloc peak is tracked per stage; top allocations come from the stage's first call
+      (per-row stages would be far too slow to snapshot every time)
+    """
+
+    def __init__(self, top_n: int = 15) -> None:
+        self.top_n = top_n
+        self.stages: dict[str, _StageProfile] = {}
+        self._stack: list[str] = []
+        self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+            self._owns_tracemalloc = True
+
+    def stop(self) -> None:
+        while self._stack:
+            self._exit(self._stack[-1])
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def _fold_peak(self) -> None:
+        _, peak = tracemalloc.get_traced_memory()
+        for name in self._stack:
+            sp = self.stages[name]
+            sp.peak_bytes = max(sp.peak_bytes, peak)
+        tracemalloc.reset_peak()
+
+    def _exit(self, name: str) -> None:
+        self.stages[name].profile.disable()
+        self._fold_peak()
+        self._stack.pop()
+        if self._stack:
+            self.stages[self._stack[-1]].profile.enable()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not tracemalloc.is_tracing():
+            self.start()
+
+        sp = self.stages.setdefault(name, _StageProfile())
+        sp.calls += 1
+        first_call = sp.calls == 1
+
+        if self._stack:
+            self.stages[self._stack[-1]].profile.disable()
+        self._fold_peak()
+        self._stack.append(name)
+
+        before = _snapshot() if first_call else None
+        sp.profile.enable()
+        try:
+            yield
+        finally:
+            if before is not None:
+                sp.profile.disable()
+                after = _snapshot()
+                diff = after.compare_to(before, "lineno")[: self.top_n]
+                sp.top_allocations = [
+                    {
+                        "location": str(d.traceback[0]) if d.traceback else "?",
+                        "size_diff_kib": d.size_diff / 1024,
+                        "count_diff": d.count_diff,
+                    }
+                    for d in diff
+                ]
+            self._exit(name)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            name: {
+                "calls": sp.calls,
+                "peak_mib": sp.peak_bytes / (1024 * 1024),
+                "top_allocations": sp.top_allocations,
+            }
+            for name, sp in self.stages.items()
+        }
+
+    def write(self, out_dir: str | Path, sort_by: str = "cumulative", limit: int = 25) -> Path:
+        """
+        Write `<stage>.pstats` per stage plus a readable `profile_summary.txt` and JSON summary.
+        """
+        out = Path(out_dir)
+        out.mkdir(parents=True, exist_ok=True)
+
+        text: list[str] = []
+        for name, sp in self.stages.items():
+            sp.profile.create_stats()
+            if not sp.profile.stats:  # stage never executed python code while enabled
+                continue
+            sp.profile.dump_stats(str(out / f"{name}.pstats"))
+
+            buf = io.StringIO()
+            pstats.Stats(sp.profile, stream=buf).strip_dirs().sort_stats(sort_by).print_stats(limit)
+            text.append(f"===== stage: {name} (calls={sp.calls}, peak={sp.peak_bytes / 1048576:.1f} MiB) =====")
+            for a in sp.top_allocations[:10]:
+                text.append(f"  alloc {a['size_diff_kib']:+10.1f} KiB  {a['location']}")
+            text.append(buf.getvalue())
+
+        (out / "profile_summary.txt").write_text("\n".join(text), encoding="utf-8")
+        (out / "profile_summary.json").write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        return out
+
+
+@contextmanager
+def maybe_profile(enabled: bool) -> Iterator[Optional[StageProfiler]]:
+    """
+    Yield a started StageProfiler when enabled, else None; always stops tracing on exit.
+    """
+    if not enabled:
+        yield None
+        return
+    profiler = StageProfiler()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
@@ -1,10 +1,61 @@
 import json
+import time
+from typing import Optional
+
+from playcall_intel.llm_scheduler import INTERACTIVE, LLMScheduler, get_scheduler
+from playcall_intel.metrics import RunMetrics
 from playcall_intel.recap_contract import GameRecapV1
 from playcall_intel.recap_prompting import build_game_recap_prompt_v1
 
 
-def generate_game_recap_v1(bs, highlights, client) -> GameRecapV1:
-    prompt = build_game_recap_prompt_v1(bs, highlights)
-    raw_json = client.complete_json(prompt)
-    data = json.loads(raw_json)
-    return GameRecapV1(**data)
+def generate_game_recap_v1(
+    bs,
+    highlights,
+    client,
+    metrics: Optional[RunMetrics] = None,
+    priority: str = INTERACTIVE,
+    scheduler: Optional[LLMScheduler] = None,
+) -> GameRecapV1:
+    m = metrics if metrics is not None else RunMetrics("recap")
+    sched = scheduler if scheduler is not None else get_scheduler()
+
+    with m.stage("prompt_build"):
+        prompt = build_game_recap_prompt_v1(bs, highlights)
+
+    # Someone is usually waiting on a recap: it jumps ahead of queued batch normalization
+    with m.stage("llm"):
+        with sched.slot(priority, tenant=m.run_name) as waited:
+            t0 = time.perf_counter()
+            raw_json = client.complete_json(prompt)
+    m.observe("llm_latency_seconds", time.perf_counter() - t0)
+    m.observe("llm_queue_wait_seconds", waited)
+
+    with m.stage("validation"):
+        data = json.loads(raw_json)
+        return GameRecapV1(**data)
+
+
+async def generate_game_recap_v1_async(
+    bs,
+    highlights,
+    client,
+    metrics: Optional[RunMetrics] = None,
+    priority: str = INTERACTIVE,
+    scheduler: Optional[LLMScheduler] = None,
+) -> GameRecapV1:
+    m = metrics if metrics is not None else RunMetrics("recap")
+    sched = scheduler if scheduler is not None else get_scheduler()
+
+    with m.stage("prompt_build"):
+        prompt = build_game_recap_prompt_v1(bs, highlights)
+
+    with m.stage("llm"):
+        async with sched.aslot(priority, tenant=m.run_name) as waited:
+            t0 = time.perf_counter()
+            raw_json = await client.acomplete_json(prompt)
+    m.observe("llm_latency_seconds", time.perf_counter() - t0)
+    m.observe("llm_queue_wait_seconds", waited)
+
+    with m.stage("validation"):
+        data = json.loads(raw_json)
+        return GameRecapV1(**data)
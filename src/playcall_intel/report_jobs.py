@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+from playcall_intel.dataset import season_path_for_game
+from playcall_intel.game_report import (
+    OUT_DIR,
+    RAW_PATH,
+    ReportParts,
+    assemble_report_parts,
+    finish_game_report,
+)
+from playcall_intel.llm_scheduler import BATCH, INTERACTIVE
+from playcall_intel.metrics import RunMetrics
+from playcall_intel.shared_frame import FrameHandle
+
+
+class ReportJobs:
+    """
+    Background report work for the app: stats now, recap later, neighbours speculatively
+
+    - stats() is synchronous and cheap (cached tables); the caller renders it right away
+    - finish() hands the LLM recap + file write to a worker and returns a Future[Path]
+    - prefetch() queues whole reports for other games on a separate low-concurrency pool, so
+      speculative work never delays the recap the user is waiting for; its LLM calls also queue
+      in the batch class of the shared scheduler
+    - One job per game: a prefetch already in flight is reused by finish(), and vice versa
+    - With a shared frame handle, a game's plays are a slice of the memory-mapped season
+    """
+
+    def __init__(
+        self,
+        raw_path: Path = RAW_PATH,
+        out_dir: Path = OUT_DIR,
+        recap_workers: int = 2,
+        prefetch_workers: int = 1,
+        frame: Optional[FrameHandle] = None,
+    ) -> None:
+        self.raw_path = Path(raw_path)
+        self.out_dir = Path(out_dir)
+        self.frame = frame
+        self._shared = frame.open() if frame is not None else None
+        self._slices = self._shared.games if self._shared is not None else {}
+        self._recaps = ThreadPoolExecutor(max_workers=recap_workers, thread_name_prefix="recap")
+        self._prefetch = ThreadPoolExecutor(max_workers=prefetch_workers, thread_name_prefix="prefetch")
+        self._jobs: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def report_path(self, game_id: str) -> Path:
+        return self.out_dir / f"{game_id}.md"
+
+    def is_current(self, game_id: str) -> bool:
+        """
+        True when the report on disk is newer than the season file it was built from.
+        """
+        out = self.report_path(game_id)
+        raw = season_path_for_game(game_id, self.raw_path)
+        return out.exists() and raw.exists() and out.stat().st_mtime_ns >= raw.stat().st_mtime_ns
+
+    def stats(self, game_id: str) -> ReportParts:
+        g = None
+        if game_id in self._slices and self.frame is not None and self.frame.is_current():
+            s, e = self._slices[game_id]
+            g = self._shared.slice(s, e)
+        return assemble_report_parts(game_id, raw_path=self.raw_path, g=g)
+
+    def _submit(self, pool: ThreadPoolExecutor, game_id: str, parts: Optional[ReportParts]) -> Future:
+        with self._lock:
+            job = self._jobs.get(game_id)
+            if job is not None:
+                if not job.done():
+                    # A prefetch still waiting in its queue is moved to the front pool on demand
+                    if pool is self._prefetch or not job.cancel():
+                        return job
+                elif not job.cancelled() and job.exception() is None and self.is_current(game_id):
+                    return job
+
+            speculative = pool is self._prefetch
+
+            def run() -> Path:
+                p = parts if parts is not None else self.stats(game_id)
+                if speculative:
+                    return finish_game_report(p, self.out_dir, RunMetrics("report_prefetch"), priority=BATCH)
+                return finish_game_report(p, self.out_dir, priority=INTERACTIVE)
+
+            job = pool.submit(run)
+            self._jobs[game_id] = job
+            return job
+
+    def finish(self, game_id: str, parts: Optional[ReportParts] = None) -> Future:
+        """
+        Recap + write in the background (pass the parts already shown to skip recomputing them).
+        """
+        return self._submit(self._recaps, game_id, parts)
+
+    def job(self, game_id: str) -> Optional[Future]:
+        with self._lock:
+            return self._jobs.get(game_id)
+
+    def prefetch(self, game_ids: Iterable[str]) -> list[str]:
+        """
+        Queue full reports for games that have neither a current file nor a job; returns those queued.
+        """
+        queued = []
+        for gid in game_ids:
+            job = self.job(gid)
+            if (job is not None and not job.done()) or self.is_current(gid):
+                continue
+            self._submit(self._prefetch, gid, None)
+            queued.append(gid)
+        return queued
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(not j.done() for j in self._jobs.values())
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._recaps.shutdown(wait=wait, cancel_futures=not wait)
+        self._prefetch.shutdown(wait=wait, cancel_futures=not wait)
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from playcall_intel.highlights import GameHighlights
+from playcall_intel.ingest import PlayStore
+from playcall_intel.tables import StoreTable, md_table, numeric
+from playcall_intel.tendencies import DISTANCE_LABELS, distance_buckets
+
+
+RAW_PATH = Path("data/raw/play_by_play_2025.csv.gz")
+OUT_DIR = Path("reports/scouting")
+
+ROLLUP_KEYS = ["game_id", "team", "opponent", "down", "distance_bucket"]
+# Additive per-situation counters: merging games is a groupby-sum, never a re-scan of plays
+ROLLUP_MEASURES = [
+    "plays", "pass", "rush", "yards", "pass_yards", "rush_yards", "turnovers", "sacks", "elapsed_s",
+]
+NO_DOWN = "n/a"
+PACE_CAP_S = 60  # seconds to the next snap; longer gaps are quarter breaks / reviews, not tempo
+
+
+def game_rollups_from_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Offensive rollups per game × team × down × distance bucket for every game in df (one groupby)
+
+    - Scrimmage plays only (pass or rush, not nullified); down/distance are "n/a" for e.g. 2-pt tries
+    - elapsed_s is the game clock run off until the next play, capped at PACE_CAP_S (pace = elapsed / plays)
+    """
+    if df.empty or "posteam" not in df.columns:
+        return pd.DataFrame(columns=ROLLUP_KEYS + ROLLUP_MEASURES)
+    order = ["game_id", "play_id"] if "play_id" in df.columns else ["game_id"]
+    df = df.sort_values(order, kind="stable")
+
+    clock = numeric(df, "game_seconds_remaining")
+    elapsed = (clock - clock.groupby(df["game_id"], sort=False).shift(-1)).fillna(0).clip(0, PACE_CAP_S)
+
+    passes, rushes = numeric(df, "pass"), numeric(df, "rush")
+    live = df["posteam"].notna() & ((passes > 0) | (rushes > 0)) & (numeric(df, "no_play") == 0)
+    plays = df[live]
+    if plays.empty:
+        return pd.DataFrame(columns=ROLLUP_KEYS + ROLLUP_MEASURES)
+
+    team = plays["posteam"].astype(str)
+    if "defteam" in plays.columns:
+        opponent = plays["defteam"].astype(str)
+    else:
+        opponent = pd.Series(
+            np.where(team == plays["home_team"].astype(str), plays["away_team"].astype(str), plays["home_team"].astype(str)),
+            index=plays.index,
+        )
+    down = numeric(plays, "down", fill=np.nan)
+    dist = distance_buckets(plays["ydstogo"]) if "ydstogo" in plays.columns else pd.Series(np.nan, index=plays.index)
+    yards = numeric(plays, "yards_gained")
+    is_pass, is_rush = passes[live], rushes[live] * (1 - passes[live])
+
+    long = pd.DataFrame({
+        "game_id": plays["game_id"].astype(str),
+        "team": team,
+        "opponent": opponent,
+        "down": down.map(lambda d: NO_DOWN if pd.isna(d) else str(int(d))),
+        "distance_bucket": dist.fillna(NO_DOWN).astype(str),
+        "plays": 1,
+        "pass": is_pass,
+        "rush": is_rush,
+        "yards": yards,
+        "pass_yards": yards * is_pass,
+        "rush_yards": yards * is_rush,
+        "turnovers": ((numeric(plays, "interception") + numeric(plays, "fumble_lost")) > 0).astype(int),
+        "sacks": numeric(plays, "sack"),
+        "elapsed_s": elapsed[live],
+    })
+    out = long.groupby(ROLLUP_KEYS, sort=True)[ROLLUP_MEASURES].sum().reset_index()
+    out[ROLLUP_MEASURES] = out[ROLLUP_MEASURES].astype(np.int64)
+    return out
+
+
+ROLLUP_TABLE = StoreTable(
+    "rollups", "team_rollups.csv", game_rollups_from_df, sort_by=tuple(ROLLUP_KEYS),
+    dtype={k: str for k in ROLLUP_KEYS}, keep_default_na=False,
+)
+
+
+def load_game_rollups(raw_path: Path, use_cache: bool = True, store_dir: Optional[Path] = None) -> pd.DataFrame:
+    return ROLLUP_TABLE.load(raw_path, use_cache, store_dir)
+
+
+def refresh_game_rollups(raw_path: Path, store: PlayStore) -> int:
+    return ROLLUP_TABLE.refresh(raw_path, store)
+
+
+def last_n_games(rollups: pd.DataFrame, team: str, n: int) -> list[str]:
+    """
+    The team's most recent n game_ids (nflverse ids sort chronologically: <season>_<week>_...)
+    """
+    played = rollups.loc[(rollups["team"] == team) | (rollups["opponent"] == team), "game_id"].unique()
+    return sorted(played)[-n:] if n > 0 else []
+
+
+@dataclass
+class ScoutingReport:
+    team: str
+    game_ids: list[str]
+    summary: dict[str, float] = field(default_factory=dict)
+    by_game: pd.DataFrame = field(default_factory=pd.DataFrame)
+    tendencies: pd.DataFrame = field(default_factory=pd.DataFrame)
+    top_plays: list[tuple[float, str, str]] = field(default_factory=list)  # (wpa, game_id, desc)
+
+
+def _rates(t: pd.DataFrame) -> pd.DataFrame:
+    plays = t["plays"].replace(0, np.nan)
+    return t.assign(
+        pass_rate=(t["pass"] / plays).round(3),
+        yards_per_play=(t["yards"] / plays).round(2),
+    )
+
+
+def scouting_report(
+    team: str,
+    rollups: pd.DataFrame,
+    last_n: int = 4,
+    highlights: Optional[dict[str, GameHighlights]] = None,
+    top_k: int = 5,
+) -> ScoutingReport:
+    """
+    Merge the cached per-game rollups for the team's last n games (sums of counters, no play scan)
+
+    - Offense: the team's own rows; defense (takeaways, sacks made): the opponents' rows in those games
+    - Top WPA plays: merged from each game's precomputed highlight entry
+    """
+    game_ids = last_n_games(rollups, team, last_n)
+    report = ScoutingReport(team=team, game_ids=game_ids)
+    if not game_ids:
+        return report
+
+    in_games = rollups["game_id"].isin(game_ids)
+    offense = rollups[in_games & (rollups["team"] == team)]
+    defense = rollups[in_games & (rollups["opponent"] == team)]
+    o, d, games = offense[ROLLUP_MEASURES].sum(), defense[ROLLUP_MEASURES].sum(), len(game_ids)
+    plays = max(int(o["plays"]), 1)
+    report.summary = {
+        "games": games,
+        "plays_per_game": round(o["plays"] / games, 1),
+        "pass_rate": round(o["pass"] / plays, 3),
+        "yards_per_play": round(o["yards"] / plays, 2),
+        "seconds_per_play": round(o["elapsed_s"] / plays, 1),
+        "turnovers_per_game": round(o["turnovers"] / games, 2),
+        "takeaways_per_game": round(d["turnovers"] / games, 2),
+        "sacks_taken_per_game": round(o["sacks"] / games, 2),
+        "sacks_made_per_game": round(d["sacks"] / games, 2),
+        "yards_allowed_per_play": round(d["yards"] / max(int(d["plays"]), 1), 2),
+    }
+
+    by_game = offense.groupby(["game_id", "opponent"], sort=True)[ROLLUP_MEASURES].sum().reset_index()
+    takeaways = defense.groupby("game_id")["turnovers"].sum().rename("takeaways")
+    report.by_game = _rates(by_game.join(takeaways, on="game_id")).fillna({"takeaways": 0})
+
+    situational = offense[offense["down"] != NO_DOWN]
+    tend = situational.groupby(["down", "distance_bucket"], sort=False)[["plays", "pass", "rush", "yards"]].sum()
+    tend = _rates(tend.reset_index())
+    order = {label: i for i, label in enumerate(DISTANCE_LABELS)}
+    report.tendencies = tend.sort_values(
+        ["down", "distance_bucket"], key=lambda s: s.map(order) if s.name == "distance_bucket" else s
+    ).reset_index(drop=True)
+
+    if highlights:
+        merged = [
+            (wpa, gid, desc)
+            for gid in game_ids if gid in highlights
+            for wpa, desc in highlights[gid].team_top(team)
+        ]
+        report.top_plays = sorted(merged, key=lambda x: x[0], reverse=True)[:top_k]
+    return report
+
+
+def format_scouting_report(report: ScoutingReport) -> str:
+    if not report.game_ids:
+        return f"# Scouting report: {report.team}\n\n_No games found for {report.team}._\n"
+    s = report.summary
+    games = ", ".join(report.game_ids)
+    overview = md_table(
+        ["Plays/g", "Pass %", "Yds/play", "Sec/play", "TO/g", "Takeaways/g", "Sacks taken/g", "Sacks made/g", "Yds/play allowed"],
+        [[
+            s["plays_per_game"], f"{s['pass_rate']:.0%}", s["yards_per_play"], s["seconds_per_play"],
+            s["turnovers_per_game"], s["takeaways_per_game"], s["sacks_taken_per_game"], s["sacks_made_per_game"],
+            s["yards_allowed_per_play"],
+        ]],
+    )
+    per_game = md_table(
+        ["Game", "Opp", "Plays", "Pass %", "Pass yds", "Rush yds", "Yds/play", "TO", "Takeaways"],
+        [
+            [r.game_id, r.opponent, r.plays, f"{r.pass_rate:.0%}", r.pass_yards, r.rush_yards, r.yards_per_play,
+             r.turnovers, int(r.takeaways)]
+            for r in report.by_game.itertuples(index=False)
+        ],
+    )
+    tendencies = md_table(
+        ["Down", "Distance", "Plays", "Pass %", "Yds/play"],
+        [[r.down, r.distance_bucket, r.plays, f"{r.pass_rate:.0%}", r.yards_per_play] for r in report.tendencies.itertuples(index=False)],
+    )
+    top = "\n".join(f"- **{wpa:+.3f} WPA** ({gid}) — {desc}" for wpa, gid, desc in report.top_plays)
+    return f"""# Scouting report: {report.team} — last {s['games']} games
+
+Games: {games}
+
+## Overview
+{overview}
+
+## Game by game
+{per_game}
+
+## Tendencies by down & distance
+{tendencies}
+
+## Top WPA plays
+{top or "_No WPA highlights available._"}
+"""
+
+
+def write_scouting_report(
+    team: str,
+    last_n: int = 4,
+    raw_path: Path = RAW_PATH,
+    out_dir: Path = OUT_DIR,
+    store_dir: Optional[Path] = None,
+) -> Path:
+    """
+    Scouting report → reports/scouting/<team>_last<n>.md, from the cached rollup table + highlight index.
+    """
+    from playcall_intel.highlights import load_highlight_index
+
+    report = scouting_report(
+        team,
+        load_game_rollups(raw_path, store_dir=store_dir),
+        last_n=last_n,
+        highlights=load_highlight_index(raw_path),
+    )
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / f"{team}_last{last_n}.md"
+    out_path.write_text(format_scouting_report(report), encoding="utf-8")
+    return out_path
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from playcall_intel.artifact_cache import is_fresh, mark_fresh, sidecar_path
+from playcall_intel.columns import read_pbp
+
+if TYPE_CHECKING:
+    from playcall_intel.ingest import PlayStore
+
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_CLOCK_RE = re.compile(r"^\s*\(\d{1,2}:\d{2}\)\s*")
+# 6-K.Murray, J.Smith-Njigba, Ja.Chase, A.St. Brown is close enough as "a.st"
+_PLAYER_RE = re.compile(r"(?:\b\d{1,2}-)?\b([A-Z][A-Za-z]{0,3}\.[A-Z][A-Za-z'\-]+)")
+_YARDS_RE = re.compile(r"(-?\d+)\s+yards?\b", re.IGNORECASE)
+_NO_GAIN_RE = re.compile(r"\bno gain\b", re.IGNORECASE)
+_MIN_YARDS_RE = re.compile(r"(-?\d+)\+\s*(?:yards?|yds)\b", re.IGNORECASE)
+_WORD_RE = re.compile(r"[a-z][a-z']+")
+_STOPWORDS = frozenset("a an and at by for from in is of on the to was with".split())
+
+
+def _stem(word: str) -> str:
+    # Plural folding only: "punts" → "punt", "sacks" → "sack" (but not "pass")
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Play description → index terms
+
+    - Player refs (jersey number stripped) → "player:k.murray" + the surname ("murray")
+    - Yardage → "yds:<n>" ("for 12 yards", "punts 42 yards", "no gain" → yds:0)
+    - Everything else: lowercase words minus stopwords, plurals folded; clock and bare numbers dropped
+    """
+    if not text:
+        return []
+    text = _CLOCK_RE.sub(" ", str(text))
+    terms: list[str] = []
+
+    def player(m: re.Match) -> str:
+        name = m.group(1).lower()
+        terms.append(f"player:{name}")
+        terms.append(name.split(".", 1)[1].replace("'", ""))
+        return " "
+
+    def yards(m: re.Match) -> str:
+        terms.append(f"yds:{int(m.group(1))}")
+        return " "
+
+    def no_gain(m: re.Match) -> str:
+        terms.append("yds:0")
+        return " "
+
+    text = _PLAYER_RE.sub(player, text)
+    text = _YARDS_RE.sub(yards, text)
+    text = _NO_GAIN_RE.sub(no_gain, text)
+    terms.extend(_stem(w) for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS)
+    return terms
+
+
+@dataclass
+class SearchHit:
+    game_id: str
+    play_id: Optional[int]
+    match: str
+    qtr: Optional[int]
+    posteam: str
+    desc: str
+    score: float
+
+
+DOC_COLUMNS = ["game_id", "play_id", "match", "qtr", "posteam", "desc"]
+
+
+def _docs_from_frame(df: pd.DataFrame) -> pd.DataFrame:
+    if "desc" not in df.columns:
+        return pd.DataFrame(columns=DOC_COLUMNS)
+    df = df[df["desc"].notna()]
+
+    def col(name: str, default=None) -> pd.Series:
+        return df[name] if name in df.columns else pd.Series(default, index=df.index)
+
+    return pd.DataFrame({
+        "game_id": df["game_id"].astype(str),
+        "play_id": pd.to_numeric(col("play_id"), errors="coerce"),
+        "match": col("away_team", "").astype(str) + " @ " + col("home_team", "").astype(str),
+        "qtr": pd.to_numeric(col("qtr"), errors="coerce"),
+        "posteam": col("posteam", "").fillna("").astype(str),
+        "desc": df["desc"].astype(str),
+    }).reset_index(drop=True)
+
+
+class SearchIndex:
+    """
+    Inverted index over play descriptions, scored with BM25
+
+    - Postings are flat (term, doc, tf) arrays sorted by term then doc; a term is a contiguous slice
+    - Query terms are AND-ed; "40+ yards" expands to every yds:<n> ≥ 40 in the vocabulary
+    - Docs carry game context (game, matchup, quarter, offense) so hits render without another read
+    """
+
+    def __init__(
+        self,
+        docs: pd.DataFrame,
+        vocab: list[str],
+        terms: np.ndarray,
+        doc_ids: np.ndarray,
+        tfs: np.ndarray,
+        lengths: np.ndarray,
+    ) -> None:
+        self.docs = docs.reset_index(drop=True)
+        self._game_ids = self.docs["game_id"].astype(str).to_numpy()
+        self.vocab = list(vocab)
+        self._term_pos = {t: i for i, t in enumerate(self.vocab)}
+        self._terms, self._doc_ids, self._tfs = terms, doc_ids, tfs
+        self._bounds = np.searchsorted(terms, np.arange(len(self.vocab) + 1))
+        self.lengths = lengths
+        self._avg_len = float(lengths.mean()) if len(lengths) else 0.0
+
+    # -- building ---------------------------------------------------------------------------
+
+    @classmethod
+    def from_docs(cls, docs: pd.DataFrame) -> "SearchIndex":
+        counts = [Counter(tokenize(d)) for d in docs["desc"]]
+        vocab = sorted(set().union(*counts)) if counts else []
+        pos = {t: i for i, t in enumerate(vocab)}
+        triples = [(pos[t], d, n) for d, c in enumerate(counts) for t, n in c.items()]
+        arr = np.array(triples, dtype=np.int64).reshape(-1, 3)
+        order = np.lexsort((arr[:, 1], arr[:, 0]))
+        arr = arr[order]
+        lengths = np.array([sum(c.values()) for c in counts], dtype=np.int32)
+        return cls(
+            docs,
+            vocab,
+            arr[:, 0].astype(np.int32),
+            arr[:, 1].astype(np.int32),
+            arr[:, 2].astype(np.int16),
+            lengths,
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SearchIndex":
+        return cls.from_docs(_docs_from_frame(df))
+
+    def replace_games(self, game_frames: dict[str, Optional[pd.DataFrame]]) -> "SearchIndex":
+        """
+        New index with these games' plays swapped out (None → removed)
+
+        - Postings of untouched games are filtered + renumbered, never re-tokenized
+        """
+        keep = ~self.docs["game_id"].isin(list(game_frames)).to_numpy()
+        remap = np.cumsum(keep) - 1
+        kept_post = keep[self._doc_ids]
+        old_vocab = np.array(self.vocab, dtype=object)
+
+        added = [f for f in game_frames.values() if f is not None and not f.empty]
+        fresh = SearchIndex.from_frame(pd.concat(added, ignore_index=True)) if added else SearchIndex.empty()
+        offset = int(keep.sum())
+
+        new_vocab = np.array(fresh.vocab, dtype=object)
+        words = np.concatenate([old_vocab[self._terms[kept_post]], new_vocab[fresh._terms]])
+        docs_ = np.concatenate([remap[self._doc_ids[kept_post]], fresh._doc_ids + offset])
+        tfs = np.concatenate([self._tfs[kept_post], fresh._tfs])
+        vocab, term_ids = np.unique(words.astype(str), return_inverse=True)
+        order = np.lexsort((docs_, term_ids))
+        return SearchIndex(
+            pd.concat([self.docs[keep], fresh.docs], ignore_index=True),
+            list(vocab),
+            term_ids[order].astype(np.int32),
+            docs_[order].astype(np.int32),
+            tfs[order].astype(np.int16),
+            np.concatenate([self.lengths[keep], fresh.lengths]).astype(np.int32),
+        )
+
+    @classmethod
+    def empty(cls) -> "SearchIndex":
+        z = np.array([], dtype=np.int32)
+        return cls(pd.DataFrame(columns=DOC_COLUMNS), [], z, z, z.astype(np.int16), z)
+
+    # -- querying ---------------------------------------------------------------------------
+
+    def _clauses(self, query: str) -> list[list[str]]:
+        clauses: list[list[str]] = []
+
+        def min_yards(m: re.Match) -> str:
+            lo = int(m.group(1))
+            clauses.append([t for t in self.vocab if t.startswith("yds:") and int(t[4:]) >= lo])
+            return " "
+
+        rest = _MIN_YARDS_RE.sub(min_yards, query)
+        clauses.extend([t] for t in dict.fromkeys(tokenize(rest)))
+        return clauses
+
+    def _postings(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        i = self._term_pos.get(term)
+        if i is None:
+            return self._doc_ids[:0], self._tfs[:0]
+        s, e = self._bounds[i], self._bounds[i + 1]
+        return self._doc_ids[s:e], self._tfs[s:e]
+
+    def search(self, query: str, limit: int = 25, game_id: Optional[str] = None) -> list[SearchHit]:
+        clauses = self._clauses(query)
+        n_docs = len(self.docs)
+        if not clauses or not n_docs:
+            return []
+
+        total = np.zeros(n_docs)
+        alive = np.ones(n_docs, dtype=bool) if game_id is None else self._game_ids == game_id
+        for clause in clauses:
+            # OR within a clause (yardage ranges), AND across clauses
+            best = np.zeros(n_docs)
+            for term in clause:
+                docs, tfs = self._postings(term)
+                idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[docs] / (self._avg_len or 1.0))
+                np.maximum.at(best, docs, idf * tfs * (BM25_K1 + 1) / (tfs + norm))
+            alive &= best > 0
+            total += best
+
+        hits_idx = np.flatnonzero(alive)
+        if len(hits_idx) > limit:
+            hits_idx = hits_idx[np.argpartition(-total[hits_idx], limit - 1)[:limit]]
+        hits_idx = hits_idx[np.lexsort((hits_idx, -total[hits_idx]))]
+
+        hits = []
+        for d in hits_idx.tolist():
+            r = self.docs.iloc[d]
+            hits.append(SearchHit(
+                game_id=str(r["game_id"]),
+                play_id=None if pd.isna(r["play_id"]) else int(r["play_id"]),
+                match=str(r["match"]),
+                qtr=None if pd.isna(r["qtr"]) else int(r["qtr"]),
+                posteam=str(r["posteam"]),
+                desc=str(r["desc"]),
+                score=round(float(total[d]), 4),
+            ))
+        return hits
+
+    # -- persistence ------------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        docs_json = self.docs.to_json(orient="split", index=False).encode("utf-8")
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            np.savez_compressed(
+                f,
+                vocab=np.frombuffer(json.dumps(self.vocab).encode("utf-8"), dtype=np.uint8),
+                docs=np.frombuffer(docs_json, dtype=np.uint8),
+                terms=self._terms,
+                doc_ids=self._doc_ids,
+                tfs=self._tfs,
+                lengths=self.lengths,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "SearchIndex":
+        with np.load(path, allow_pickle=False) as z:
+            vocab = json.loads(z["vocab"].tobytes().decode("utf-8"))
+            split = json.loads(z["docs"].tobytes().decode("utf-8"))
+            docs = pd.DataFrame(split["data"], columns=split["columns"])
+            return cls(docs, vocab, z["terms"], z["doc_ids"], z["tfs"], z["lengths"])
+
+
+def search_index_path(raw_path: Path) -> Path:
+    return sidecar_path(raw_path, "search", "npz")
+
+
+def load_search_index(raw_path: Path) -> SearchIndex:
+    """
+    Search index for a raw pbp file; ingest keeps it current, otherwise it's built here once.
+    """
+    raw_path = Path(raw_path)
+    path = search_index_path(raw_path)
+    if is_fresh(path, raw_path):
+        return SearchIndex.load(path)
+    index = SearchIndex.from_frame(read_pbp(raw_path, "search"))
+    try:
+        index.save(path)
+        mark_fresh(path, raw_path)
+    except OSError:
+        pass  # read-only data dir
+    return index
+
+
+def update_search_index(raw_path: Path, game_frames: dict[str, Optional[pd.DataFrame]]) -> Optional[SearchIndex]:
+    """
+    Re-index only the given games (ingest / watch path); None when there is no index to patch yet.
+    """
+    path = search_index_path(raw_path)
+    if not path.exists():
+        return None
+    index = SearchIndex.load(path).replace_games(game_frames)
+    index.save(path)
+    mark_fresh(path, raw_path)
+    return index
+
+
+def refresh_search_index(raw_path: Path, store: "PlayStore") -> int:
+    """
+    Bring the index in line with the ingest store: re-index the store's dirty "search" games
+    (full build when no index exists yet). Returns how many games were (re)indexed.
+    """
+    if not search_index_path(raw_path).exists():
+        load_search_index(raw_path)
+        store.mark_clean("search")
+        return len(store.game_ids())
+
+    dirty = store.dirty("search")
+    if dirty:
+        update_search_index(raw_path, {
+            gid: (store.load_game(gid, consumer="search") if store.has_game(gid) else None) for gid in dirty
+        })
+    elif not is_fresh(search_index_path(raw_path), raw_path):
+        mark_fresh(search_index_path(raw_path), raw_path)  # raw file touched, no game changed
+    store.mark_clean("search")
+    return len(dirty)
+
+
+def format_hits(hits: Iterable[SearchHit]) -> str:
+    lines = [f"{h.score:6.2f}  {h.game_id}  Q{h.qtr or '?'}  {h.posteam:<3}  {h.desc}" for h in hits]
+    return "\n".join(lines) if lines else "No matching plays."
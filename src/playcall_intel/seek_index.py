@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import os
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from playcall_intel.artifact_cache import is_fresh, mark_fresh, sidecar_path
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def blocked_path(raw_path: str | Path) -> Path:
+    return sidecar_path(raw_path, "blocked", "csv.gz")
+
+
+def offsets_path(raw_path: str | Path) -> Path:
+    return sidecar_path(raw_path, "offsets", "json")
+
+
+def _iter_records(f: io.BufferedIOBase) -> Iterator[bytes]:
+    """
+    Yield complete CSV records as raw bytes (quoted fields may span physical lines).
+
+    RFC 4180 escapes quotes by doubling them, so an odd quote count means the record continues.
+    """
+    pending: list[bytes] = []
+    quotes = 0
+    for line in f:
+        pending.append(line)
+        quotes += line.count(b'"')
+        if quotes % 2 == 0:
+            yield b"".join(pending)
+            pending, quotes = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
+def _game_id_of(record: bytes, pos: int) -> str:
+    head = record.split(b",", pos + 1)
+    if pos < len(head) and b'"' not in b",".join(head[: pos + 1]):
+        return head[pos].rstrip(b"\r\n").decode("utf-8")
+    # Quoted field before / at game_id: fall back to a real CSV parse of this one record
+    return next(csv.reader(io.StringIO(record.decode("utf-8"))))[pos]
+
+
+def _gzip_member(data: bytes, level: int) -> bytes:
+    # wbits=31 → gzip container; each member decompresses on its own (BGZF-style blocks)
+    c = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return c.compress(data) + c.flush()
+
+
+@dataclass
+class GameBlock:
+    offset: int      # byte offset of the game's gzip member in the blocked file
+    length: int      # compressed length of the member
+    raw_offset: int  # decompressed byte offset of the game's first row in the original CSV
+    raw_length: int  # decompressed byte length of the game's rows
+    rows: int
+
+
+def build_seek_index(raw_path: str | Path, level: int = 6) -> "SeekIndex":
+    """
+    Recompress a pbp .csv.gz into one gzip member per game + a per-game offset index
+
+    - Streams the raw file once; only one game's bytes are held in memory
+    - The blocked file is still a valid (multi-member) .csv.gz that gzip/pandas read end to end
+    - Offsets into the decompressed original are recorded too, for tools that seek the source itself
+    - The raw file stays the source of truth: both artifacts are tagged with its fingerprint
+    """
+    raw = Path(raw_path)
+    out, idx = blocked_path(raw), offsets_path(raw)
+    tmp = out.with_name(out.name + ".tmp")
+
+    blocks: dict[str, GameBlock] = {}
+    with gzip.open(raw, mode="rb") as src, tmp.open("wb") as dst:
+        records = _iter_records(src)
+        header = next(records)
+        gid_pos = next(csv.reader(io.StringIO(header.decode("utf-8")))).index("game_id")
+
+        header_member = _gzip_member(header, level)
+        dst.write(header_member)
+        written = len(header_member)
+        raw_pos = len(header)
+
+        current: Optional[str] = None
+        buf: list[bytes] = []
+        start = raw_pos
+
+        def flush() -> None:
+            nonlocal written
+            if current is None:
+                return
+            if current in blocks:
+                raise ValueError(f"Raw file is not grouped by game_id ({current} appears twice)")
+            data = b"".join(buf)
+            member = _gzip_member(data, level)
+            dst.write(member)
+            blocks[current] = GameBlock(written, len(member), start, len(data), len(buf))
+            written += len(member)
+
+        for rec in records:
+            gid = _game_id_of(rec, gid_pos)
+            if gid != current:
+                flush()
+                current, buf, start = gid, [], raw_pos
+            buf.append(rec)
+            raw_pos += len(rec)
+        flush()
+
+    os.replace(tmp, out)
+    payload = {
+        "header_length": len(header_member),
+        "games": {gid: [b.offset, b.length, b.raw_offset, b.raw_length, b.rows] for gid, b in blocks.items()},
+    }
+    idx.write_text(json.dumps(payload), encoding="utf-8")
+    mark_fresh(idx, raw)
+    return SeekIndex(raw, payload)
+
+
+class SeekIndex:
+    """
+    O(1) single-game access to a pbp .csv.gz via its blocked copy
+
+    - A lookup seeks to the game's member, reads `length` bytes and decompresses just that
+    - Cost depends on the game's size, not on where the game sits in the season file
+    """
+
+    def __init__(self, raw_path: Path, payload: dict[str, Any]) -> None:
+        self.raw_path = Path(raw_path)
+        self.blocked = blocked_path(raw_path)
+        self._header_length = payload["header_length"]
+        self._games = {gid: GameBlock(*v) for gid, v in payload["games"].items()}
+        self._header: Optional[bytes] = None
+
+    @classmethod
+    def open(cls, raw_path: str | Path) -> Optional["SeekIndex"]:
+        """
+        The index for raw_path, or None when missing / built from an older version of the file.
+        """
+        idx = offsets_path(raw_path)
+        if not is_fresh(idx, raw_path) or not blocked_path(raw_path).exists():
+            return None
+        return cls(Path(raw_path), json.loads(idx.read_text(encoding="utf-8")))
+
+    def game_ids(self) -> list[str]:
+        return list(self._games)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._games
+
+    def block(self, game_id: str) -> GameBlock:
+        if game_id not in self._games:
+            raise ValueError(f"game_id not found: {game_id}")
+        return self._games[game_id]
+
+    def _read_member(self, f: io.BufferedIOBase, offset: int, length: int) -> bytes:
+        f.seek(offset)
+        return zlib.decompress(f.read(length), 31)
+
+    def header_bytes(self) -> bytes:
+        if self._header is None:
+            with self.blocked.open("rb") as f:
+                self._header = self._read_member(f, 0, self._header_length)
+        return self._header
+
+    def game_bytes(self, game_id: str, with_header: bool = True) -> bytes:
+        b = self.block(game_id)
+        with self.blocked.open("rb") as f:
+            rows = self._read_member(f, b.offset, b.length)
+        return self.header_bytes() + rows if with_header else rows
+
+    def iter_game_rows(self, game_id: str) -> Iterator[dict[str, str]]:
+        text = io.StringIO(self.game_bytes(game_id).decode("utf-8"), newline="")
+        yield from csv.DictReader(text)
+
+    def load_game_df(self, game_id: str, consumer: Optional[str] = None) -> "pd.DataFrame":
+        import pandas as pd
+
+        from playcall_intel.columns import resolve_columns
+
+        data = io.BytesIO(self.game_bytes(game_id))
+        if consumer is None:
+            return pd.read_csv(data, low_memory=False)
+        header = next(csv.reader(io.StringIO(self.header_bytes().decode("utf-8"))))
+        resolved = resolve_columns(consumer, header)
+        return pd.read_csv(data, usecols=resolved.usecols, dtype=resolved.dtypes, low_memory=False)
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+import urllib.parse
+import urllib.request
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from playcall_intel.columns import read_pbp
+from playcall_intel.drives import drives_from_df
+from playcall_intel.game_index import games_index_from_df
+from playcall_intel.highlights import highlights_from_df
+from playcall_intel.llm_scheduler import get_scheduler
+from playcall_intel.players import PlayerStats, player_stats_from_df
+from playcall_intel.shared_frame import FrameHandle, SharedFrame, game_slices, publish_frame
+from playcall_intel.standings import team_games_from_df, team_season_rollup, team_week_rollup
+from playcall_intel.game_report import OUT_DIR, RAW_PATH, BoxScore, compute_box_score, write_game_report
+
+
+class GameNotFound(KeyError):
+    """
+    game_id isn't in the loaded season (the only lookup failure the service reports as 404).
+    """
+
+
+class SeasonStore:
+    """
+    One season of play-by-play held in memory for the lifetime of the process
+
+    - Parses the raw CSV once per file version into a shared memory-mapped frame (shared_frame.py);
+      every request after that is a slice of it (text decoded for that game's rows only)
+    - Rows are grouped by game_id up front so a game lookup is O(1) (iloc slice, no mask over the season)
+    - The game index, WPA highlights, drive, player and team tables are derived from the same frame (no second read)
+    - Only the "serve" column manifest is parsed, not all ~370 nflverse columns
+    """
+
+    def __init__(self, raw_path: Path = RAW_PATH) -> None:
+        self.raw_path = Path(raw_path)
+        self.loaded_at = time.time()
+
+        self.shared: Optional[SharedFrame] = None
+        self.df: Optional[pd.DataFrame] = None  # private parse, only without a shared frame
+        try:
+            # Memory-mapped, read-only: every process serving this file version shares one copy
+            self.frame: Optional[FrameHandle] = publish_frame(self.raw_path, "serve")
+            self.shared = self.frame.open()
+            df = self.shared.frame()  # decoded once for the derived tables below, then dropped
+            self._slices = self.shared.games
+        except OSError:
+            self.frame = None  # read-only data dir → private parse
+            df = read_pbp(self.raw_path, "serve")
+            order = ["game_id", "play_id"] if "play_id" in df.columns else ["game_id"]
+            self.df = df = df.sort_values(order, kind="stable").reset_index(drop=True)
+            self._slices = game_slices(df)
+
+        self.games = games_index_from_df(df).sort_values(["date_label", "game_id"]).reset_index(drop=True)
+        self.highlights = highlights_from_df(df)
+        drives = drives_from_df(df)
+        self.drives = {str(gid): d.reset_index(drop=True) for gid, d in drives.groupby("game_id", sort=False)}
+        self.players = PlayerStats(player_stats_from_df(df))
+        self.team_games = team_games_from_df(df)
+
+    def game_ids(self) -> list[str]:
+        return list(self._slices)
+
+    def game_frame(self, game_id: str) -> pd.DataFrame:
+        if game_id not in self._slices:
+            raise GameNotFound(game_id)
+        s, e = self._slices[game_id]
+        return self.shared.slice(s, e) if self.shared is not None else self.df.iloc[s:e]
+
+
+class ReportService:
+    """
+    Report / box score / listing operations over a SeasonStore, safe for concurrent requests
+
+    - Box scores are memoized (the season is immutable while the process runs)
+    - Team-week / team-season rollups are materialized once at startup; lookups are filters
+    - Report generation is serialized per game so two requests never write the same file at once
+    """
+
+    def __init__(self, store: SeasonStore, out_dir: Path = OUT_DIR) -> None:
+        self.store = store
+        self.out_dir = Path(out_dir)
+        self._box_scores: dict[str, BoxScore] = {}
+        self.team_week = team_week_rollup(store.team_games)
+        self.team_season = team_season_rollup(store.team_games)
+        self._report_locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def list_games(self, team: Optional[str] = None) -> list[dict[str, Any]]:
+        games = self.store.games
+        if team:
+            games = games[(games["home_team"] == team) | (games["away_team"] == team)]
+        cols = [c for c in ["game_id", "home_team", "away_team", "season", "week", "date_label", "match_label"] if c in games.columns]
+        return json.loads(games[cols].to_json(orient="records"))
+
+    def team_table(self, table: str, team: Optional[str] = None) -> list[dict[str, Any]]:
+        t = {"season": self.team_season, "week": self.team_week}[table]
+        if team:
+            t = t[t["team"] == team]
+        return json.loads(t.to_json(orient="records"))
+
+    def box_score(self, game_id: str) -> BoxScore:
+        bs = self._box_scores.get(game_id)
+        if bs is None:
+            bs = compute_box_score(game_id, g=self.store.game_frame(game_id))
+            self._box_scores[game_id] = bs
+        return bs
+
+    def _lock_for(self, game_id: str) -> threading.Lock:
+        with self._guard:
+            return self._report_locks.setdefault(game_id, threading.Lock())
+
+    def report(self, game_id: str, force: bool = False) -> dict[str, Any]:
+        g = self.store.game_frame(game_id)  # GameNotFound → 404 before taking any lock
+        out_path = self.out_dir / f"{game_id}.md"
+
+        with self._lock_for(game_id):
+            cached = not force and out_path.exists() and out_path.stat().st_mtime >= self.store.loaded_at
+            if not cached:
+                hl = self.store.highlights.get(game_id)
+                drives = self.store.drives.get(game_id)
+                players = self.store.players.game(game_id)
+                out_path = write_game_report(
+                    game_id, out_dir=self.out_dir, g=g, hl=hl, drives=drives, players=players,
+                )
+            return {
+                "game_id": game_id,
+                "path": str(out_path),
+                "cached": cached,
+                "markdown": out_path.read_text(encoding="utf-8"),
+            }
+
+
+class _ServiceServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr: tuple[str, int], service: ReportService, verbose: bool = False) -> None:
+        super().__init__(addr, _Handler)
+        self.service = service
+        self.verbose = verbose
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _ServiceServer
+
+    routes = [
+        (re.compile(r"^/health$"), "health"),
+        (re.compile(r"^/games$"), "games"),
+        (re.compile(r"^/games/(?P<game_id>[^/]+)/box_score$"), "box_score"),
+        (re.compile(r"^/games/(?P<game_id>[^/]+)/report$"), "report"),
+        (re.compile(r"^/teams/(?P<table>season|week)$"), "teams"),
+        (re.compile(r"^/llm/queue$"), "llm_queue"),
+    ]
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        parsed = urllib.parse.urlparse(self.path)
+        query = {k: v[-1] for k, v in urllib.parse.parse_qs(parsed.query).items()}
+        service = self.server.service
+
+        for pattern, name in self.routes:
+            match = pattern.match(parsed.path)
+            if not match:
+                continue
+            try:
+                if name == "health":
+                    self._send(200, {"status": "ok", "games": len(service.store.game_ids())})
+                elif name == "games":
+                    self._send(200, service.list_games(team=query.get("team")))
+                elif name == "teams":
+                    self._send(200, service.team_table(match["table"], team=query.get("team")))
+                elif name == "llm_queue":
+                    self._send(200, get_scheduler().stats())
+                elif name == "box_score":
+                    self._send(200, asdict(service.box_score(match["game_id"])))
+                elif name == "report":
+                    force = query.get("force", "") in {"1", "true", "yes"}
+                    self._send(200, service.report(match["game_id"], force=force))
+            except GameNotFound as e:
+                self._send(404, {"error": f"game_id not found: {e.args[0]}"})
+            except Exception as e:
+                self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        self._send(404, {"error": f"unknown route: {parsed.path}"})
+
+
+def make_server(
+    raw_path: Path = RAW_PATH,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    out_dir: Path = OUT_DIR,
+    verbose: bool = False,
+) -> _ServiceServer:
+    service = ReportService(SeasonStore(raw_path), out_dir=out_dir)
+    return _ServiceServer((host, port), service, verbose=verbose)
+
+
+def serve(
+    raw_path: Path = RAW_PATH,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    out_dir: Path = OUT_DIR,
+    verbose: bool = False,
+) -> None:
+    t0 = time.perf_counter()
+    server = make_server(raw_path, host, port, out_dir, verbose)
+    n = len(server.service.store.game_ids())
+    print(f"Loaded {n} games from {raw_path} in {time.perf_counter() - t0:.1f}s")
+    print(f"Serving on http://{host}:{server.server_address[1]}  (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class ServiceClient:
+    """
+    Thin stdlib client for the local report service (used by the app and scripts)
+    """
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8765", timeout_s: float = 180.0) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout_s = timeout_s
+
+    def _get(self, path: str, **params: Any) -> Any:
+        query = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+        url = f"{self.base_url}{path}" + (f"?{query}" if query else "")
+        with urllib.request.urlopen(url, timeout=self.timeout_s) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+
+    def is_up(self) -> bool:
+        try:
+            return self._get("/health").get("status") == "ok"
+        except OSError:
+            return False
+
+    def games(self, team: Optional[str] = None) -> list[dict[str, Any]]:
+        return self._get("/games", team=team)
+
+    def box_score(self, game_id: str) -> dict[str, Any]:
+        return self._get(f"/games/{urllib.parse.quote(game_id)}/box_score")
+
+    def team_season(self, team: Optional[str] = None) -> list[dict[str, Any]]:
+        return self._get("/teams/season", team=team)
+
+    def team_weeks(self, team: Optional[str] = None) -> list[dict[str, Any]]:
+        return self._get("/teams/week", team=team)
+
+    def llm_queue(self) -> dict[str, dict[str, Any]]:
+        return self._get("/llm/queue")
+
+    def report(self, game_id: str, force: bool = False) -> dict[str, Any]:
+        return self._get(f"/games/{urllib.parse.quote(game_id)}/report", force=1 if force else None)
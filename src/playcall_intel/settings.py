@@ -34,6 +34,17 @@ class Settings:
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama3.1:8b"
 
+    # Mock client: simulated model latency per call (seconds)
+    mock_latency_s: float = 0.0
+
+    # LLM scheduling (shared by recaps and batch normalization in one process)
+    llm_max_in_flight: int = 2
+    llm_batch_max_in_flight: int = 1
+    llm_adaptive_limit: bool = False
+    llm_max_limit: int = 8
+    # Host-wide slot files shared by the batch CLI, app and service ("" / "off" = per process only)
+    llm_gate_dir: str = "data/processed/llm_gate"
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -54,4 +65,13 @@ def get_settings() -> Settings:
 
         ollama_base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
         ollama_model=os.getenv("OLLAMA_MODEL", "llama3.1:8b"),
+        mock_latency_s=float(os.getenv("MOCK_LLM_LATENCY_S", "0")),
+
+        llm_max_in_flight=int(os.getenv("LLM_MAX_IN_FLIGHT", "2")),
+        llm_batch_max_in_flight=int(os.getenv("LLM_BATCH_MAX_IN_FLIGHT", "1")),
+        llm_adaptive_limit=os.getenv("LLM_ADAPTIVE_LIMIT", "0").lower() in {"1", "true", "yes"},
+        llm_max_limit=int(os.getenv("LLM_MAX_LIMIT", "8")),
+        llm_gate_dir=os.getenv(
+            "LLM_GATE_DIR", os.path.join(os.getenv("PROCESSED_DATA_DIR", "data/processed"), "llm_gate")
+        ),
     )
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from playcall_intel.artifact_cache import raw_fingerprint
+from playcall_intel.columns import read_pbp
+
+
+MANIFEST = "frame.json"
+
+
+def frame_root(raw_path: Path) -> Path:
+    """
+    Memory-mappable copies of the season live next to the raw file: <raw>.frame/<consumer>-<size>-<mtime_ns>/
+    """
+    p = Path(raw_path)
+    return p.with_name(f"{p.name}.frame")
+
+
+@dataclass(frozen=True)
+class FrameHandle:
+    """
+    Versioned, picklable reference to a published season frame
+
+    - version is the raw file's size + mtime_ns, so a handle never opens data from another file version
+    - Cheap to send to worker processes; each calls open() and maps the same pages read-only
+    """
+
+    raw_path: str
+    consumer: str
+    version: str
+
+    @property
+    def path(self) -> Path:
+        return frame_root(Path(self.raw_path)) / f"{self.consumer}-{self.version}"
+
+    def is_current(self) -> bool:
+        raw = Path(self.raw_path)
+        return raw.exists() and _version(raw) == self.version and (self.path / MANIFEST).exists()
+
+    def open(self) -> "SharedFrame":
+        return _open_cached(self)
+
+
+def _version(raw_path: Path) -> str:
+    fp = raw_fingerprint(raw_path)
+    return f"{fp['size']}-{fp['mtime_ns']}"
+
+
+def _write_columns(df: pd.DataFrame, out: Path) -> dict:
+    """
+    One .npy per column: numbers as is, categoricals as their codes, text / ids as UTF-8 bytes + row offsets.
+    """
+    columns = []
+    for i, (name, s) in enumerate(df.items()):
+        entry: dict = {"name": name, "file": f"{i:03d}.npy"}
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            entry["kind"] = "category"
+            entry["categories"] = [str(c) for c in s.cat.categories]
+            values = s.cat.codes.to_numpy()
+        elif pd.api.types.is_numeric_dtype(s.dtype) or pd.api.types.is_bool_dtype(s.dtype):
+            entry["kind"] = "numeric"
+            values = s.to_numpy()
+        else:
+            # Free text / ids: row i is utf8[offsets[i]:offsets[i + 1]], decoded with read_pbp's dtype per slice
+            na = s.isna().to_numpy()
+            encoded = [b"" if missing else str(v).encode("utf-8") for v, missing in zip(s.to_numpy(dtype=object), na)]
+            entry["kind"] = "text"
+            entry["dtype"] = str(s.dtype)
+            entry["utf8"] = f"{i:03d}.utf8.npy"
+            np.save(out / entry["utf8"], np.frombuffer(b"".join(encoded), dtype=np.uint8), allow_pickle=False)
+            if na.any():
+                entry["na"] = f"{i:03d}.na.npy"
+                np.save(out / entry["na"], na, allow_pickle=False)
+            values = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(b) for b in encoded], out=values[1:])
+        np.save(out / entry["file"], np.ascontiguousarray(values), allow_pickle=False)
+        columns.append(entry)
+    return {"rows": len(df), "columns": columns, "games": game_slices(df)}
+
+
+def publish_frame(raw_path: Path, consumer: str = "serve", df: Optional[pd.DataFrame] = None) -> FrameHandle:
+    """
+    Write the consumer's columns for the current raw file version (once) and return its handle
+
+    - Rows are sorted by game_id / play_id so a game is one contiguous slice
+    - Written to a temp dir and renamed into place: concurrent publishers never see a partial frame
+    - Older versions are removed; processes still mapping them keep their pages until they close
+    """
+    raw_path = Path(raw_path)
+    handle = FrameHandle(str(raw_path), consumer, _version(raw_path))
+    if (handle.path / MANIFEST).exists():
+        return handle
+
+    if df is None:
+        df = read_pbp(raw_path, consumer)
+    order = ["game_id", "play_id"] if "play_id" in df.columns else ["game_id"]
+    df = df.sort_values(order, kind="stable").reset_index(drop=True)
+
+    root = frame_root(raw_path)
+    tmp = root / f".tmp-{uuid.uuid4().hex}"
+    tmp.mkdir(parents=True)
+    try:
+        manifest = _write_columns(df, tmp)
+        (tmp / MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+        try:
+            os.replace(tmp, handle.path)
+        except OSError:
+            if not (handle.path / MANIFEST).exists():
+                raise  # someone else won the race otherwise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    for old in root.glob(f"{consumer}-*"):
+        if old != handle.path:
+            shutil.rmtree(old, ignore_errors=True)
+    return handle
+
+
+class SharedFrame:
+    """
+    An opened season frame: every column stays a read-only view over the mapped files
+
+    - Numbers and categorical codes are used as is; text / ids are decoded only for the rows a slice asks
+      for, so a process holds a game's worth of strings instead of the season's (desc is the largest column)
+    - slice() returns a DataFrame with read_pbp's dtypes (text is object / str, never category)
+    - frame() decodes every row, for one-off season-wide derivations; don't keep it around
+    """
+
+    def __init__(self, path: Path) -> None:
+        manifest = json.loads((path / MANIFEST).read_text(encoding="utf-8"))
+        self.rows: int = manifest["rows"]
+        self.games: dict[str, tuple[int, int]] = {g: (int(s), int(e)) for g, (s, e) in manifest["games"].items()}
+        self._columns = []
+        for c in manifest["columns"]:
+            arrays = {"values": np.load(path / c["file"], mmap_mode="r")}
+            if c["kind"] == "text":
+                arrays["utf8"] = np.load(path / c["utf8"], mmap_mode="r")
+                if "na" in c:
+                    arrays["na"] = np.load(path / c["na"], mmap_mode="r")
+            elif c["kind"] == "category":
+                c = {**c, "cat_dtype": pd.CategoricalDtype(c["categories"])}  # one dictionary per process
+            self._columns.append((c, arrays))
+
+    @property
+    def columns(self) -> list[str]:
+        return [c["name"] for c, _ in self._columns]
+
+    def buffers(self, name: str) -> list[np.ndarray]:
+        """
+        The mapped arrays backing one column (codes / values, and for text the UTF-8 bytes and NA mask).
+        """
+        return [a for c, arrays in self._columns if c["name"] == name for a in arrays.values()]
+
+    def slice(self, start: int, end: int) -> pd.DataFrame:
+        """
+        Rows start:end (index start..end-1, like df.iloc[start:end] on the full frame).
+        """
+        index = pd.RangeIndex(start, end)
+        data = {}
+        for c, arrays in self._columns:
+            if c["kind"] == "text":
+                data[c["name"]] = pd.Series(_decode(arrays, start, end), index=index, dtype=c["dtype"])
+            elif c["kind"] == "category":
+                codes = arrays["values"][start:end]
+                data[c["name"]] = pd.Series(
+                    pd.Categorical.from_codes(codes, dtype=c["cat_dtype"], validate=False), index=index, copy=False
+                )
+            else:
+                data[c["name"]] = pd.Series(arrays["values"][start:end], index=index, copy=False)
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def frame(self) -> pd.DataFrame:
+        return self.slice(0, self.rows)
+
+
+def _decode(arrays: dict[str, np.ndarray], start: int, end: int) -> np.ndarray:
+    offsets = arrays["values"][start:end + 1]
+    chunk = arrays["utf8"][offsets[0]:offsets[-1]].tobytes()
+    rel = (offsets - offsets[0]).tolist()
+    out = np.array([chunk[a:b].decode("utf-8") for a, b in zip(rel[:-1], rel[1:])], dtype=object)
+    if "na" in arrays:
+        out[arrays["na"][start:end]] = np.nan
+    return out
+
+
+# One opened frame per handle per process: every session / thread shares it
+_OPENED: dict[FrameHandle, SharedFrame] = {}
+_LOCK = threading.Lock()
+
+
+def _open_cached(handle: FrameHandle) -> SharedFrame:
+    with _LOCK:
+        if handle in _OPENED:
+            return _OPENED[handle]
+    frame = SharedFrame(handle.path)
+    with _LOCK:
+        for stale in [h for h in _OPENED if h.raw_path == handle.raw_path and h.consumer == handle.consumer]:
+            del _OPENED[stale]  # older file version
+        return _OPENED.setdefault(handle, frame)
+
+
+def open_frame(raw_path: Path, consumer: str = "serve") -> SharedFrame:
+    """
+    The season frame for the current raw file, memory-mapped read-only (published first if needed).
+    """
+    return publish_frame(raw_path, consumer).open()
+
+
+def game_slices(df: pd.DataFrame) -> dict[str, tuple[int, int]]:
+    """
+    game_id → (start, end) row range in a frame sorted by game_id.
+    """
+    ids = df["game_id"].astype(str).to_numpy()
+    if not len(ids):
+        return {}
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    ends = np.r_[starts[1:], len(ids)]
+    return {str(ids[s]): (int(s), int(e)) for s, e in zip(starts, ends)}
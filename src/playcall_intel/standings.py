@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from playcall_intel.artifact_cache import is_fresh, mark_fresh
+from playcall_intel.ingest import PlayStore, default_store_dir
+from playcall_intel.tables import StoreTable, numeric
+
+
+# One row per game × team, same numbers as compute_box_score (plus the opponent's side of them)
+TEAM_GAME_COLUMNS = [
+    "game_id", "season", "week", "team", "opponent", "home",
+    "points_for", "points_against", "off_plays", "pass", "run", "yards", "turnovers", "sacks",
+    "plays_allowed", "yards_allowed", "takeaways", "sacks_made",
+]
+MEASURES = TEAM_GAME_COLUMNS[6:]
+RECORD = ["games", "wins", "losses", "ties"]
+TABLES = ("team_games", "team_week", "team_season")
+
+
+def table_path(raw_path: Path, table: str, store_dir: Optional[Path] = None) -> Path:
+    """
+    Team tables are materialized with the season's ingest store: <store>/<table>.csv
+    """
+    if table not in TABLES:
+        raise ValueError(f"unknown team table: {table} (expected one of {TABLES})")
+    return Path(store_dir if store_dir is not None else default_store_dir(raw_path)) / f"{table}.csv"
+
+
+def _season_week(games: pd.DataFrame) -> pd.DataFrame:
+    # nflverse game ids are <season>_<week>_<away>_<home>; used when season/week columns are missing
+    parts = games["game_id"].astype(str).str.split("_", expand=True)
+    for i, col in enumerate(["season", "week"]):
+        values = games[col] if col in games.columns else parts[i]
+        games[col] = pd.to_numeric(values, errors="coerce").fillna(0).astype(np.int64)
+    return games
+
+
+def team_games_from_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-game box scores for every game in df as game × team rows (one grouped pass, no per-game loop)
+
+    - Offense: rows with a posteam, like compute_box_score; final score = last row with both scores
+    - Defensive columns (yards_allowed, takeaways, sacks_made) are the opponent's offense in the same game
+    """
+    if df.empty:
+        return pd.DataFrame(columns=TEAM_GAME_COLUMNS)
+    order = ["game_id", "play_id"] if "play_id" in df.columns else ["game_id"]
+    df = df.sort_values(order, kind="stable")
+
+    keep = [c for c in ["game_id", "home_team", "away_team", "season", "week"] if c in df.columns]
+    games = _season_week(df[keep].drop_duplicates("game_id").reset_index(drop=True))
+    games[["home_team", "away_team"]] = games[["home_team", "away_team"]].astype(str)
+
+    # Same score columns, in the same preference order, as compute_box_score
+    home_col = next((c for c in ["total_home_score", "home_score"] if c in df.columns), None)
+    away_col = next((c for c in ["total_away_score", "away_score"] if c in df.columns), None)
+    if not home_col or not away_col:
+        raise ValueError(
+            "Could not find final score columns (expected total_home_score/total_away_score or home_score/away_score)."
+        )
+    scored = df.dropna(subset=[home_col, away_col])
+    finals = scored.groupby("game_id", sort=False)[[home_col, away_col]].last()
+    finals.columns = ["home_score_final", "away_score_final"]
+    games = games.join(finals, on="game_id")
+    games[["home_score_final", "away_score_final"]] = games[["home_score_final", "away_score_final"]].fillna(0)
+
+    off = df[df["posteam"].notna()]
+    agg = pd.DataFrame({
+        "game_id": off["game_id"].astype(str),
+        "team": off["posteam"].astype(str),
+        "off_plays": 1,
+        "pass": numeric(off, "pass"),
+        "run": numeric(off, "rush"),
+        "yards": numeric(off, "yards_gained"),
+        "turnovers": numeric(off, "interception") + numeric(off, "fumble_lost"),
+        "sacks": numeric(off, "sack"),
+    }).groupby(["game_id", "team"], sort=False).sum()
+
+    sides = []
+    for home, team_col, opp_col, pf, pa in [
+        (1, "home_team", "away_team", "home_score_final", "away_score_final"),
+        (0, "away_team", "home_team", "away_score_final", "home_score_final"),
+    ]:
+        sides.append(pd.DataFrame({
+            "game_id": games["game_id"].astype(str),
+            "season": games["season"],
+            "week": games["week"],
+            "team": games[team_col],
+            "opponent": games[opp_col],
+            "home": home,
+            "points_for": games[pf],
+            "points_against": games[pa],
+        }))
+    rows = pd.concat(sides, ignore_index=True)
+    rows = rows.join(agg, on=["game_id", "team"])
+    allowed = agg.rename(columns={
+        "off_plays": "plays_allowed", "yards": "yards_allowed", "turnovers": "takeaways", "sacks": "sacks_made",
+    })[["plays_allowed", "yards_allowed", "takeaways", "sacks_made"]]
+    rows = rows.join(allowed, on=["game_id", "opponent"])
+    rows[MEASURES] = rows[MEASURES].fillna(0).astype(np.int64)
+    return rows.sort_values(["game_id", "home"], ascending=[True, False]).reset_index(drop=True)[TEAM_GAME_COLUMNS]
+
+
+def _rollup(team_games: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    if team_games.empty:
+        return pd.DataFrame(columns=keys + RECORD + MEASURES)
+    t = team_games.assign(
+        games=1,
+        wins=(team_games["points_for"] > team_games["points_against"]).astype(np.int64),
+        losses=(team_games["points_for"] < team_games["points_against"]).astype(np.int64),
+        ties=(team_games["points_for"] == team_games["points_against"]).astype(np.int64),
+    )
+    out = t.groupby(keys, sort=True)[RECORD + MEASURES].sum().reset_index()
+    plays = out["off_plays"].replace(0, np.nan)
+    return out.assign(
+        yards_per_play=(out["yards"] / plays).round(2),
+        yards_per_play_allowed=(out["yards_allowed"] / out["plays_allowed"].replace(0, np.nan)).round(2),
+        turnover_margin=out["takeaways"] - out["turnovers"],
+        sack_rate=(out["sacks"] / out["pass"].replace(0, np.nan)).round(3),
+        points_per_game=(out["points_for"] / out["games"]).round(1),
+    )
+
+
+def team_week_rollup(team_games: pd.DataFrame) -> pd.DataFrame:
+    return _rollup(team_games, ["season", "week", "team"])
+
+
+def team_season_rollup(team_games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Standings-style season table: record, points, yards/play, turnover margin, sack rate per team
+    """
+    out = _rollup(team_games, ["season", "team"])
+    if out.empty:
+        return out
+    return out.sort_values(["season", "wins", "points_for"], ascending=[True, False, False]).reset_index(drop=True)
+
+
+TEAM_GAMES_TABLE = StoreTable(
+    "team_games", "team_games.csv", team_games_from_df, sort_by=("game_id", "team"),
+    dtype={"game_id": str, "team": str, "opponent": str},
+)
+
+# Derived from team_games, not from plays: a full re-aggregation is one groupby over a few hundred rows
+ROLLUPS = {"team_week": team_week_rollup, "team_season": team_season_rollup}
+
+
+def _save(path: Path, raw_path: Path, table: pd.DataFrame) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table.to_csv(path, index=False)
+    mark_fresh(path, raw_path)
+
+
+def load_team_table(
+    raw_path: Path,
+    table: str = "team_season",
+    use_cache: bool = True,
+    store_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    One materialized table (team_games / team_week / team_season), cached until the raw file changes
+
+    - team_games is a StoreTable; the week / season rollups are re-derived from it when stale
+    """
+    raw_path = Path(raw_path)
+    path = table_path(raw_path, table, store_dir)
+    if table == "team_games":
+        return TEAM_GAMES_TABLE.load(raw_path, use_cache, store_dir)
+    if use_cache and is_fresh(path, raw_path):
+        return TEAM_GAMES_TABLE.read(path)
+
+    out = ROLLUPS[table](TEAM_GAMES_TABLE.load(raw_path, use_cache, store_dir))
+    if use_cache:
+        try:
+            _save(path, raw_path, out)
+        except OSError:
+            pass  # read-only data dir
+    return out
+
+
+def load_team_tables(raw_paths: Iterable[Path], table: str = "team_season") -> pd.DataFrame:
+    """
+    The same table across several season files (each season's materialized table, concatenated).
+    """
+    frames = [load_team_table(p, table) for p in raw_paths]
+    frames = [f for f in frames if not f.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def refresh_team_tables(raw_path: Path, store: PlayStore) -> int:
+    """
+    Re-aggregate the store's dirty games into team_games, then re-derive the rollups; returns games done.
+    """
+    done = TEAM_GAMES_TABLE.refresh(raw_path, store)
+    paths = {name: table_path(raw_path, name, store.root) for name in ROLLUPS}
+    if done or not all(is_fresh(p, raw_path) for p in paths.values()):
+        team_games = TEAM_GAMES_TABLE.read(TEAM_GAMES_TABLE.path(raw_path, store.root))
+        for name, rollup in ROLLUPS.items():
+            _save(paths[name], raw_path, rollup(team_games))
+    return done
+
+
+def format_standings(season_table: pd.DataFrame) -> str:
+    if season_table.empty:
+        return "_No games available._"
+    lines = [
+        "| Season | Team | W-L-T | PF | PA | Yds/play | Yds/play allowed | TO margin | Sack rate |",
+        "|---:|---|---|---:|---:|---:|---:|---:|---:|",
+    ]
+    for r in season_table.itertuples(index=False):
+        lines.append(
+            f"| {r.season} | {r.team} | {r.wins}-{r.losses}-{r.ties} | {r.points_for} | {r.points_against} | "
+            f"{r.yards_per_play} | {r.yards_per_play_allowed} | {r.turnover_margin:+d} | {r.sack_rate:.1%} |"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+
+
+TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE",
+    "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+    "LA", "LAC", "LV", "MIA", "MIN", "NE", "NO", "NYG",
+    "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]
+
+# Schema variants seen across nflverse releases / exports
+VARIANT_NO_GAME_DATE = "no_game_date"      # drop game_date → index falls back to season/week label
+VARIANT_PLAIN_SCORES = "plain_scores"      # home_score/away_score instead of total_home_score/total_away_score
+VARIANT_NO_WPA = "no_wpa"                  # drop wp/wpa columns → no highlights
+VARIANT_NO_DRIVE = "no_drive"              # drop drive/fixed_drive → possession-change fallback
+
+BASE_COLUMNS = [
+    "play_id", "game_id", "home_team", "away_team", "season_type", "week", "season", "game_date",
+    "posteam", "defteam", "side_of_field", "yardline_100", "quarter_seconds_remaining",
+    "game_seconds_remaining", "drive", "fixed_drive", "qtr", "down", "ydstogo", "desc",
+    "play_type", "yards_gained", "pass", "rush", "no_play", "penalty", "qb_kneel", "qb_spike",
+    "kickoff_attempt", "punt_attempt", "field_goal_attempt", "extra_point_attempt",
+    "two_point_attempt", "touchdown", "interception", "fumble_lost", "sack", "incomplete_pass",
+    "complete_pass", "out_of_bounds", "total_home_score", "total_away_score", "posteam_score",
+    "defteam_score", "wp", "home_wp", "wpa", "passer_player_id", "passer_player_name",
+    "rusher_player_id", "rusher_player_name", "receiver_player_id", "receiver_player_name",
+    "interception_player_id", "interception_player_name", "sack_player_id", "sack_player_name",
+    "solo_tackle_1_player_id", "solo_tackle_1_player_name",
+]
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    """
+    Knobs for a synthetic nflverse-shaped play-by-play season
+
+    - Sized like the real thing by default (272 games, ~170 rows each, ~370 columns)
+    - Variants reproduce the schema drift the loaders must tolerate
+    - Seeded so benchmark inputs are identical run to run
+    """
+
+    seasons: tuple[int, ...] = (2025,)
+    games_per_season: int = 272
+    plays_per_game: int = 170
+    pad_columns: int = 310  # filler columns so parse cost resembles the ~370-column nflverse file
+    variants: frozenset[str] = field(default_factory=frozenset)
+    seed: int = 7
+
+
+def _columns(cfg: SyntheticConfig) -> list[str]:
+    cols = list(BASE_COLUMNS)
+    if VARIANT_NO_GAME_DATE in cfg.variants:
+        cols.remove("game_date")
+    if VARIANT_PLAIN_SCORES in cfg.variants:
+        cols[cols.index("total_home_score")] = "home_score"
+        cols[cols.index("total_away_score")] = "away_score"
+    if VARIANT_NO_WPA in cfg.variants:
+        for c in ["wp", "home_wp", "wpa"]:
+            cols.remove(c)
+    if VARIANT_NO_DRIVE in cfg.variants:
+        for c in ["drive", "fixed_drive"]:
+            cols.remove(c)
+    cols.extend(f"extra_col_{i:03d}" for i in range(cfg.pad_columns))
+    return cols
+
+
+def _roster(team: str) -> dict[str, tuple[str, str]]:
+    # Stable fake players per team: (player_id, "F.Last")
+    def p(slot: int, name: str) -> tuple[str, str]:
+        return f"00-{TEAMS.index(team):02d}{slot:05d}", f"{name[0]}.{team.title()}{name}"
+
+    return {
+        "qb": p(1, "Passer"),
+        "rb": p(2, "Runner"),
+        "wr1": p(3, "Wideout"),
+        "wr2": p(4, "Slot"),
+        "te": p(5, "Tight"),
+        "lb": p(6, "Backer"),
+        "edge": p(7, "Rusher"),
+        "cb": p(8, "Corner"),
+    }
+
+
+def _home_wp(score_diff: int, seconds_left: int) -> float:
+    # Crude but monotone: the lead matters more as the clock runs down
+    scale = 0.12 + 0.9 * (1.0 - seconds_left / 3600.0)
+    return 1.0 / (1.0 + math.exp(-score_diff * scale))
+
+
+def _fmt_clock(qsec: int) -> str:
+    return f"({qsec // 60}:{qsec % 60:02d})"
+
+
+def iter_game_rows(
+    game_id: str,
+    season: int,
+    week: int,
+    home: str,
+    away: str,
+    game_date: str,
+    cfg: SyntheticConfig,
+    rng: random.Random,
+) -> Iterator[dict[str, Any]]:
+    """
+    Simulate one game as a stream of nflverse-like row dicts
+
+    - Down/distance/field position/score evolve consistently so aggregates look sane
+    - Emits the flag columns the mapper and box score read (rush/pass/sack/...)
+    - Player id/name columns follow nflverse naming for player-level consumers
+    """
+    rosters = {home: _roster(home), away: _roster(away)}
+    scores = {home: 0, away: 0}
+    offense, defense = away, home
+    yardline, down, togo = 75, 1, 10
+    drive = 1
+    seconds_left = 3600
+    per_play = max(1, 3600 // max(cfg.plays_per_game, 1))
+    prev_home_wp = 0.5
+
+    for play_id in range(1, cfg.plays_per_game + 1):
+        qtr = min(4, 1 + (3600 - seconds_left) // 900)
+        qsec = seconds_left - (4 - qtr) * 900
+        clock = _fmt_clock(max(qsec, 0))
+        off_r, def_r = rosters[offense], rosters[defense]
+
+        row: dict[str, Any] = {
+            "play_id": play_id, "game_id": game_id, "home_team": home, "away_team": away,
+            "season_type": "REG", "week": week, "season": season, "game_date": game_date,
+            "posteam": offense, "defteam": defense,
+            "side_of_field": offense if yardline > 50 else defense,
+            "yardline_100": yardline, "quarter_seconds_remaining": max(qsec, 0),
+            "game_seconds_remaining": seconds_left, "drive": drive, "fixed_drive": drive,
+            "qtr": qtr, "down": down, "ydstogo": togo,
+        }
+        flags = dict.fromkeys(
+            ["pass", "rush", "no_play", "penalty", "qb_kneel", "qb_spike", "kickoff_attempt",
+             "punt_attempt", "field_goal_attempt", "extra_point_attempt", "two_point_attempt",
+             "touchdown", "interception", "fumble_lost", "sack", "incomplete_pass",
+             "complete_pass", "out_of_bounds"],
+            0,
+        )
+        change_possession = False
+        gained = 0
+        roll = rng.random()
+
+        if down == 4 and yardline <= 35:
+            flags["field_goal_attempt"] = 1
+            ptype = "field_goal"
+            good = rng.random() < 0.85
+            if good:
+                scores[offense] += 3
+            row["desc"] = f"{clock} 3-K.{offense.title()}Kicker {yardline + 17} yard field goal is {'GOOD' if good else 'No Good'}."
+            change_possession = True
+        elif down == 4:
+            flags["punt_attempt"] = 1
+            ptype = "punt"
+            dist = rng.randint(35, 55)
+            row["desc"] = f"{clock} 8-P.{offense.title()}Punter punts {dist} yards."
+            yardline = max(5, min(95, 100 - (yardline - dist)))
+            offense, defense = defense, offense
+            down, togo, drive = 1, 10, drive + 1
+            seconds_left -= per_play
+            change_possession = None  # already swapped
+        elif roll < 0.04:
+            flags["penalty"] = 1
+            flags["no_play"] = 1
+            ptype = "no_play"
+            row["desc"] = f"{clock} PENALTY on {defense}, Defensive Offside, 5 yards, enforced at {yardline}. No Play."
+            yardline = max(1, yardline - 5)
+            togo = max(1, togo - 5)
+        elif roll < 0.46:
+            flags["rush"] = 1
+            ptype = "run"
+            gained = int(rng.gauss(4.3, 5))
+            gained = max(-5, min(gained, yardline))
+            rid, rname = off_r["rb"]
+            row.update(rusher_player_id=rid, rusher_player_name=rname)
+            tid, tname = def_r["lb"]
+            row.update(solo_tackle_1_player_id=tid, solo_tackle_1_player_name=tname)
+            direction = rng.choice(["left end", "left tackle", "up the middle", "right tackle", "right end"])
+            row["desc"] = f"{clock} 21-{rname} {direction} to {offense} {max(1, yardline - gained)} for {gained} yards ({tname})."
+            if rng.random() < 0.01:
+                flags["fumble_lost"] = 1
+                row["desc"] = row["desc"][:-1] + f" FUMBLES, RECOVERED by {defense}."
+                change_possession = True
+        else:
+            flags["pass"] = 1
+            ptype = "pass"
+            qid, qname = off_r["qb"]
+            row.update(passer_player_id=qid, passer_player_name=qname)
+            r = rng.random()
+            if r < 0.065:
+                flags["sack"] = 1
+                gained = -rng.randint(3, 10)
+                sid, sname = def_r["edge"]
+                row.update(sack_player_id=sid, sack_player_name=sname)
+                row["desc"] = f"{clock} 1-{qname} sacked at {offense} {yardline - gained} for {gained} yards ({sname})."
+            elif r < 0.09:
+                flags["interception"] = 1
+                iid, iname = def_r["cb"]
+                row.update(interception_player_id=iid, interception_player_name=iname)
+                row["desc"] = f"{clock} 1-{qname} pass deep right INTERCEPTED by 24-{iname}."
+                change_possession = True
+            elif r < 0.45:
+                flags["incomplete_pass"] = 1
+                target_id, target_name = off_r[rng.choice(["wr1", "wr2", "te"])]
+                row.update(receiver_player_id=target_id, receiver_player_name=target_name)
+                row["desc"] = f"{clock} 1-{qname} pass incomplete short left to 11-{target_name}."
+            else:
+                flags["complete_pass"] = 1
+                gained = max(-2, min(int(rng.expovariate(1 / 9.5)), yardline))
+                target_id, target_name = off_r[rng.choice(["wr1", "wr2", "te"])]
+                row.update(receiver_player_id=target_id, receiver_player_name=target_name)
+                row["desc"] = f"{clock} 1-{qname} pass short right to 11-{target_name} to {offense} {max(1, yardline - gained)} for {gained} yards."
+                if rng.random() < 0.12:
+                    flags["out_of_bounds"] = 1
+                    row["desc"] = row["desc"][:-1] + ", ran ob."
+
+        if change_possession is not None:
+            yardline -= gained
+            if yardline <= 0 and not flags["interception"] and not flags["fumble_lost"]:
+                flags["touchdown"] = 1
+                scores[offense] += 7
+                row["desc"] += " TOUCHDOWN."
+                change_possession = True
+            if change_possession:
+                offense, defense = defense, offense
+                yardline, down, togo, drive = 75, 1, 10, drive + 1
+            elif not flags["no_play"]:
+                if gained >= togo:
+                    down, togo = 1, min(10, yardline)
+                else:
+                    down, togo = down + 1, togo - gained
+                yardline = max(1, min(99, yardline))
+            seconds_left = max(0, seconds_left - per_play)
+
+        home_wp = _home_wp(scores[home] - scores[away], seconds_left)
+        pos_wp = home_wp if row["posteam"] == home else 1.0 - home_wp
+        pos_prev = prev_home_wp if row["posteam"] == home else 1.0 - prev_home_wp
+        prev_home_wp = home_wp
+
+        row.update(flags)
+        row.update(
+            play_type=ptype,
+            yards_gained=gained,
+            total_home_score=scores[home],
+            total_away_score=scores[away],
+            home_score=scores[home],
+            away_score=scores[away],
+            posteam_score=scores[row["posteam"]],
+            defteam_score=scores[row["defteam"]],
+            wp=round(pos_wp, 6),
+            home_wp=round(home_wp, 6),
+            wpa=round(pos_wp - pos_prev, 6),
+        )
+        yield row
+
+
+def iter_season_rows(season: int, cfg: SyntheticConfig) -> Iterator[dict[str, Any]]:
+    rng = random.Random(f"{cfg.seed}-{season}")
+    per_week = len(TEAMS) // 2
+    kickoff = date(season, 9, 4)
+
+    for i in range(cfg.games_per_season):
+        week = 1 + i // per_week
+        teams = list(TEAMS)
+        random.Random(f"{cfg.seed}-{season}-{week}").shuffle(teams)
+        slot = i % per_week
+        away, home = teams[2 * slot], teams[2 * slot + 1]
+        game_id = f"{season}_{week:02d}_{away}_{home}"
+        game_date = (kickoff + timedelta(days=7 * (week - 1) + slot % 3)).isoformat()
+        yield from iter_game_rows(game_id, season, week, home, away, game_date, cfg, rng)
+
+
+def write_synthetic_season(path: str | Path, season: int, cfg: SyntheticConfig = SyntheticConfig()) -> Path:
+    """
+    Write one synthetic season as a gzipped nflverse-style CSV
+
+    - Streams rows straight to disk (no pandas) so generating 10 seasons stays cheap
+    - Missing values are written as empty fields, matching nflverse exports
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    cols = _columns(cfg)
+    with gzip.open(p, mode="wt", encoding="utf-8", newline="", compresslevel=6) as f:
+        writer = csv.DictWriter(f, fieldnames=cols, extrasaction="ignore", restval="")
+        writer.writeheader()
+        for row in iter_season_rows(season, cfg):
+            writer.writerow(row)
+    return p
+
+
+def write_synthetic_dataset(out_dir: str | Path, cfg: SyntheticConfig = SyntheticConfig()) -> list[Path]:
+    """
+    Write `play_by_play_<season>.csv.gz` for every configured season into out_dir.
+    """
+    out = Path(out_dir)
+    return [write_synthetic_season(out / f"play_by_play_{s}.csv.gz", s, cfg) for s in cfg.seasons]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate synthetic nflverse-shaped play-by-play data")
+    parser.add_argument("--out-dir", default="data/synthetic")
+    parser.add_argument("--seasons", type=int, nargs="+", default=[2025])
+    parser.add_argument("--games", type=int, default=272, help="Games per season")
+    parser.add_argument("--plays", type=int, default=170, help="Rows per game")
+    parser.add_argument("--variant", action="append", default=[], help="Schema variant (repeatable)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    cfg = SyntheticConfig(
+        seasons=tuple(args.seasons),
+        games_per_season=args.games,
+        plays_per_game=args.plays,
+        variants=frozenset(args.variant),
+        seed=args.seed,
+    )
+    for p in write_synthetic_dataset(args.out_dir, cfg):
+        print(f"Wrote {p}")
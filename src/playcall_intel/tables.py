@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from playcall_intel.artifact_cache import is_fresh, mark_fresh
+from playcall_intel.columns import read_pbp
+from playcall_intel.ingest import PlayStore, default_store_dir
+
+
+def numeric(df: pd.DataFrame, col: str, fill: float = 0.0) -> pd.Series:
+    """
+    A pbp column as numbers; missing / unparseable values (or a missing column) become fill
+    """
+    if col not in df.columns:
+        return pd.Series(fill, index=df.index)
+    values = pd.to_numeric(df[col], errors="coerce")
+    return values if pd.isna(fill) else values.fillna(fill)
+
+
+def md_table(header: list[str], rows: list[list]) -> str:
+    """
+    Markdown table with a left-aligned first column and right-aligned numbers
+    """
+    lines = ["| " + " | ".join(header) + " |", "|---|" + "---:|" * (len(header) - 1)]
+    lines += ["| " + " | ".join(str(v) for v in r) + " |" for r in rows]
+    return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class StoreTable:
+    """
+    A per-game derived table persisted with the season's ingest store: <store>/<filename>
+
+    - build turns the plays of any number of games into rows keyed by game_id, so a few games can be
+      re-derived from the store and spliced in without re-reading the season
+    - name is the column manifest for a full build, the consumer used to load dirty games and the
+      PlayStore dirty set refresh() consumes
+    - Rows are kept sorted by sort_by, so an incrementally patched table equals a full rebuild
+    """
+
+    name: str
+    filename: str
+    build: Callable[[pd.DataFrame], pd.DataFrame]
+    sort_by: tuple[str, ...]
+    dtype: dict[str, Any] = field(default_factory=dict)
+    keep_default_na: bool = True
+
+    def path(self, raw_path: Path, store_dir: Optional[Path] = None) -> Path:
+        return Path(store_dir if store_dir is not None else default_store_dir(raw_path)) / self.filename
+
+    def read(self, path: Path) -> pd.DataFrame:
+        return pd.read_csv(path, dtype=self.dtype, keep_default_na=self.keep_default_na)
+
+    def _sorted(self, table: pd.DataFrame) -> pd.DataFrame:
+        return table.sort_values(list(self.sort_by), kind="stable").reset_index(drop=True)
+
+    def load(self, raw_path: Path, use_cache: bool = True, store_dir: Optional[Path] = None) -> pd.DataFrame:
+        """
+        Season table, cached in the ingest store directory until the raw file changes.
+        """
+        raw_path = Path(raw_path)
+        path = self.path(raw_path, store_dir)
+        if use_cache and is_fresh(path, raw_path):
+            return self.read(path)
+
+        table = self._sorted(self.build(read_pbp(raw_path, self.name)))
+        if use_cache:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                table.to_csv(path, index=False)
+                mark_fresh(path, raw_path)
+            except OSError:
+                pass  # read-only data dir
+        return table
+
+    def cached_game(self, game_id: str, raw_path: Path, store_dir: Optional[Path] = None) -> Optional[pd.DataFrame]:
+        """
+        One game's rows from a fresh persisted table, or None (never triggers a season parse).
+        """
+        path = self.path(raw_path, store_dir)
+        if not is_fresh(path, raw_path):
+            return None
+        table = self.read(path)
+        return table[table["game_id"] == game_id].reset_index(drop=True)
+
+    def update(
+        self,
+        raw_path: Path,
+        game_frames: dict[str, Optional[pd.DataFrame]],
+        store_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Patch the persisted table for a handful of games (None = game removed); no-op when nothing is cached yet.
+        """
+        path = self.path(raw_path, store_dir)
+        if not path.exists():
+            return
+        table = self.read(path)
+        table = table[~table["game_id"].isin(list(game_frames))]
+        frames = [f for f in game_frames.values() if f is not None and not f.empty]
+        if frames:
+            table = pd.concat([table, self.build(pd.concat(frames, ignore_index=True))], ignore_index=True)
+        self._sorted(table).to_csv(path, index=False)
+        mark_fresh(path, raw_path)
+
+    def refresh(self, raw_path: Path, store: PlayStore) -> int:
+        """
+        Re-derive the store's dirty games (full build when no table exists yet); returns games done.
+        """
+        path = self.path(raw_path, store.root)
+        if not path.exists():
+            self.load(raw_path, store_dir=store.root)
+            store.mark_clean(self.name)
+            return len(store.game_ids())
+
+        dirty = store.dirty(self.name)
+        if dirty:
+            self.update(raw_path, {
+                gid: (store.load_game(gid, consumer=self.name) if store.has_game(gid) else None) for gid in dirty
+            }, store_dir=store.root)
+        elif not is_fresh(path, raw_path):
+            mark_fresh(path, raw_path)  # raw file touched, no game changed
+        store.mark_clean(self.name)
+        return len(dirty)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+from playcall_intel.artifact_cache import is_fresh, mark_fresh, read_meta, sidecar_path
+
+
+NORMALIZED_PATH = Path("data/processed/normalized_sample.csv")
+
+# Situational buckets (labels are what the query API and the app accept)
+DISTANCE_BINS = [0, 3, 6, 10, 99]
+DISTANCE_LABELS = ["short (1-3)", "medium (4-6)", "long (7-10)", "very long (11+)"]
+FIELD_BINS = [0, 20, 40, 60, 80, 99]
+FIELD_LABELS = ["red zone (1-20)", "opp 21-40", "midfield 41-60", "own 21-40", "own 1-20"]
+
+DIMENSIONS = ["posteam", "down", "distance_bucket", "field_bucket", "quarter"]
+MEASURES = ["play_type", "result"]
+
+
+def _bucket(values: pd.Series, bins: list[int], labels: list[str]) -> pd.Series:
+    return pd.cut(pd.to_numeric(values, errors="coerce"), bins=bins, labels=labels).astype(object)
+
+
+def distance_buckets(distance: pd.Series) -> pd.Series:
+    return _bucket(distance, DISTANCE_BINS, DISTANCE_LABELS)
+
+
+def field_buckets(yardline_100: pd.Series) -> pd.Series:
+    return _bucket(yardline_100, FIELD_BINS, FIELD_LABELS)
+
+
+def distance_bucket(distance: int) -> str:
+    return str(distance_buckets(pd.Series([distance])).iloc[0])
+
+
+def field_bucket(yardline_100: int) -> str:
+    return str(field_buckets(pd.Series([yardline_100])).iloc[0])
+
+
+def cube_from_plays(plays: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate normalized plays into the situational cube (vectorized: pd.cut + one groupby)
+
+    - One row per offense × down × distance bucket × field bucket × quarter × play_type × result
+    - Measures are additive (plays, yards), so cubes for different games can simply be summed
+    """
+    if plays.empty:
+        return pd.DataFrame(columns=DIMENSIONS + MEASURES + ["plays", "yards"])
+    df = pd.DataFrame({
+        "posteam": plays["posteam"].astype(str),
+        "down": pd.to_numeric(plays["down"], errors="coerce"),
+        "distance_bucket": distance_buckets(plays["distance"]),
+        "field_bucket": field_buckets(plays["yardline_100"]),
+        "quarter": pd.to_numeric(plays["quarter"], errors="coerce") if "quarter" in plays.columns else 0,
+        "play_type": plays["play_type"].astype(str),
+        "result": plays["result"].fillna("unknown").astype(str),
+        "yards": pd.to_numeric(plays["yards_gained"], errors="coerce").fillna(0),
+    })
+    df = df.dropna(subset=["down", "distance_bucket", "field_bucket", "quarter"])
+    df = df.astype({"down": "int64", "quarter": "int64"})
+    return (
+        df.groupby(DIMENSIONS + MEASURES, sort=True)
+        .agg(plays=("yards", "size"), yards=("yards", "sum"))
+        .reset_index()
+    )
+
+
+def _merge(*cubes: pd.DataFrame) -> pd.DataFrame:
+    parts = [c for c in cubes if not c.empty]
+    if not parts:
+        return cube_from_plays(pd.DataFrame())
+    merged = pd.concat(parts, ignore_index=True)
+    return merged.groupby(DIMENSIONS + MEASURES, sort=True)[["plays", "yards"]].sum().reset_index()
+
+
+@dataclass
+class TendencyCube:
+    cube: pd.DataFrame
+    games: dict[str, int]  # game_id → normalized rows folded into the cube
+
+    def __post_init__(self) -> None:
+        # Per-offense slices: most questions are about one team
+        self._by_team = {str(t): f for t, f in self.cube.groupby("posteam", sort=False)}
+
+    def teams(self) -> list[str]:
+        return sorted(self._by_team)
+
+    def add_plays(self, plays: pd.DataFrame) -> "TendencyCube":
+        """
+        Fold in normalized rows of games not in the cube yet (already-counted games are skipped).
+        """
+        new = plays[~plays["game_id"].astype(str).isin(self.games)]
+        if new.empty:
+            return self
+        games = {**self.games, **new["game_id"].astype(str).value_counts().to_dict()}
+        return TendencyCube(_merge(self.cube, cube_from_plays(new)), games)
+
+    def query(
+        self,
+        team: Optional[str] = None,
+        down: Optional[int] = None,
+        distance: Union[None, int, str] = None,
+        yardline_100: Union[None, int, str] = None,
+        quarter: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Play-type mix for one situation slice: plays, share, yards/play, success-ish result counts
+
+        - distance / yardline_100 accept raw values (bucketed here) or bucket labels
+        """
+        c = self._by_team.get(team, self.cube.iloc[0:0]) if team else self.cube
+        mask = pd.Series(True, index=c.index)
+        if down is not None:
+            mask &= c["down"] == int(down)
+        if distance is not None:
+            mask &= c["distance_bucket"] == (distance if isinstance(distance, str) else distance_bucket(distance))
+        if yardline_100 is not None:
+            fb = yardline_100 if isinstance(yardline_100, str) else field_bucket(yardline_100)
+            mask &= c["field_bucket"] == fb
+        if quarter is not None:
+            mask &= c["quarter"] == int(quarter)
+
+        s = c[mask]
+        if s.empty:
+            return pd.DataFrame(columns=["play_type", "plays", "share", "yards_per_play"])
+        by_type = s.groupby("play_type")[["plays", "yards"]].sum()
+        results = s.pivot_table(index="play_type", columns="result", values="plays", aggfunc="sum", fill_value=0)
+        out = by_type.assign(
+            share=lambda x: (x["plays"] / x["plays"].sum()).round(3),
+            yards_per_play=lambda x: (x["yards"] / x["plays"]).round(2),
+        ).drop(columns="yards")
+        return out.join(results).sort_values("plays", ascending=False).reset_index()
+
+
+def tendency_cube_path(normalized_path: Path) -> Path:
+    return sidecar_path(normalized_path, "tendency_cube")
+
+
+def _save(path: Path, source: Path, tc: TendencyCube) -> None:
+    tc.cube.to_csv(path, index=False)
+    mark_fresh(path, source, games=tc.games)
+
+
+def load_tendency_cube(normalized_path: Path = NORMALIZED_PATH) -> TendencyCube:
+    """
+    Cube over a normalized plays CSV, cached next to it
+
+    - Fresh cache → read the (small) cube as is
+    - Stale cache → only games not yet in the cube are aggregated and merged in;
+      a game that changed row count or disappeared means a re-normalization, so the cube is rebuilt
+    - Files from before game_id / quarter were written (baseline batch schema) have nothing to merge on:
+      the cube is always rebuilt in full and every play counts as quarter 0
+    """
+    normalized_path = Path(normalized_path)
+    path = tendency_cube_path(normalized_path)
+    meta = read_meta(path) if path.exists() else None
+    if meta is not None and is_fresh(path, normalized_path):
+        return TendencyCube(pd.read_csv(path), meta.get("games", {}))
+
+    plays = pd.read_csv(normalized_path)
+    if "game_id" not in plays.columns:
+        tc = TendencyCube(cube_from_plays(plays), {})  # baseline schema: no per-game merge metadata
+    else:
+        counts = plays["game_id"].astype(str).value_counts().to_dict()
+        if meta is not None and all(counts.get(g) == n for g, n in meta.get("games", {}).items()):
+            tc = TendencyCube(pd.read_csv(path), meta["games"]).add_plays(plays)
+        else:
+            tc = TendencyCube(cube_from_plays(plays), counts)
+    try:
+        _save(path, normalized_path, tc)
+    except OSError:
+        pass  # read-only data dir
+    return tc
+
+
+def format_query(df: pd.DataFrame) -> str:
+    if df.empty:
+        return "No plays in this situation."
+    return df.to_string(index=False)
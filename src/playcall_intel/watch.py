@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from playcall_intel.artifact_cache import raw_fingerprint
+from playcall_intel.drives import cached_game_drives, refresh_drive_table
+from playcall_intel.game_index import update_games_index
+from playcall_intel.game_report import OUT_DIR, write_game_report
+from playcall_intel.highlights import update_highlight_index
+from playcall_intel.players import cached_game_players, refresh_player_table
+from playcall_intel.scouting import refresh_game_rollups
+from playcall_intel.standings import refresh_team_tables
+from playcall_intel.ingest import PlayStore, default_store_dir, ingest
+from playcall_intel.search_index import refresh_search_index
+from playcall_intel.wp_timeline import update_wp_timelines
+
+
+RAW_GLOB = "play_by_play_*.csv.gz"
+
+
+@dataclass
+class RebuildSummary:
+    raw_path: Path
+    ingest_summary: str = ""
+    index_updated: int = 0
+    rebuilt: dict[str, float] = field(default_factory=dict)  # game_id → seconds
+    failed: dict[str, str] = field(default_factory=dict)     # game_id → error
+    deleted: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def render(self) -> str:
+        lines = [
+            f"[watch] {self.raw_path.name}: {self.ingest_summary}",
+            f"[watch] index entries updated: {self.index_updated}; reports rebuilt: {len(self.rebuilt)}, "
+            f"failed: {len(self.failed)}, deleted: {len(self.deleted)} in {self.seconds:.1f}s",
+        ]
+        for gid, secs in sorted(self.rebuilt.items()):
+            lines.append(f"  rebuilt  {gid}  {secs:.2f}s")
+        for gid, err in sorted(self.failed.items()):
+            lines.append(f"  FAILED   {gid}  {err}")
+        for gid in self.deleted:
+            lines.append(f"  deleted  {gid}")
+        return "\n".join(lines)
+
+
+def _timed_report(game_id: str, raw_path: Path, out_dir: Path, store: PlayStore) -> float:
+    # Everything comes from the store refresh() just patched, which need not be the default one
+    t0 = time.perf_counter()
+    g = store.load_game(game_id, consumer="report")
+    if "play_id" in g.columns:
+        g = g.sort_values("play_id")
+    write_game_report(
+        game_id,
+        raw_path=raw_path,
+        out_dir=out_dir,
+        g=g,
+        drives=cached_game_drives(game_id, raw_path, store_dir=store.root),
+        players=cached_game_players(game_id, raw_path, store_dir=store.root),
+    )
+    return time.perf_counter() - t0
+
+
+def refresh(
+    raw_path: Path,
+    out_dir: Path = OUT_DIR,
+    workers: int = 4,
+    include_new: bool = False,
+    store: Optional[PlayStore] = None,
+) -> RebuildSummary:
+    """
+    One incremental refresh after the raw file changed
+
+    - ingest() diffs game-level content hashes and rewrites only changed partitions
+    - Index entries (games, WPA highlights, WP timelines) are patched for the touched games only
+    - Reports are regenerated (worker pool) only for dirty games that already have a report,
+      plus brand-new games when include_new is set; reports of removed games are deleted
+    """
+    t0 = time.perf_counter()
+    raw_path = Path(raw_path)
+    store = store if store is not None else PlayStore(default_store_dir(raw_path))
+    summary = RebuildSummary(raw_path=raw_path)
+
+    result = ingest(raw_path, store)
+    summary.ingest_summary = result.summary()
+
+    # Index entries
+    stale_index = store.dirty("game_index")
+    if stale_index:
+        frames = {
+            gid: (store.load_game(gid, consumer="games_index") if store.has_game(gid) else None)
+            for gid in stale_index
+        }
+        update_games_index(raw_path, frames)
+        update_highlight_index(raw_path, {
+            gid: (store.load_game(gid, consumer="highlights") if store.has_game(gid) else None)
+            for gid in stale_index
+        })
+        update_wp_timelines(raw_path, {
+            gid: (store.load_game(gid, consumer="wp_timeline") if store.has_game(gid) else None)
+            for gid in stale_index
+        })
+        store.mark_clean("game_index", stale_index)
+        summary.index_updated = len(stale_index)
+
+    refresh_search_index(raw_path, store)
+    refresh_drive_table(raw_path, store)
+    refresh_player_table(raw_path, store)
+    refresh_game_rollups(raw_path, store)
+    refresh_team_tables(raw_path, store)
+
+    # Reports
+    out_dir = Path(out_dir)
+    dirty_reports = store.dirty("reports")
+    for gid in sorted(dirty_reports - set(store.game_ids())):
+        report = out_dir / f"{gid}.md"
+        if report.exists():
+            report.unlink()
+            summary.deleted.append(gid)
+
+    targets = sorted(
+        gid for gid in dirty_reports & set(store.game_ids())
+        if (out_dir / f"{gid}.md").exists() or (include_new and gid in result.added)
+    )
+    if targets:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(_timed_report, gid, raw_path, out_dir, store): gid for gid in targets}
+            for fut in as_completed(futures):
+                gid = futures[fut]
+                try:
+                    summary.rebuilt[gid] = fut.result()
+                except Exception as e:
+                    summary.failed[gid] = f"{type(e).__name__}: {e}"
+
+    # Games without a report aren't stale; only failures stay dirty for the next round
+    store.mark_clean("reports", set(dirty_reports) - set(summary.failed))
+
+    summary.seconds = time.perf_counter() - t0
+    return summary
+
+
+def watch(
+    raw_dir: Path,
+    out_dir: Path = OUT_DIR,
+    interval_s: float = 5.0,
+    workers: int = 4,
+    include_new: bool = False,
+    once: bool = False,
+) -> None:
+    """
+    Poll raw_dir for play_by_play_<season>.csv.gz changes and refresh affected reports
+
+    - Stdlib polling (size + mtime), no watcher dependency
+    - A file is processed only once its fingerprint is stable across two polls (download finished)
+    """
+    raw_dir = Path(raw_dir)
+    processed: dict[Path, dict[str, int]] = {}
+    previous: dict[Path, dict[str, int]] = {}
+    print(f"[watch] watching {raw_dir}/{RAW_GLOB} every {interval_s:.0f}s (Ctrl+C to stop)")
+
+    try:
+        while True:
+            current = {p: raw_fingerprint(p) for p in sorted(raw_dir.glob(RAW_GLOB))}
+            for path, fp in current.items():
+                stable = once or previous.get(path) == fp
+                if stable and processed.get(path) != fp:
+                    summary = refresh(path, out_dir=out_dir, workers=workers, include_new=include_new)
+                    print(summary.render())
+                    processed[path] = fp
+            previous = current
+            if once:
+                return
+            time.sleep(interval_s)
+    except KeyboardInterrupt:
+        print("[watch] stopped")
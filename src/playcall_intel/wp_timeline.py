@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from playcall_intel.artifact_cache import is_fresh, mark_fresh, sidecar_path
+from playcall_intel.columns import read_pbp
+
+
+DOWNSAMPLE_POINTS = 100  # per game; plenty for a chart, keeps the big swings (LTTB)
+REGULATION_S = 3600
+OT_PERIOD_S = 600
+
+
+@dataclass
+class WPSeries:
+    game_id: str
+    elapsed_s: np.ndarray  # game clock elapsed (OT continues past 3600)
+    home_wp: np.ndarray    # home team win probability after each play
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"minute": self.elapsed_s / 60.0, "home_wp": self.home_wp})
+
+
+def wp_timeline_path(raw_path: Path) -> Path:
+    return sidecar_path(raw_path, "wp_timeline", "npz")
+
+
+def _elapsed_seconds(df: pd.DataFrame) -> np.ndarray:
+    if "game_seconds_remaining" not in df.columns:
+        # No clock: one "second" per play keeps the ordering
+        return df.groupby("game_id", sort=False).cumcount().to_numpy(dtype="float64")
+    remaining = df["game_seconds_remaining"].to_numpy(dtype="float64")
+    elapsed = REGULATION_S - remaining
+    if "qtr" in df.columns:
+        # nflverse OT periods count down from 600 again
+        qtr = df["qtr"].to_numpy(dtype="float64")
+        ot = qtr >= 5
+        elapsed[ot] = REGULATION_S + (qtr[ot] - 5) * OT_PERIOD_S + (OT_PERIOD_S - remaining[ot])
+    return elapsed
+
+
+def _home_wp(df: pd.DataFrame) -> pd.Series:
+    home_wp = df["home_wp"] if "home_wp" in df.columns else pd.Series(np.nan, index=df.index)
+    if {"wp", "posteam", "home_team"}.issubset(df.columns):
+        # wp is from the offense's side; flip it when the away team has the ball
+        is_home = (df["posteam"].astype(object) == df["home_team"].astype(object)).to_numpy()
+        from_wp = pd.Series(np.where(is_home, df["wp"], 1.0 - df["wp"]), index=df.index)
+        from_wp[df["posteam"].isna()] = np.nan
+        home_wp = home_wp.fillna(from_wp)
+    return home_wp.astype("float64")
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of n_out points that keep the visual shape of (x, y)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        nlo, nhi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        nhi = max(nhi, nlo + 1)
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+class WPTimelines:
+    """
+    Per-game home win-probability series for a season, packed CSR-style
+
+    - One float32 array per field for the whole season + per-game offsets (no per-game objects on disk)
+    - A downsampled variant is stored alongside so the app chart never touches the full series
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]) -> None:
+        self._arrays = arrays
+        self._pos = {str(gid): i for i, gid in enumerate(arrays["game_ids"])}
+
+    def game_ids(self) -> list[str]:
+        return list(self._pos)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._pos
+
+    def get(self, game_id: str, downsampled: bool = True) -> Optional[WPSeries]:
+        i = self._pos.get(game_id)
+        if i is None:
+            return None
+        prefix = "ds_" if downsampled else ""
+        s, e = self._arrays[prefix + "offsets"][i : i + 2]
+        return WPSeries(
+            game_id=game_id,
+            elapsed_s=self._arrays[prefix + "elapsed"][s:e].astype("float64"),
+            home_wp=self._arrays[prefix + "home_wp"][s:e].astype("float64"),
+        )
+
+    def series(self) -> dict[str, tuple[WPSeries, WPSeries]]:
+        return {gid: (self.get(gid, downsampled=False), self.get(gid)) for gid in self._pos}
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            np.savez_compressed(f, **self._arrays)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "WPTimelines":
+        with np.load(path, allow_pickle=False) as npz:
+            return cls({k: npz[k] for k in npz.files})
+
+
+def _pack(series: dict[str, tuple[WPSeries, WPSeries]]) -> WPTimelines:
+    arrays: dict[str, np.ndarray] = {"game_ids": np.array(list(series), dtype=str)}
+    for prefix, which in [("", 0), ("ds_", 1)]:
+        parts = [pair[which] for pair in series.values()]
+        lengths = [len(p.home_wp) for p in parts]
+        arrays[prefix + "offsets"] = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        arrays[prefix + "elapsed"] = np.concatenate([p.elapsed_s for p in parts] or [[]]).astype(np.float32)
+        arrays[prefix + "home_wp"] = np.concatenate([p.home_wp for p in parts] or [[]]).astype(np.float32)
+    return WPTimelines(arrays)
+
+
+def _split_games(df: pd.DataFrame, max_points: int) -> dict[str, tuple[WPSeries, WPSeries]]:
+    order = ["game_id", "play_id"] if "play_id" in df.columns else ["game_id"]
+    df = df.sort_values(order, kind="stable")
+    home_wp = _home_wp(df).to_numpy()
+    elapsed = _elapsed_seconds(df)
+    ok = ~np.isnan(home_wp) & ~np.isnan(elapsed)
+
+    ids = df["game_id"].astype(str).to_numpy()[ok]
+    home_wp, elapsed = home_wp[ok], elapsed[ok]
+    if len(ids) == 0:
+        return {}
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    ends = np.r_[starts[1:], len(ids)]
+
+    out = {}
+    for s, e in zip(starts, ends):
+        full = WPSeries(ids[s], elapsed[s:e], home_wp[s:e])
+        keep = lttb(full.elapsed_s, full.home_wp, max_points)
+        out[full.game_id] = (full, WPSeries(full.game_id, full.elapsed_s[keep], full.home_wp[keep]))
+    return out
+
+
+def wp_timelines_from_df(df: pd.DataFrame, max_points: int = DOWNSAMPLE_POINTS) -> WPTimelines:
+    """
+    Win-probability series for every game in df, in one vectorized pass over the season
+
+    - Uses home_wp where present, else wp flipped to the home side by posteam
+    - Plays without a probability (timeouts, end of quarter) are skipped
+    """
+    return _pack(_split_games(df, max_points))
+
+
+def load_wp_timelines(raw_path: Path, use_cache: bool = True) -> WPTimelines:
+    """
+    Season timelines, cached next to the raw file (`*.wp_timeline.npz`) until it changes.
+    """
+    raw_path = Path(raw_path)
+    path = wp_timeline_path(raw_path)
+    if use_cache and is_fresh(path, raw_path):
+        return WPTimelines.load(path)
+
+    timelines = wp_timelines_from_df(read_pbp(raw_path, "wp_timeline"))
+    if use_cache:
+        try:
+            timelines.save(path)
+            mark_fresh(path, raw_path)
+        except OSError:
+            pass  # read-only data dir
+    return timelines
+
+
+def update_wp_timelines(raw_path: Path, game_frames: dict[str, Optional[pd.DataFrame]]) -> None:
+    """
+    Patch the cached timelines for a handful of games (watch path); no-op when nothing is cached yet.
+    """
+    path = wp_timeline_path(raw_path)
+    if not path.exists():
+        return
+    series = WPTimelines.load(path).series()
+    for gid, frame in game_frames.items():
+        series.pop(gid, None)
+        if frame is not None and not frame.empty:
+            series.update(_split_games(frame, DOWNSAMPLE_POINTS))
+    _pack(series).save(path)
+    mark_fresh(path, raw_path)
@@ -0,0 +1,37 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from playcall_intel.ingest import IngestResult, PlayStore, ingest
+from playcall_intel.llm_scheduler import get_scheduler
+from playcall_intel.settings import get_settings
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+@dataclass
+class SeasonFixture:
+    raw: Path
+    store: PlayStore
+
+    def write(self, games: int, plays: int = 40) -> IngestResult:
+        """
+        (Re)write the synthetic raw file and ingest it; same seed → earlier games only change with plays
+        """
+        write_synthetic_season(self.raw, 2025, SyntheticConfig(games_per_season=games, plays_per_game=plays, pad_columns=0))
+        return ingest(self.raw, self.store)
+
+
+@pytest.fixture
+def season(tmp_path) -> SeasonFixture:
+    return SeasonFixture(tmp_path / "play_by_play_2025.csv.gz", PlayStore(tmp_path / "store"))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _llm_gate_dir(tmp_path_factory):
+    # The host-wide LLM gate's lock files go to a temp dir, not data/processed in the checkout
+    os.environ["LLM_GATE_DIR"] = str(tmp_path_factory.mktemp("llm_gate"))
+    get_settings.cache_clear()
+    get_scheduler.cache_clear()
+    yield
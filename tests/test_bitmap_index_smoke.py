@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from playcall_intel.bitmap_index import BitmapIndex, load_bitmap_index
+
+
+def test_bitmap_queries_match_masks(tmp_path):
+    rng = np.random.default_rng(3)
+    n = 1000
+    plays = pd.DataFrame({
+        "game_id": [f"2025_{1 + i // 100:02d}_ARI_NO" for i in range(n)],
+        "season": 2025,
+        "posteam": rng.choice(["ARI", "NO", "SEA"], n),
+        "defteam": rng.choice(["ARI", "NO", "SEA"], n),
+        "quarter": rng.integers(1, 5, n),
+        "down": rng.integers(1, 5, n),
+        "distance": rng.integers(1, 16, n),
+        "yardline_100": rng.integers(1, 100, n),
+        "play_type": rng.choice(["run", "pass", "punt"], n),
+        "result": rng.choice(["gain", "touchdown", "incomplete"], n),
+    })
+    norm = tmp_path / "normalized.csv"
+    plays.to_csv(norm, index=False)
+
+    idx = load_bitmap_index(norm)
+    hit = idx.where(posteam="ARI", down=3, play_type=["pass", "run"]) - idx.eq("result", "incomplete")
+    mask = (
+        (plays["posteam"] == "ARI") & (plays["down"] == 3) & plays["play_type"].isin(["pass", "run"])
+        & ~(plays["result"] == "incomplete")
+    )
+    assert hit.count() == int(mask.sum())
+    assert list(hit.rows()) == list(np.flatnonzero(mask.to_numpy()))
+    assert (~hit).count() == n - hit.count()
+    assert idx.where(field_bucket="red zone (1-20)").count() == int((plays["yardline_100"] <= 20).sum())
+
+    # Persisted copy answers the same
+    again = load_bitmap_index(norm)
+    assert again.where(posteam="ARI", down=3, play_type=["pass", "run"]).bits == idx.where(
+        posteam="ARI", down=3, play_type=["pass", "run"]
+    ).bits
+    assert BitmapIndex.build(plays.head(0)).all().count() == 0
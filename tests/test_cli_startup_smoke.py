@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+from playcall_intel.artifact_cache import mark_fresh, sidecar_path
+
+
+def _run_cli(argv: list[str]) -> tuple[set[str], str]:
+    # Fresh interpreter: other tests have already imported pandas into this one
+    probe = (
+        "import sys\n"
+        "from playcall_intel.__main__ import main\n"
+        "try:\n"
+        f"    main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('heavy=' + ','.join(m for m in ('pandas', 'pydantic', 'dotenv') if m in sys.modules), file=sys.stderr)\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    marker = proc.stderr.strip().splitlines()[-1]
+    return {m for m in marker.removeprefix("heavy=").split(",") if m}, proc.stdout
+
+
+def _heavy_imports_after(argv: list[str]) -> set[str]:
+    return _run_cli(argv)[0]
+
+
+def test_help_does_not_import_heavy_dependencies():
+    assert _heavy_imports_after(["--help"]) == set()
+    assert _heavy_imports_after(["report", "--help"]) == set()
+
+
+def test_games_lists_from_cached_index_without_pandas(tmp_path):
+    raw = tmp_path / "play_by_play_2025.csv.gz"
+    raw.write_bytes(b"not parsed on the cached path")
+
+    cache = sidecar_path(raw, "games_index")
+    cache.write_text(
+        "game_id,home_team,away_team,date_label,match_label\n"
+        "2025_01_ARI_NO,NO,ARI,2025-09-07,2025-09-07 — ARI @ NO\n"
+        "2025_01_KC_LAC,LAC,KC,2025-09-05,2025-09-05 — KC @ LAC\n",
+        encoding="utf-8",
+    )
+    mark_fresh(cache, raw)
+
+    heavy, out = _run_cli(["games", "--raw", str(raw), "--team", "ARI"])
+    assert "pandas" not in heavy
+    assert "2025_01_ARI_NO" in out
+    assert "2025_01_KC_LAC" not in out
@@ -0,0 +1,33 @@
+import pytest
+
+from playcall_intel.columns import read_pbp, resolve_columns, resolve_for_file
+from playcall_intel.synthetic import VARIANT_NO_GAME_DATE, VARIANT_PLAIN_SCORES, SyntheticConfig, write_synthetic_season
+
+
+def test_resolve_picks_first_present_variant():
+    header = ["game_id", "home_team", "away_team", "posteam", "home_score", "away_score", "game_start_time"]
+
+    box = resolve_columns("box_score", header)
+    assert box.col("home_score_final") == "home_score"
+
+    idx = resolve_columns("games_index", header)
+    assert idx.col("date") == "game_start_time"
+
+    with pytest.raises(ValueError):
+        resolve_columns("games_index", ["home_team", "away_team"])
+
+
+def test_read_pbp_projects_columns_with_dtypes(tmp_path):
+    cfg = SyntheticConfig(
+        games_per_season=2,
+        plays_per_game=20,
+        pad_columns=50,
+        variants=frozenset({VARIANT_NO_GAME_DATE, VARIANT_PLAIN_SCORES}),
+    )
+    raw = write_synthetic_season(tmp_path / "play_by_play_2025.csv.gz", 2025, cfg)
+
+    df = read_pbp(raw, "report")
+    assert set(df.columns) == set(resolve_for_file("report", raw).usecols)
+    assert "extra_col_000" not in df.columns
+    assert "home_score" in df.columns and "total_home_score" not in df.columns
+    assert str(df["posteam"].dtype) == "category"
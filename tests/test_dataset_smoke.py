@@ -0,0 +1,33 @@
+import pytest
+
+from playcall_intel.dataset import Dataset, season_path_for_game
+from playcall_intel.game_index import GameIndexConfig, load_games_index
+from playcall_intel.game_report import load_game_df
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_dataset
+
+
+def test_dataset_discovers_and_loads_seasons_lazily(tmp_path):
+    cfg = SyntheticConfig(seasons=(2023, 2024, 2025), games_per_season=2, plays_per_game=20, pad_columns=0)
+    write_synthetic_dataset(tmp_path, cfg)
+
+    ds = Dataset(tmp_path, max_cached_seasons=1)
+    assert ds.seasons() == [2023, 2024, 2025]
+
+    # LRU keeps one parsed season: a repeat hit is the same frame, an evicted one is re-parsed
+    first = ds.load_season(2023)
+    assert ds.load_season(2023) is first
+    latest = ds.load_season(2024)
+    assert ds.load_season(2024) is latest
+    assert ds.load_season(2023) is not first
+
+    with pytest.raises(ValueError, match="1999"):
+        ds.games_index(seasons=(2023, 1999))
+
+    games = load_games_index(GameIndexConfig(raw_path=tmp_path / "play_by_play_2025.csv.gz", seasons=(2023, 2025)))
+    assert set(games["season"]) == {2023, 2025}
+
+    # A 2023 game resolves to the 2023 file even when called with the 2025 default path
+    gid = str(games[games["season"] == 2023]["game_id"].iloc[0])
+    assert season_path_for_game(gid, tmp_path / "play_by_play_2025.csv.gz").name == "play_by_play_2023.csv.gz"
+    assert (load_game_df(gid, raw_path=tmp_path / "play_by_play_2025.csv.gz")["game_id"] == gid).all()
+    assert len(ds.load_game_df(gid)) == 20
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from playcall_intel.drives import drives_from_df, format_drive_chart, load_drive_table
+from playcall_intel.synthetic import VARIANT_NO_DRIVE, SyntheticConfig, write_synthetic_season
+
+
+def test_drive_segmentation_with_and_without_drive_columns(season, tmp_path):
+    season.write(games=2, plays=80)
+    df = pd.read_csv(season.raw, low_memory=False)
+
+    drives = load_drive_table(season.raw, store_dir=season.store.root)
+    offense = df[df["posteam"].notna()]
+    assert drives["plays"].sum() == len(offense)
+    assert drives.groupby("game_id").size().to_dict() == offense.groupby("game_id")["fixed_drive"].nunique().to_dict()
+    assert drives["yards"].sum() == offense["yards_gained"].sum()
+    assert set(drives["result"]) <= {
+        "Touchdown", "Turnover", "Field goal", "Missed field goal", "Punt", "Safety", "Turnover on downs", "End of half",
+    }
+
+    # Possession-change fallback (no drive columns) segments the same drives
+    no_drive = tmp_path / "play_by_play_2024.csv.gz"
+    cfg = SyntheticConfig(games_per_season=2, plays_per_game=80, pad_columns=0, variants=frozenset({VARIANT_NO_DRIVE}))
+    write_synthetic_season(no_drive, 2025, cfg)
+    fallback = drives_from_df(pd.read_csv(no_drive, low_memory=False))
+    pd.testing.assert_frame_equal(fallback, drives_from_df(df))
+
+    gid = drives["game_id"].iloc[0]
+    chart = format_drive_chart(drives[drives["game_id"] == gid])
+    assert chart.count("\n") == (drives["game_id"] == gid).sum() + 1
@@ -0,0 +1,25 @@
+import pandas as pd
+
+from playcall_intel.game_report import top_wpa_plays_by_team
+from playcall_intel.highlights import cached_game_highlights, highlights_from_df, load_highlight_index
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+def test_highlight_index_matches_per_game_sorts(tmp_path):
+    raw = tmp_path / "play_by_play_2025.csv.gz"
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=3, plays_per_game=40, pad_columns=0))
+    df = pd.read_csv(raw, low_memory=False)
+
+    index = highlights_from_df(df)
+    assert sorted(index) == sorted(df["game_id"].unique())
+
+    for gid, g in df.groupby("game_id"):
+        hl = index[gid]
+        for team in [g["home_team"].iloc[0], g["away_team"].iloc[0]]:
+            assert hl.team_top(team) == top_wpa_plays_by_team(g, team, n=3)
+        expected = g.dropna(subset=["wpa", "desc"]).assign(a=lambda x: x["wpa"].abs())
+        assert hl.swings == expected.sort_values("a", ascending=False, kind="stable").head(10)["desc"].tolist()
+
+    assert cached_game_highlights(gid, raw) is None
+    load_highlight_index(raw)
+    assert cached_game_highlights(gid, raw) == index[gid]
@@ -0,0 +1,23 @@
+from playcall_intel.ingest import PlayStore, ingest
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+def test_ingest_only_touches_new_games(tmp_path):
+    raw = tmp_path / "play_by_play_2025.csv.gz"
+    store = PlayStore(tmp_path / "store")
+
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=3, plays_per_game=30, pad_columns=0))
+    first = ingest(raw, store)
+    assert len(first.added) == 3 and not first.changed
+
+    store.mark_clean("reports")
+    again = ingest(raw, store)
+    assert again.touched == [] and again.rows_written == 0
+
+    # Next week: same games plus one more (same seed → identical first three games)
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=4, plays_per_game=30, pad_columns=0))
+    week2 = ingest(raw, store)
+    assert len(week2.added) == 1 and len(week2.unchanged) == 3
+    assert store.dirty("reports") == set(week2.added)
+    assert store.is_current(raw)
+    assert len(store.load_game(week2.added[0])) == 30
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from playcall_intel.batch_normalize import run_batch
+from playcall_intel.llm_client import MockLLMClient
+from playcall_intel.llm_normalize import normalize_with_llm_v1_async
+from playcall_intel.llm_scheduler import BATCH, INTERACTIVE, LLMScheduler
+from playcall_intel.metrics import RunMetrics
+from playcall_intel.ollama_client import OllamaClient
+from playcall_intel.schema import Play
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+PLAY = Play(
+    offense_team="ARI",
+    defense_team="NO",
+    quarter=1,
+    down=1,
+    distance=10,
+    yardline_100=78,
+    play_type="run",
+    play_text="(14:56) 6-J.Conner right tackle to ARI 25 for 3 yards (92-D.Godchaux).",
+    yards_gained=3,
+    result="tackle",
+)
+
+
+def test_many_in_flight_normalizations_on_one_loop():
+    client = MockLLMClient(fixed_play_type="run", fixed_result="tackle", fixed_yards_gained=3, latency_s=0.05)
+    sched = LLMScheduler(max_in_flight=500)
+    metrics = RunMetrics("async")
+
+    async def main():
+        return await asyncio.gather(
+            *(normalize_with_llm_v1_async(PLAY, client, metrics=metrics, scheduler=sched) for _ in range(500))
+        )
+
+    t0 = time.perf_counter()
+    outs = asyncio.run(main())
+    assert time.perf_counter() - t0 < 5.0  # 500 × 50ms sequentially would be 25s
+    assert {o.play_type for o in outs} == {"run"}
+    assert metrics.counters["llm_outputs"] == 500
+
+
+def test_async_waiters_share_limits_with_threads():
+    sched = LLMScheduler(max_in_flight=1)
+    order = []
+
+    async def call(priority, label):
+        async with sched.aslot(priority, tenant=label):
+            order.append(label)
+            await asyncio.sleep(0.001)
+
+    def blocker(release):
+        with sched.slot(BATCH, tenant="thread"):
+            release.wait()
+
+    async def main():
+        release = threading.Event()
+        t = threading.Thread(target=blocker, args=(release,))
+        t.start()
+        while sched.stats()[BATCH]["in_flight"] == 0:
+            await asyncio.sleep(0.001)
+        tasks = [asyncio.create_task(call(BATCH, "batch")), asyncio.create_task(call(INTERACTIVE, "recap"))]
+        while sched.depth() < 2:
+            await asyncio.sleep(0.001)
+        release.set()
+        await asyncio.gather(*tasks)
+        t.join(timeout=5)
+
+    asyncio.run(main())
+    assert order == ["recap", "batch"]
+    assert sched.stats()[BATCH]["in_flight"] == 0
+
+
+def test_waiter_on_a_closed_loop_does_not_keep_the_slot():
+    sched = LLMScheduler(max_in_flight=1)
+
+    async def wants_slot():
+        async with sched.aslot(BATCH, tenant="dead"):
+            pass
+
+    with sched.slot(BATCH, tenant="holder"):
+        loop = asyncio.new_event_loop()
+        loop.create_task(wants_slot())
+        while sched.depth() == 0:
+            loop.run_until_complete(asyncio.sleep(0.001))
+        loop.close()  # e.g. the caller's loop died without cancelling its tasks
+    # Releasing didn't raise, and the dead ticket didn't take the slot with it
+    assert sched.depth() == 0 and sched.stats()[BATCH]["in_flight"] == 0
+    with sched.slot(BATCH, tenant="next") as waited:
+        assert waited < 1.0
+
+
+def test_ollama_async_client_speaks_http():
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            req = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            body = json.dumps({"model": req["model"], "response": json.dumps({"echo": req["prompt"]})}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = OllamaClient(model="test", base_url=f"http://127.0.0.1:{server.server_address[1]}", timeout_s=5)
+        out = asyncio.run(client.acomplete_json("hello"))
+        assert json.loads(out) == {"echo": "hello"}
+        assert client.complete_json("hello") == out
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_async_batch_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    cfg = SyntheticConfig(games_per_season=2, plays_per_game=40, pad_columns=0)
+    raw = write_synthetic_season(tmp_path / "play_by_play_2025.csv.gz", 2025, cfg)
+
+    seq = run_batch(sample_size=60, raw_path=raw, out_path=tmp_path / "seq" / "normalized.csv", workers=1)
+    aio = run_batch(sample_size=60, raw_path=raw, out_path=tmp_path / "aio" / "normalized.csv", use_async=True)
+
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "seq" / "normalized.csv"), pd.read_csv(tmp_path / "aio" / "normalized.csv")
+    )
+    assert seq.counters == aio.counters
+    assert aio.gauges["llm_async"] == 1
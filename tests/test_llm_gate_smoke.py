@@ -0,0 +1,56 @@
+import json
+import multiprocessing
+import threading
+import time
+
+from playcall_intel.llm_gate import SlotGate
+from playcall_intel.llm_scheduler import BATCH, INTERACTIVE, LLMScheduler
+
+
+def _batch_run(gate_dir, log_path, calls):
+    # Another process's batch normalization: three workers hammering a one-slot host gate
+    sched = LLMScheduler(max_in_flight=4, gate=SlotGate(gate_dir, 1, poll_s=0.001))
+    spans, lock = [], threading.Lock()
+
+    def worker():
+        for _ in range(calls):
+            with sched.slot(BATCH, tenant="batch"):
+                t0 = time.time()
+                time.sleep(0.02)
+                with lock:
+                    spans.append((t0, time.time()))
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    with open(log_path, "w") as f:
+        json.dump(spans, f)
+
+
+def test_recap_in_another_process_goes_ahead_of_a_batch_run(tmp_path):
+    gate = SlotGate(tmp_path / "gate", 1)
+    ctx = multiprocessing.get_context("spawn")
+    batch = ctx.Process(target=_batch_run, args=(str(gate.root), str(tmp_path / "batch.json"), 30))
+    batch.start()
+    try:
+        deadline = time.time() + 30
+        while gate.held() == 0 and time.time() < deadline:
+            time.sleep(0.005)  # until the batch process is calling
+
+        sched = LLMScheduler(max_in_flight=2, gate=gate)
+        with sched.slot(INTERACTIVE, tenant="app") as waited:
+            recap = (time.time(), time.time() + 0.02)
+            time.sleep(0.02)
+        assert waited < 0.5  # at most one batch call ahead of it, not the queue of 90
+    finally:
+        batch.join(timeout=60)
+    assert batch.exitcode == 0
+
+    # One host-wide slot: no two calls from either process ever overlapped
+    spans = sorted([tuple(s) for s in json.loads((tmp_path / "batch.json").read_text())] + [recap])
+    assert len(spans) == 91
+    assert all(b[0] >= a[1] for a, b in zip(spans, spans[1:]))
+    assert spans[-1] != recap  # the recap didn't wait for the batch run to finish
+    assert gate.held() == 0
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from playcall_intel import batch_normalize
+from playcall_intel.batch_normalize import run_batch
+from playcall_intel.llm_client import MockLLMClient
+from playcall_intel.llm_limit import AdaptiveLimit
+from playcall_intel.metrics import RunMetrics
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+def test_limit_grows_while_latency_is_stable_and_backs_off_on_slowdown_or_error():
+    limit = AdaptiveLimit(initial=2, max_limit=6, log=False)
+    limit.on_sample(1.0, ok=True, saturated=True)  # first sample sets the baseline
+    for _ in range(20):
+        limit.on_sample(1.0, ok=True, saturated=True)
+    assert limit.limit == 6
+
+    # Not saturated → no growth signal
+    grown = AdaptiveLimit(initial=2, log=False)
+    for _ in range(20):
+        grown.on_sample(1.0, ok=True, saturated=False)
+    assert grown.limit == 2
+
+    limit.on_sample(3.0, ok=True, saturated=True)
+    assert limit.limit == 4  # 6 × 0.75
+    limit.on_sample(3.0, ok=True, saturated=True)
+    assert limit.limit == 4  # same burst: one decrease per baseline interval
+
+    limit._last_drop = float("-inf")
+    limit.on_sample(0.5, ok=False, saturated=True)
+    assert limit.limit == 3
+
+    assert [h[1] for h in limit.history][:1] == [2]
+    assert limit.history[-1][1] == 3 and limit.history[-1][2] == "error"
+
+
+def test_concurrent_batch_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    cfg = SyntheticConfig(games_per_season=2, plays_per_game=40, pad_columns=0)
+    raw = write_synthetic_season(tmp_path / "play_by_play_2025.csv.gz", 2025, cfg)
+
+    seq = run_batch(sample_size=60, raw_path=raw, out_path=tmp_path / "seq" / "normalized.csv", workers=1)
+    par = run_batch(sample_size=60, raw_path=raw, out_path=tmp_path / "par" / "normalized.csv", workers=4)
+
+    a = pd.read_csv(tmp_path / "seq" / "normalized.csv")
+    b = pd.read_csv(tmp_path / "par" / "normalized.csv")
+    pd.testing.assert_frame_equal(a, b)
+    assert seq.counters == par.counters
+    assert par.gauges["llm_workers"] == 4
+
+
+def test_batch_keeps_a_bounded_window_in_flight(tmp_path, monkeypatch):
+    cfg = SyntheticConfig(games_per_season=2, plays_per_game=60, pad_columns=0)
+    df = pd.read_csv(write_synthetic_season(tmp_path / "play_by_play_2025.csv.gz", 2025, cfg), low_memory=False)
+
+    # Each LLM call sees how far mapping has run ahead of the rows written out so far
+    mapped, lag, rows = [0], [], []
+    real_map, real_llm = batch_normalize.row_to_play_first_pass, batch_normalize.normalize_with_llm_v1
+
+    def counting_map(row):
+        mapped[0] += 1
+        return real_map(row)
+
+    def llm(play, client, metrics):
+        lag.append(mapped[0] - len(rows))
+        return real_llm(play, client, metrics=metrics)
+
+    monkeypatch.setattr(batch_normalize, "row_to_play_first_pass", counting_map)
+    monkeypatch.setattr(batch_normalize, "normalize_with_llm_v1", llm)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        batch_normalize._normalize_frame(
+            RunMetrics("window"), MockLLMClient(latency_s=0.001), df, rows, [], pool=pool, window=8
+        )
+    assert len(rows) == mapped[0] > 8
+    assert max(lag) <= 8
@@ -0,0 +1,102 @@
+import threading
+import time
+
+from playcall_intel.llm_client import MockLLMClient
+from playcall_intel.llm_normalize import normalize_with_llm_v1
+from playcall_intel.llm_scheduler import BATCH, INTERACTIVE, LLMScheduler
+from playcall_intel.metrics import RunMetrics
+from playcall_intel.schema import Play
+
+
+def _queue_behind(sched, blocker_released, jobs):
+    # Hold the only slot, queue jobs in order, then release and record grant order
+    order = []
+    holding = threading.Event()
+
+    def blocker():
+        with sched.slot(BATCH, tenant="blocker"):
+            holding.set()
+            blocker_released.wait()
+
+    def job(priority, tenant, label):
+        with sched.slot(priority, tenant=tenant):
+            order.append(label)
+
+    threads = [threading.Thread(target=blocker)]
+    threads[0].start()
+    holding.wait()
+    for i, (priority, tenant, label) in enumerate(jobs, start=1):
+        t = threading.Thread(target=job, args=(priority, tenant, label))
+        t.start()
+        threads.append(t)
+        while sched.depth() < i:
+            time.sleep(0.001)
+    blocker_released.set()
+    for t in threads:
+        t.join(timeout=5)
+    return order
+
+
+def test_interactive_jumps_the_batch_queue_and_tenants_take_turns():
+    sched = LLMScheduler(max_in_flight=1)
+    order = _queue_behind(
+        sched,
+        threading.Event(),
+        [
+            (BATCH, "run-a", "a1"),
+            (BATCH, "run-a", "a2"),
+            (BATCH, "run-a", "a3"),
+            (BATCH, "run-b", "b1"),
+            (INTERACTIVE, "app", "recap"),
+        ],
+    )
+    assert order == ["recap", "a1", "b1", "a2", "a3"]
+
+    stats = sched.stats()
+    assert stats[BATCH]["queued"] == 0 and stats[BATCH]["in_flight"] == 0
+    assert stats[INTERACTIVE]["wait_count"] == 1
+    assert stats[BATCH]["wait_count"] == 5  # blocker + four queued
+
+
+def test_batch_cap_leaves_a_slot_for_interactive():
+    sched = LLMScheduler(max_in_flight=2)
+    assert sched.caps[BATCH] == 1
+
+    with sched.slot(BATCH, tenant="run"):
+        entered = threading.Event()
+
+        def second_batch():
+            with sched.slot(BATCH, tenant="run"):
+                entered.set()
+
+        t = threading.Thread(target=second_batch)
+        t.start()
+        while sched.depth(BATCH) < 1:
+            time.sleep(0.001)
+        # Batch is at its cap, but an interactive call still gets straight in
+        with sched.slot(INTERACTIVE, tenant="app") as waited:
+            assert waited < 1.0
+        assert not entered.is_set()
+    t.join(timeout=5)
+    assert entered.is_set()
+
+
+def test_normalize_records_queue_wait():
+    play = Play(
+        offense_team="ARI",
+        defense_team="NO",
+        quarter=1,
+        down=1,
+        distance=10,
+        yardline_100=78,
+        play_type="run",
+        play_text="(14:56) 6-J.Conner right tackle to ARI 25 for 3 yards (92-D.Godchaux).",
+        yards_gained=3,
+        result="tackle",
+    )
+    sched = LLMScheduler(max_in_flight=1)
+    metrics = RunMetrics("batch_normalize")
+    normalize_with_llm_v1(play, MockLLMClient(fixed_play_type="run"), metrics=metrics, scheduler=sched)
+
+    assert metrics.summary()["histograms"]["llm_queue_wait_seconds"]["count"] == 1
+    assert sched.stats()[BATCH]["wait_count"] == 1
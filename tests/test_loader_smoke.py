@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+from playcall_intel import loader
+from playcall_intel.loader import (
+    INT_NA,
+    iter_pbp_rows_gz,
+    iter_typed_chunks_gz,
+    iter_typed_records_gz,
+    iter_typed_rows_gz,
+    typed_spec,
+)
+from playcall_intel.mapper import _to_int
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+SPEC = {
+    "game_id": "str",
+    "down": "int",
+    "yards_gained": "int",
+    "pass": "flag",
+    "wp": "float",
+    "not_in_file": "int",
+}
+
+
+def test_typed_rows_match_dict_rows(tmp_path, monkeypatch):
+    raw = write_synthetic_season(
+        tmp_path / "play_by_play_2025.csv.gz", 2025, SyntheticConfig(games_per_season=2, plays_per_game=30)
+    )
+    dict_rows = list(iter_pbp_rows_gz(raw))
+    typed = list(iter_typed_rows_gz(raw, SPEC))
+    assert len(typed) == len(dict_rows)
+
+    for d, t in zip(dict_rows, typed):
+        assert t[0] == d["game_id"]
+        assert t[1] == _to_int(d["down"])
+        assert t[2] == _to_int(d["yards_gained"])
+        assert t[3] == (_to_int(d["pass"]) == 1)
+        assert (math.isnan(t[4]) and d["wp"] in {"", "NA", "nan"}) or t[4] == float(d["wp"])
+        assert t[5] is None  # missing columns read as the kind's missing value
+
+    rec = next(iter_typed_records_gz(raw, SPEC))
+    assert (rec.game_id, rec.down) == typed[0][:2]
+    assert rec.pass_ == typed[0][3]  # keyword column → trailing underscore, not _3
+
+    chunks = list(iter_typed_chunks_gz(raw, SPEC, chunk_rows=25))
+    assert [len(c["down"]) for c in chunks] == [25, 25, 10]
+    downs = [v for c in chunks for v in c["down"]]
+    assert downs == [INT_NA if t[1] is None else t[1] for t in typed]
+    assert chunks[0]["down"].typecode == "q" and chunks[0]["wp"].typecode == "d"
+
+    # Consumer manifests double as type specs (numeric hints → float)
+    spec = typed_spec("search")
+    assert spec["game_id"] == "str" and spec["qtr"] == "float"
+
+    # A bad spec is rejected before the file is opened (no handle left for the GC to find)
+    opened = []
+    real_open = loader._open_text
+    monkeypatch.setattr(loader, "_open_text", lambda p: opened.append(p) or real_open(p))
+    with pytest.raises(ValueError, match="decimal"):
+        next(iter_typed_rows_gz(raw, {"down": "decimal"}))
+    assert opened == []
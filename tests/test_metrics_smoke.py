@@ -0,0 +1,60 @@
+from playcall_intel.llm_client import MockLLMClient
+from playcall_intel.llm_normalize import normalize_with_llm_v1
+from playcall_intel.metrics import Histogram, RunMetrics
+from playcall_intel.schema import Play
+
+
+def test_histogram_percentiles_use_observed_values():
+    h = Histogram()
+    for v in range(1, 101):
+        h.observe(v)
+
+    assert h.percentile(50) == 50
+    assert h.percentile(95) == 95
+    assert h.percentile(99) == 99
+
+
+def test_normalize_records_stages_and_repair_rate():
+    play = Play(
+        offense_team="ARI",
+        defense_team="NO",
+        quarter=1,
+        down=3,
+        distance=7,
+        yardline_100=60,
+        play_type="pass",
+        play_text="K.Murray sacked at ARI 33 for -7 yards.",
+        yards_gained=-7,
+        result="sack",
+    )
+
+    # play_type='sack' triggers the repair path
+    client = MockLLMClient(fixed_play_type="sack", fixed_result="sack", fixed_yards_gained=-7)
+    metrics = RunMetrics("test")
+    normalize_with_llm_v1(play, client, metrics=metrics)
+
+    assert {"prompt_build", "llm", "validation"} <= set(metrics.stage_seconds)
+    assert metrics.rate("llm_repaired", "llm_outputs") == 1.0
+    assert metrics.summary()["histograms"]["llm_latency_seconds"]["count"] == 1
+
+    prom = metrics.to_prometheus()
+    assert 'playcall_llm_latency_seconds{run="test",quantile="0.99"}' in prom
+
+
+def test_profiler_attributes_nested_stages(tmp_path):
+    from playcall_intel.profiling import maybe_profile
+
+    metrics = RunMetrics("test")
+    with maybe_profile(True) as profiler:
+        metrics.profiler = profiler
+        with metrics.stage("run"):
+            with metrics.stage("map"):
+                sum(i * i for i in range(1000))
+            [str(i) for i in range(1000)]
+
+    out = profiler.write(tmp_path / "profile")
+    summary = profiler.summary()
+
+    assert set(summary) == {"run", "map"}
+    assert (out / "map.pstats").exists()
+    assert (out / "profile_summary.txt").exists()
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from playcall_intel.players import format_player_stats, load_player_stats, player_stats_from_df
+
+
+def test_player_table_matches_raw_plays(season):
+    season.write(games=3, plays=80)
+    df = pd.read_csv(season.raw, low_memory=False)
+    live = df[df["no_play"].fillna(0) == 0]
+
+    stats = load_player_stats(season.raw, store_dir=season.store.root)
+    t = stats.table
+    assert t["rush_att"].sum() == live["rusher_player_id"].notna().sum()
+    assert t["targets"].sum() == live["receiver_player_id"].notna().sum()
+    assert t["pass_cmp"].sum() == live["complete_pass"].fillna(0).sum()
+    assert t["sacks"].sum() == t["sacked"].sum() == live["sack"].fillna(0).sum()
+    assert t["def_int"].sum() == t["pass_int"].sum()
+    assert t["rec_yds"].sum() == t["pass_yds"].sum()
+
+    # Per-game slices line up with aggregating that game alone; the cached table round-trips
+    gid = stats.game_ids()[0]
+    one = player_stats_from_df(df[df["game_id"] == gid])
+    pd.testing.assert_frame_equal(stats.game(gid).reset_index(drop=True), one, check_dtype=False)
+    cached = load_player_stats(season.raw, store_dir=season.store.root)
+    pd.testing.assert_frame_equal(cached.game(gid), stats.game(gid), check_dtype=False)
+
+    g = df[df["game_id"] == gid]
+    md = format_player_stats(one, [g["away_team"].iloc[0], g["home_team"].iloc[0]])
+    assert "### Passing" in md and "### Rushing" in md
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from playcall_intel.game_report import render_report_md
+from playcall_intel.report_jobs import ReportJobs
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+def test_stats_first_recap_in_background_and_prefetch(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    raw = write_synthetic_season(
+        tmp_path / "play_by_play_2025.csv.gz", 2025, SyntheticConfig(games_per_season=3, plays_per_game=40, pad_columns=0)
+    )
+    game_ids = sorted(pd.read_csv(raw, usecols=["game_id"])["game_id"].unique())
+    jobs = ReportJobs(raw_path=raw, out_dir=tmp_path / "reports")
+    try:
+        gid, others = game_ids[0], game_ids[1:]
+        parts = jobs.stats(gid)
+        preview = render_report_md(parts, "_pending_")
+        assert "## Box score" in preview and "_pending_" in preview and not jobs.is_current(gid)
+
+        job = jobs.finish(gid, parts)
+        assert jobs.finish(gid) is job  # one job per game
+        assert sorted(jobs.prefetch(others)) == others
+        assert jobs.prefetch(others) == []  # already queued
+
+        path = job.result(timeout=60)
+        final = path.read_text(encoding="utf-8")
+        assert final.split("## Box score")[1] == preview.split("## Box score")[1]
+        for other in others:
+            jobs.job(other).result(timeout=60)
+            assert jobs.is_current(other)
+        assert jobs.pending() == 0 and jobs.finish(gid) is job
+    finally:
+        jobs.shutdown(wait=True)
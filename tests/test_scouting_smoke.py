@@ -0,0 +1,35 @@
+import pandas as pd
+
+from playcall_intel.highlights import load_highlight_index
+from playcall_intel.scouting import (
+    format_scouting_report,
+    game_rollups_from_df,
+    load_game_rollups,
+    scouting_report,
+)
+
+
+def test_scouting_report_merges_cached_rollups(season):
+    season.write(games=48, plays=40)
+    raw = season.raw
+    df = pd.read_csv(raw, low_memory=False)
+
+    rollups = load_game_rollups(raw, store_dir=season.store.root)
+    team = str(df["home_team"].iloc[0])
+    report = scouting_report(team, rollups, last_n=2, highlights=load_highlight_index(raw))
+    assert len(report.game_ids) == 2 and report.game_ids == sorted(report.game_ids)
+
+    # Merged counters match a direct scan of the same games
+    games = df[df["game_id"].isin(report.game_ids)]
+    live = games[(games["posteam"] == team) & ((games["pass"] == 1) | (games["rush"] == 1)) & (games["no_play"] != 1)]
+    assert report.summary["plays_per_game"] == round(len(live) / 2, 1)
+    assert report.tendencies["plays"].sum() == live["down"].notna().sum()
+    assert report.by_game["plays"].sum() == len(live)
+    pd.testing.assert_frame_equal(
+        game_rollups_from_df(games).reset_index(drop=True),
+        load_game_rollups(raw, store_dir=season.store.root).pipe(lambda r: r[r["game_id"].isin(report.game_ids)]).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    md = format_scouting_report(report)
+    assert "## Tendencies by down & distance" in md and "## Top WPA plays" in md
@@ -0,0 +1,38 @@
+import pandas as pd
+
+from playcall_intel.ingest import PlayStore, ingest
+from playcall_intel.search_index import SearchIndex, load_search_index, refresh_search_index, tokenize
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+def test_tokenize_normalizes_players_and_yardage():
+    terms = tokenize("(14:56) 6-K.Murray pass short right to 4-R.Moore to ARI 35 for 12 yards (32-J.Smith).")
+    assert {"player:k.murray", "murray", "player:r.moore", "yds:12", "pass"} <= set(terms)
+    assert "56" not in terms and "35" not in terms
+    assert "yds:0" in tokenize("1-J.Allen up the middle for no gain") and "punt" in tokenize("fake punts")
+
+
+def test_search_ranks_and_updates_incrementally(tmp_path):
+    raw = tmp_path / "play_by_play_2025.csv.gz"
+    store = PlayStore(tmp_path / "store")
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=3, plays_per_game=60, pad_columns=0))
+    ingest(raw, store)
+    assert refresh_search_index(raw, store) == 3
+
+    df = pd.read_csv(raw, low_memory=False)
+    index = load_search_index(raw)
+    hits = index.search("intercepted", limit=500)
+    assert len(hits) == int(df["desc"].str.contains("INTERCEPTED").sum()) > 0
+    first = df[df["game_id"] == hits[0].game_id].iloc[0]
+    assert hits[0].match == f"{first['away_team']} @ {first['home_team']}"
+
+    big = index.search("pass 20+ yards", limit=1000)
+    assert big and all(int(h.desc.rsplit(" for ", 1)[1].split()[0]) >= 20 for h in big)
+
+    # A new game arrives: only it is tokenized, and results equal a full rebuild
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=4, plays_per_game=60, pad_columns=0))
+    ingest(raw, store)
+    assert refresh_search_index(raw, store) == 1
+    patched = load_search_index(raw)
+    full = SearchIndex.from_frame(pd.read_csv(raw, low_memory=False))
+    assert [h.desc for h in patched.search("punt", limit=50)] == [h.desc for h in full.search("punt", limit=50)]
@@ -0,0 +1,32 @@
+import gzip
+import io
+
+import pandas as pd
+
+from playcall_intel.game_report import load_game_df
+from playcall_intel.loader import iter_game_rows_gz
+from playcall_intel.seek_index import SeekIndex, blocked_path, build_seek_index
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+def test_seek_index_matches_full_read(tmp_path):
+    raw = tmp_path / "play_by_play_2025.csv.gz"
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=4, plays_per_game=25, pad_columns=3))
+    assert SeekIndex.open(raw) is None
+
+    index = build_seek_index(raw)
+    assert SeekIndex.open(raw) is not None
+    # The blocked copy is still one valid .csv.gz with identical content
+    assert gzip.decompress(blocked_path(raw).read_bytes()) == gzip.decompress(raw.read_bytes())
+
+    full = pd.read_csv(raw, dtype=str)
+    gid = index.game_ids()[2]
+    expected = full[full["game_id"] == gid].reset_index(drop=True)
+    got = pd.read_csv(io.BytesIO(index.game_bytes(gid)), dtype=str)
+    pd.testing.assert_frame_equal(got, expected)
+    assert [r["play_id"] for r in iter_game_rows_gz(raw, gid)] == [str(v) for v in expected["play_id"]]
+    assert len(load_game_df(gid, raw_path=raw)) == 25
+
+    # Rewriting the raw file makes the index stale
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=5, plays_per_game=25, pad_columns=3))
+    assert SeekIndex.open(raw) is None
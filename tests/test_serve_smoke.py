@@ -0,0 +1,54 @@
+import threading
+import urllib.error
+
+import pytest
+
+from playcall_intel.serve import ServiceClient, make_server
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+def test_service_answers_listing_box_score_and_report(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    cfg = SyntheticConfig(games_per_season=3, plays_per_game=40, pad_columns=0)
+    raw = write_synthetic_season(tmp_path / "play_by_play_2025.csv.gz", 2025, cfg)
+
+    server = make_server(raw_path=raw, port=0, out_dir=tmp_path / "reports")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = ServiceClient(f"http://127.0.0.1:{server.server_address[1]}")
+        assert client.is_up()
+
+        games = client.games()
+        assert len(games) == 3
+        game_id = games[0]["game_id"]
+
+        bs = client.box_score(game_id)
+        assert bs["game_id"] == game_id
+
+        season = client.team_season()
+        assert sum(r["games"] for r in season) == 6
+        home = games[0]["home_team"]
+        assert [r["week"] for r in client.team_weeks(team=home)] == [1]
+        assert {"interactive", "batch", "limit"} <= set(client.llm_queue())
+
+        with pytest.raises(urllib.error.HTTPError) as missing:
+            client.box_score("2025_99_XXX_YYY")
+        assert missing.value.code == 404
+
+        # A KeyError inside the computation is a server error, not an unknown game
+        def broken(gid):
+            raise KeyError("total_home_score")
+
+        with monkeypatch.context() as m:
+            m.setattr(server.service, "box_score", broken)
+            with pytest.raises(urllib.error.HTTPError) as failed:
+                client.box_score(game_id)
+        assert failed.value.code == 500
+
+        first = client.report(game_id)
+        assert first["markdown"].startswith("# Game Report")
+        assert client.report(game_id)["cached"] is True
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,56 @@
+import mmap
+import os
+import pickle
+
+import numpy as np
+
+from playcall_intel.columns import read_pbp
+from playcall_intel.shared_frame import game_slices, publish_frame
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+
+
+def test_published_frame_is_memory_mapped_and_versioned(tmp_path):
+    cfg = SyntheticConfig(games_per_season=3, plays_per_game=40, pad_columns=0)
+    raw = write_synthetic_season(tmp_path / "play_by_play_2025.csv.gz", 2025, cfg)
+
+    handle = publish_frame(raw, "serve")
+    shared = handle.open()
+    assert handle.open() is shared  # one opened frame per process
+    assert pickle.loads(pickle.dumps(handle)) == handle
+
+    expected = read_pbp(raw, "serve").sort_values(["game_id", "play_id"], kind="stable").reset_index(drop=True)
+    df = shared.frame()
+    assert list(df.columns) == list(expected.columns) == shared.columns
+    assert df["game_id"].astype(str).tolist() == expected["game_id"].astype(str).tolist()
+    assert np.allclose(df["yards_gained"].to_numpy(dtype=float), expected["yards_gained"].to_numpy(dtype=float), equal_nan=True)
+
+    # Same dtypes and values as the private read_pbp fallback (text / ids are not turned into categories)
+    assert df.dtypes.astype(str).to_dict() == expected.dtypes.astype(str).to_dict()
+    for col in ["posteam", "desc", "passer_player_name"]:
+        assert df[col].equals(expected[col])
+
+    # A game is a slice of the season, decoded for its rows only
+    assert shared.games == game_slices(expected)
+    s, e = shared.games[sorted(shared.games)[1]]
+    g = shared.slice(s, e)
+    assert g.index.tolist() == list(range(s, e))
+    assert g.equals(expected.iloc[s:e]) and g.dtypes.equals(expected.dtypes)
+
+    # Every column, text included, is read-only views over the mapped files, not private copies
+    def mapped(values):
+        base = values
+        while getattr(base, "base", None) is not None:
+            base = base.base
+        return isinstance(base, mmap.mmap) and not values.flags.writeable
+
+    for col in ["yards_gained", "posteam", "desc", "game_id"]:
+        assert shared.buffers(col) and all(mapped(b) for b in shared.buffers(col))
+    assert mapped(g["yards_gained"].to_numpy()) and mapped(g["posteam"].array.codes)
+
+    # A new raw file version gets its own directory; the old one is pruned
+    st = raw.stat()
+    os.utime(raw, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert not handle.is_current()
+    newer = publish_frame(raw, "serve")
+    assert newer.version != handle.version and newer.is_current()
+    assert not handle.path.exists()
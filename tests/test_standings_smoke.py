@@ -0,0 +1,32 @@
+import pandas as pd
+
+from playcall_intel.game_report import compute_box_score
+from playcall_intel.standings import TEAM_GAMES_TABLE, load_team_table, refresh_team_tables, table_path
+
+
+def test_team_tables_match_box_scores_and_update_incrementally(season, tmp_path):
+    season.write(games=32)
+    assert refresh_team_tables(season.raw, season.store) == 32
+
+    df = pd.read_csv(season.raw, low_memory=False)
+    team_games = load_team_table(season.raw, "team_games", store_dir=season.store.root)
+    gid = team_games["game_id"].iloc[0]
+    bs = compute_box_score(gid, g=df[df["game_id"] == gid])
+    home = team_games[(team_games["game_id"] == gid) & (team_games["home"] == 1)].iloc[0]
+    assert (home["points_for"], home["off_plays"], home["yards"], home["turnovers"], home["sacks"]) == (
+        bs.home_score, bs.home_off_plays, bs.home_total_yards, bs.home_turnovers, bs.home_sacks,
+    )
+
+    table = load_team_table(season.raw, "team_season", store_dir=season.store.root)
+    assert table["games"].sum() == 64 and table["wins"].sum() == table["losses"].sum()
+    assert table["turnover_margin"].sum() == 0
+
+    # Next week arrives: only the new games are aggregated, and the result equals a full rebuild
+    added = season.write(games=48).added
+    assert refresh_team_tables(season.raw, season.store) == 16
+    assert season.store.dirty(TEAM_GAMES_TABLE.name) == set() and set(added) <= season.store.dirty("box_scores")
+    assert refresh_team_tables(season.raw, season.store) == 0
+    for name in ["team_games", "team_week", "team_season"]:
+        patched = TEAM_GAMES_TABLE.read(table_path(season.raw, name, season.store.root))
+        rebuilt = load_team_table(season.raw, name, store_dir=tmp_path / "full")
+        pd.testing.assert_frame_equal(patched, rebuilt, check_dtype=False)
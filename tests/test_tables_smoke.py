@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from playcall_intel.drives import DRIVE_TABLE
+from playcall_intel.players import PLAYER_TABLE
+from playcall_intel.scouting import ROLLUP_TABLE
+
+
+@pytest.mark.parametrize("table", [DRIVE_TABLE, PLAYER_TABLE, ROLLUP_TABLE], ids=lambda t: t.name)
+def test_incremental_refresh_matches_full_rebuild(season, table, tmp_path):
+    season.write(games=3, plays=60)
+    assert table.refresh(season.raw, season.store) == 3  # no table yet → full build
+    path = table.path(season.raw, season.store.root)
+    assert path.exists() and season.store.dirty(table.name) == set()
+
+    def assert_matches_full_build() -> pd.DataFrame:
+        table.load(season.raw, store_dir=tmp_path / "full")
+        full = table.read(table.path(season.raw, tmp_path / "full"))
+        pd.testing.assert_frame_equal(table.read(path), full)
+        return full
+
+    # Stat corrections + a new game → exactly those games are re-derived from the store
+    season.write(games=4, plays=61)
+    assert table.refresh(season.raw, season.store) == 4
+    full = assert_matches_full_build()
+    gid = sorted(season.store.game_ids())[-1]
+    pd.testing.assert_frame_equal(
+        table.cached_game(gid, season.raw, season.store.root),
+        full[full["game_id"] == gid].reset_index(drop=True),
+    )
+
+    # A game dropped from the raw file drops out of the table; an untouched file is a no-op
+    season.write(games=3, plays=61)
+    assert table.refresh(season.raw, season.store) == 1
+    assert_matches_full_build()
+    assert table.refresh(season.raw, season.store) == 0
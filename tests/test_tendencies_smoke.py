@@ -0,0 +1,56 @@
+import pandas as pd
+
+from playcall_intel.tendencies import cube_from_plays, load_tendency_cube
+
+
+def _plays(game_id, n, posteam="ARI"):
+    return pd.DataFrame({
+        "game_id": [game_id] * n,
+        "posteam": [posteam] * n,
+        "quarter": [1 + i % 4 for i in range(n)],
+        "down": [3] * n,
+        "distance": [1 + i % 12 for i in range(n)],
+        "yardline_100": [35] * n,
+        "play_type": ["run" if i % 3 == 0 else "pass" for i in range(n)],
+        "result": ["gain"] * n,
+        "yards_gained": [4] * n,
+    })
+
+
+def test_cube_query_and_incremental_update(tmp_path):
+    norm = tmp_path / "normalized.csv"
+    week1 = _plays("2025_01_ARI_NO", 24)
+    week1.to_csv(norm, index=False)
+
+    cube = load_tendency_cube(norm)
+    short = cube.query(team="ARI", down=3, distance=2, yardline_100=35)
+    raw = week1[(week1["distance"] <= 3)]
+    assert short["plays"].sum() == len(raw)
+    assert dict(zip(short["play_type"], short["plays"])) == raw["play_type"].value_counts().to_dict()
+    assert cube.query(team="NO").empty
+
+    # New game arrives: only its rows are aggregated, result equals a full rebuild
+    both = pd.concat([week1, _plays("2025_02_ARI_SEA", 12)], ignore_index=True)
+    both.to_csv(norm, index=False)
+    updated = load_tendency_cube(norm)
+    assert set(updated.games) == {"2025_01_ARI_NO", "2025_02_ARI_SEA"}
+    pd.testing.assert_frame_equal(
+        updated.cube.reset_index(drop=True),
+        cube_from_plays(both).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_cube_from_baseline_schema(tmp_path):
+    # normalized_sample.csv as the pre-series run_batch wrote it: no game_id, no quarter
+    norm = tmp_path / "normalized_sample.csv"
+    _plays("unused", 18).drop(columns=["game_id", "quarter"]).assign(defteam="NO", play_text="x").to_csv(norm, index=False)
+
+    for _ in range(2):  # fresh build, then the cached cube
+        cube = load_tendency_cube(norm)
+        assert cube.games == {}
+        assert cube.query(team="ARI", down=3)["plays"].sum() == 18
+        assert set(cube.cube["quarter"]) == {0}
+
+    norm.touch()  # stale cache with no game metadata → full rebuild, not a merge
+    assert load_tendency_cube(norm).query(team="ARI")["plays"].sum() == 18
@@ -0,0 +1,31 @@
+from playcall_intel.ingest import PlayStore
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+from playcall_intel.watch import refresh
+
+
+def test_refresh_rebuilds_only_changed_reports(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    raw = tmp_path / "play_by_play_2025.csv.gz"
+    out_dir = tmp_path / "reports"
+    store = PlayStore(tmp_path / "store")
+
+    # Reports must come from the given store, never from a full parse of the raw file
+    def no_full_parse(*args, **kwargs):
+        raise AssertionError("report parsed the raw season")
+
+    monkeypatch.setattr("playcall_intel.game_report.read_pbp", no_full_parse)
+
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=2, plays_per_game=30, pad_columns=0))
+    first = refresh(raw, out_dir=out_dir, workers=2, include_new=True, store=store)
+    assert len(first.rebuilt) == 2 and not first.failed
+
+    # Next week: the same two games plus a new one → nothing to rebuild, one index entry
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=3, plays_per_game=30, pad_columns=0))
+    second = refresh(raw, out_dir=out_dir, workers=2, store=store)
+    assert second.rebuilt == {} and second.index_updated == 1
+
+    # Stat corrections touch the existing games → exactly their reports are rebuilt
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=3, plays_per_game=31, pad_columns=0))
+    third = refresh(raw, out_dir=out_dir, workers=2, store=store)
+    assert set(third.rebuilt) == set(first.rebuilt)
+    assert store.dirty("reports") == set()
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from playcall_intel.synthetic import SyntheticConfig, write_synthetic_season
+from playcall_intel.wp_timeline import lttb, load_wp_timelines, wp_timeline_path
+
+
+def test_wp_timelines_built_once_and_downsampled(tmp_path):
+    raw = tmp_path / "play_by_play_2025.csv.gz"
+    write_synthetic_season(raw, 2025, SyntheticConfig(games_per_season=3, plays_per_game=150, pad_columns=0))
+    df = pd.read_csv(raw, low_memory=False)
+
+    timelines = load_wp_timelines(raw)
+    assert wp_timeline_path(raw).exists()
+    gid = str(df["game_id"].iloc[0])
+    g = df[df["game_id"] == gid].sort_values("play_id")
+
+    full = timelines.get(gid, downsampled=False)
+    np.testing.assert_allclose(full.home_wp, g["home_wp"].to_numpy(), atol=1e-6)
+    assert np.all(np.diff(full.elapsed_s) >= 0)
+
+    small = timelines.get(gid)
+    assert len(small.home_wp) == 100
+    assert small.elapsed_s[0] == full.elapsed_s[0] and small.elapsed_s[-1] == full.elapsed_s[-1]
+
+    # Cached copy round-trips; unknown games are None
+    again = load_wp_timelines(raw)
+    np.testing.assert_array_equal(again.get(gid).home_wp, small.home_wp)
+    assert again.get("1999_01_AAA_BBB") is None
+
+
+def test_lttb_keeps_extremes():
+    x = np.arange(500, dtype=float)
+    y = np.zeros(500)
+    y[250] = 1.0
+    keep = lttb(x, y, 20)
+    assert len(keep) == 20 and 250 in keep